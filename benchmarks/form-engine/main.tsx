@@ -0,0 +1,238 @@
+// Benchmark: Keystroke-to-paint latency of the invoice form engine
+// Usage: npm run dev, then open http://localhost:5173/benchmarks/form-engine/
+//   ?sizes=50,500,2000   field counts (default)
+//   &keystrokes=60       samples per size
+//   &mode=legacy         react-hook-form + zodResolver (mode "onChange") grid without
+//                        virtualization - how InvoiceForm rendered before the engine
+// Each sample types into one amount field (which feeds a computed total) and
+// measures from the input event to the frame after the next paint.
+// Results: printed on the page, console.table, window.__formEngineBenchmark.
+
+import { useMemo } from "react";
+import { createRoot } from "react-dom/client";
+import { zodResolver } from "@hookform/resolvers/zod";
+import { useForm, type Resolver } from "react-hook-form";
+import { z } from "zod";
+
+import "@/index.css";
+import { Form } from "@/components/base/form";
+import { FormEngine } from "@/components/features/invoice-form/components/form-engine";
+import { UnifiedFormField } from "@/components/features/invoice-form/components/unified-form-field";
+import {
+  compileFormDefinition,
+  type CompiledForm,
+  type FieldDefinition,
+  type FormDefinition,
+  type FormValues,
+} from "@/components/features/invoice-form/lib/engine";
+
+type Mode = "engine" | "legacy";
+
+interface BenchmarkResult {
+  mode: Mode;
+  fields: number;
+  compileMs: number;
+  mountMs: number;
+  p50: number;
+  p95: number;
+  max: number;
+}
+
+declare global {
+  interface Window {
+    __formEngineBenchmark?: BenchmarkResult[];
+  }
+}
+
+const params = new URLSearchParams(window.location.search);
+const SIZES = (params.get("sizes") ?? "50,500,2000").split(",").map(Number);
+const KEYSTROKES = Number(params.get("keystrokes") ?? 60);
+const MODE: Mode = params.get("mode") === "legacy" ? "legacy" : "engine";
+const VIEWPORT_HEIGHT = 800;
+const TARGET_FIELD = "amount_0";
+
+const ROW_STYLE = {
+  gridTemplateColumns: "repeat(auto-fit, minmax(min(220px, 100%), 1fr))",
+};
+
+// Two fields per row: a required text and an amount; every 5th row totals the four amounts above
+function buildDefinition(fieldCount: number): FormDefinition {
+  const fields: FieldDefinition[] = [];
+
+  for (let y = 0; fields.length < fieldCount; y++) {
+    fields.push({ name: `text_${y}`, label: `Position ${y + 1}`, datatype: "text", controlType: "input", required: true, x: 0, y });
+    if (fields.length === fieldCount) break;
+
+    fields.push(
+      y % 5 === 4
+        ? {
+            name: `total_${y}`,
+            label: `Zwischensumme ${y + 1}`,
+            datatype: "number",
+            controlType: "input",
+            format: "currency",
+            disabled: true,
+            compute: { op: "sum", fields: [1, 2, 3, 4].map((distance) => `amount_${y - distance}`) },
+            x: 1,
+            y,
+          }
+        : {
+            name: `amount_${y}`,
+            label: `Betrag ${y + 1}`,
+            datatype: "number",
+            controlType: "input",
+            format: "currency",
+            min: 0,
+            required: true,
+            x: 1,
+            y,
+          }
+    );
+  }
+
+  return { id: `benchmark-${fieldCount}`, title: `Benchmark (${fieldCount} Felder)`, fields };
+}
+
+function EngineHarness({ form }: { form: CompiledForm }) {
+  return (
+    <div style={{ height: VIEWPORT_HEIGHT }}>
+      <FormEngine form={form} onSubmit={() => undefined} />
+    </div>
+  );
+}
+
+function LegacyHarness({ form }: { form: CompiledForm }) {
+  const schema = useMemo(
+    () => z.object(Object.fromEntries(form.fields.map((field) => [field.name, field.schema]))),
+    [form]
+  );
+  const methods = useForm<FormValues>({
+    resolver: zodResolver(schema) as unknown as Resolver<FormValues>,
+    mode: "onChange",
+    defaultValues: form.defaultValues,
+  });
+
+  return (
+    <div style={{ height: VIEWPORT_HEIGHT, overflow: "auto" }}>
+      <Form {...methods}>
+        <form className="space-y-6 p-6">
+          {form.rows.map((row) => (
+            <div key={row.key} className="grid gap-4" style={ROW_STYLE}>
+              {row.cells.map((cell, cellIndex) => (
+                <div key={cellIndex} data-field={cell.field?.name}>
+                  {cell.field && (
+                    <UnifiedFormField
+                      control={methods.control}
+                      name={cell.field.name}
+                      label={cell.field.definition.label}
+                      datatype={cell.field.definition.datatype}
+                      controlType={cell.field.definition.controlType}
+                      format={cell.field.definition.format}
+                      min={cell.field.definition.min}
+                      max={cell.field.definition.max}
+                      required={cell.field.definition.required}
+                      disabled={cell.field.definition.disabled}
+                    />
+                  )}
+                </div>
+              ))}
+            </div>
+          ))}
+        </form>
+      </Form>
+    </div>
+  );
+}
+
+// Resolves in the task after the next frame has been painted
+function nextPaint(): Promise<void> {
+  return new Promise((resolve) =>
+    requestAnimationFrame(() => {
+      const channel = new MessageChannel();
+      channel.port1.onmessage = () => resolve();
+      channel.port2.postMessage(null);
+    })
+  );
+}
+
+async function waitFor<T>(find: () => T | null): Promise<T> {
+  for (;;) {
+    const found = find();
+    if (found) return found;
+    await nextPaint();
+  }
+}
+
+// React listens to native input events; set the value through the prototype setter first
+function typeInto(input: HTMLInputElement, value: string) {
+  Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value")!.set!.call(input, value);
+  input.dispatchEvent(new Event("input", { bubbles: true }));
+}
+
+function percentile(sorted: number[], fraction: number): number {
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * fraction))];
+}
+
+async function runSize(stage: HTMLElement, fieldCount: number): Promise<BenchmarkResult> {
+  const compileStart = performance.now();
+  const form = compileFormDefinition(buildDefinition(fieldCount));
+  const compileMs = performance.now() - compileStart;
+
+  const root = createRoot(stage);
+  const mountStart = performance.now();
+  root.render(MODE === "engine" ? <EngineHarness form={form} /> : <LegacyHarness form={form} />);
+  const input = await waitFor(() => stage.querySelector<HTMLInputElement>(`[data-field="${TARGET_FIELD}"] input`));
+  await nextPaint();
+  const mountMs = performance.now() - mountStart;
+
+  // Let the initial idle validation settle so it is not billed to the first keystrokes
+  await new Promise((resolve) => setTimeout(resolve, 500));
+  input.focus();
+
+  const samples: number[] = [];
+  for (let keystroke = 1; keystroke <= KEYSTROKES; keystroke++) {
+    const started = performance.now();
+    typeInto(input, String(keystroke * 7));
+    await nextPaint();
+    samples.push(performance.now() - started);
+  }
+
+  root.unmount();
+  samples.sort((a, b) => a - b);
+
+  const round = (value: number) => Math.round(value * 10) / 10;
+  return {
+    mode: MODE,
+    fields: fieldCount,
+    compileMs: round(compileMs),
+    mountMs: round(mountMs),
+    p50: round(percentile(samples, 0.5)),
+    p95: round(percentile(samples, 0.95)),
+    max: round(samples[samples.length - 1]),
+  };
+}
+
+async function main() {
+  const output = document.getElementById("results")!;
+  const stage = document.getElementById("stage")!;
+  const results: BenchmarkResult[] = [];
+
+  for (const size of SIZES) {
+    output.textContent = `Running ${MODE} with ${size} fields…`;
+    results.push(await runSize(stage, size));
+  }
+
+  window.__formEngineBenchmark = results;
+  console.table(results);
+  output.textContent = [
+    `mode=${MODE} keystrokes=${KEYSTROKES} (keystroke-to-paint in ms)`,
+    "fields   compile   mount     p50     p95     max",
+    ...results.map((result) =>
+      [result.fields, result.compileMs, result.mountMs, result.p50, result.p95, result.max]
+        .map((value, index) => String(value).padStart(index === 0 ? 6 : 8))
+        .join(" ")
+    ),
+  ].join("\n");
+}
+
+void main();
@@ -0,0 +1,216 @@
+// Benchmark: Keystroke-to-result latency of ComboboxControl on large option lists
+// Usage: npm run dev, then open http://localhost:5173/benchmarks/option-search/
+//   ?sizes=1000,20000,100000   option counts (default)
+//   &mode=legacy               cmdk Command with every option mounted - how
+//                              ComboboxControl rendered before option sources
+// Each query is typed character by character; a sample runs from the input
+// event to the frame after the matching results were painted.
+// Results: printed on the page, console.table, window.__optionSearchBenchmark.
+
+import { useState } from "react";
+import { createRoot } from "react-dom/client";
+
+import "@/index.css";
+import {
+  Command,
+  CommandEmpty,
+  CommandGroup,
+  CommandInput,
+  CommandItem,
+  CommandList,
+} from "@/components/base/command";
+import { ComboboxControl } from "@/components/features/invoice-form/components/controls";
+import {
+  resolveOptionSource,
+  type OptionItem,
+  type OptionSource,
+} from "@/components/features/invoice-form/lib/options";
+
+type Mode = "source" | "legacy";
+
+interface BenchmarkResult {
+  mode: Mode;
+  options: number;
+  openMs: number;
+  p50: number;
+  p95: number;
+  max: number;
+}
+
+declare global {
+  interface Window {
+    __optionSearchBenchmark?: BenchmarkResult[];
+  }
+}
+
+const params = new URLSearchParams(window.location.search);
+const SIZES = (params.get("sizes") ?? "1000,20000,100000").split(",").map(Number);
+const MODE: Mode = params.get("mode") === "legacy" ? "legacy" : "source";
+const QUERIES = ["müller berlin", "4711", "stahl nord", "kg", "kostenstelle 12"];
+
+const WORDS = [
+  "Müller", "Schmidt", "Bau", "GmbH", "KG", "Logistik", "Berlin", "München", "Hamburg", "Kostenstelle",
+  "Vertrieb", "Einkauf", "Service", "Technik", "Holz", "Stahl", "Elektro", "Nord", "Süd", "West",
+];
+
+// Master-data shaped labels: number plus three words, deterministic across runs
+function buildOptions(count: number): OptionItem[] {
+  let seed = 1;
+  const pick = () => WORDS[(seed = (seed * 16807) % 2147483647) % WORDS.length];
+
+  return Array.from({ length: count }, (_, index) => {
+    const value = String(index).padStart(6, "0");
+    return { value, label: `${value} ${pick()} ${pick()} ${pick()}` };
+  });
+}
+
+// Resolves once a search for `text` has finished
+function timedSource(source: OptionSource) {
+  const waiting = new Map<string, () => void>();
+
+  const timed: OptionSource = {
+    ...source,
+    search: (text, signal) =>
+      source.search(text, signal).then((results) => {
+        waiting.get(text)?.();
+        waiting.delete(text);
+        return results;
+      }),
+  };
+  const searched = (text: string) => new Promise<void>((resolve) => waiting.set(text, resolve));
+
+  return { timed, searched };
+}
+
+function LegacyHarness({ options }: { options: OptionItem[] }) {
+  const [value, setValue] = useState("");
+
+  return (
+    <Command>
+      <CommandInput placeholder="Suchen..." />
+      <CommandList>
+        <CommandEmpty>Keine Ergebnisse.</CommandEmpty>
+        <CommandGroup>
+          {options.map((option) => (
+            <CommandItem key={option.value} value={option.label} onSelect={() => setValue(option.value)}>
+              {option.value === value ? "✓ " : ""}
+              {option.label}
+            </CommandItem>
+          ))}
+        </CommandGroup>
+      </CommandList>
+    </Command>
+  );
+}
+
+// Resolves in the task after the next frame has been painted
+function nextPaint(): Promise<void> {
+  return new Promise((resolve) =>
+    requestAnimationFrame(() => {
+      const channel = new MessageChannel();
+      channel.port1.onmessage = () => resolve();
+      channel.port2.postMessage(null);
+    })
+  );
+}
+
+async function waitFor<T>(find: () => T | null): Promise<T> {
+  for (;;) {
+    const found = find();
+    if (found) return found;
+    await nextPaint();
+  }
+}
+
+// React listens to native input events; set the value through the prototype setter first
+function typeInto(input: HTMLInputElement, value: string) {
+  Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value")!.set!.call(input, value);
+  input.dispatchEvent(new Event("input", { bubbles: true }));
+}
+
+function percentile(sorted: number[], fraction: number): number {
+  return sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * fraction))];
+}
+
+async function runSize(stage: HTMLElement, count: number): Promise<BenchmarkResult> {
+  const options = buildOptions(count);
+  const root = createRoot(stage);
+  let searched = (_text: string) => Promise.resolve();
+  let dispose: (() => void) | undefined;
+
+  const openStart = performance.now();
+  let input: HTMLInputElement;
+  if (MODE === "legacy") {
+    root.render(<LegacyHarness options={options} />);
+    input = await waitFor(() => stage.querySelector<HTMLInputElement>("[cmdk-input]"));
+  } else {
+    const source = timedSource(resolveOptionSource(options));
+    searched = source.searched;
+    dispose = source.timed.dispose;
+    root.render(<ComboboxControl value="" onChange={() => undefined} options={source.timed} />);
+    (await waitFor(() => stage.querySelector<HTMLButtonElement>("button[role=combobox]"))).click();
+    input = await waitFor(() => document.querySelector<HTMLInputElement>("input[role=combobox]"));
+  }
+  await nextPaint();
+  const openMs = performance.now() - openStart;
+
+  // Let the worker finish the index so the build is not billed to the first keystrokes
+  if (MODE === "source") {
+    const warmup = searched("warmup");
+    typeInto(input, "warmup");
+    await warmup;
+  }
+
+  const samples: number[] = [];
+  for (const query of QUERIES) {
+    for (let length = 1; length <= query.length; length++) {
+      const text = query.slice(0, length);
+      const done = searched(text);
+      const started = performance.now();
+      typeInto(input, text);
+      await done;
+      await nextPaint();
+      samples.push(performance.now() - started);
+    }
+  }
+
+  root.unmount();
+  // Fresh option arrays per size: free the previous index before the next build
+  dispose?.();
+  samples.sort((a, b) => a - b);
+
+  const round = (value: number) => Math.round(value * 10) / 10;
+  return {
+    mode: MODE,
+    options: count,
+    openMs: round(openMs),
+    p50: round(percentile(samples, 0.5)),
+    p95: round(percentile(samples, 0.95)),
+    max: round(samples[samples.length - 1]),
+  };
+}
+
+async function main() {
+  const output = document.getElementById("results")!;
+  const stage = document.getElementById("stage")!;
+  const results: BenchmarkResult[] = [];
+
+  for (const size of SIZES) {
+    output.textContent = `Running ${MODE} with ${size} options…`;
+    results.push(await runSize(stage, size));
+  }
+
+  window.__optionSearchBenchmark = results;
+  console.table(results);
+  output.textContent = [
+    `mode=${MODE} queries=${QUERIES.length} (keystroke-to-result in ms)`,
+    " options      open     p50     p95     max",
+    ...results.map((result) =>
+      [result.options, result.openMs, result.p50, result.p95, result.max]
+        .map((value) => String(value).padStart(8))
+        .join(" ")
+    ),
+  ].join("\n");
+}
+
+void main();
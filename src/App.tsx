@@ -5,12 +5,13 @@ import { NavigationHeader } from "@/components/blocks/navigation-header/navigati
 import { Footer } from "@/components/blocks/footer/footer";
 import { ErrorBoundary } from "@/components/base/error-boundary";
 import { cn } from "@/shared/lib/utils";
+import { loadRoute } from "@/routes";
 
-// Lazy load page components for code splitting
-const Main = lazy(() => import("@/pages/Main").then(m => ({ default: m.Main })));
-const About = lazy(() => import("@/pages/About").then(m => ({ default: m.About })));
-const Career = lazy(() => import("@/pages/Career").then(m => ({ default: m.Career })));
-const Sales = lazy(() => import("@/pages/Sales").then(m => ({ default: m.Sales })));
+// Lazy load page components (+ their i18n namespaces) for code splitting
+const Main = lazy(() => loadRoute("/").then(m => ({ default: m.Main })));
+const About = lazy(() => loadRoute("/about").then(m => ({ default: m.About })));
+const Career = lazy(() => loadRoute("/career").then(m => ({ default: m.Career })));
+const Sales = lazy(() => loadRoute("/sales").then(m => ({ default: m.Sales })));
 const NotFound = lazy(() => import("@/pages/NotFound").then(m => ({ default: m.NotFound })));
 
 const devTailwind = {
@@ -1,5 +1,6 @@
 import { useEffect, useRef, useState } from "react";
 import { cn } from "@/shared/lib/utils";
+import { useFrameCallback, usePrefersReducedMotion } from "@/shared/hooks/use-frame-scheduler";
 
 interface CountingNumberProps {
   number: number;
@@ -12,45 +13,34 @@ export default function CountingNumber({
   duration = 2000,
   className,
 }: CountingNumberProps) {
-  const [count, setCount] = useState(0);
-  const startTimeRef = useRef<number | null>(null);
-  const animationFrameRef = useRef<number | null>(null);
+  const spanRef = useRef<HTMLSpanElement>(null);
+  const elapsedRef = useRef(0);
+  const isReducedMotion = usePrefersReducedMotion();
+  const [count, setCount] = useState(isReducedMotion ? number : 0);
+  const [isRunning, setIsRunning] = useState(!isReducedMotion);
 
   useEffect(() => {
-    startTimeRef.current = null;
-    setCount(0);
-
-    const animate = (timestamp: number) => {
-      if (!startTimeRef.current) {
-        startTimeRef.current = timestamp;
-      }
-
-      const progress = Math.min(
-        (timestamp - startTimeRef.current) / duration,
-        1
-      );
-
-      // Easing function für smoothere Animation (ease-out)
-      const easeOutQuad = 1 - Math.pow(1 - progress, 3);
-      const currentCount = Math.floor(easeOutQuad * number);
-
-      setCount(currentCount);
-
-      if (progress < 1) {
-        animationFrameRef.current = requestAnimationFrame(animate);
-      } else {
-        setCount(number);
-      }
-    };
-
-    animationFrameRef.current = requestAnimationFrame(animate);
-
-    return () => {
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current);
-      }
-    };
-  }, [number, duration]);
-
-  return <span className={cn(className)}>{count}</span>;
+    elapsedRef.current = 0;
+    setCount(isReducedMotion ? number : 0);
+    setIsRunning(!isReducedMotion);
+  }, [number, duration, isReducedMotion]);
+
+  // Progress only advances while visible - off-screen counters start when scrolled into view
+  useFrameCallback(
+    {
+      write: ({ delta }) => {
+        elapsedRef.current += delta;
+        const progress = Math.min(elapsedRef.current / duration, 1);
+
+        // Easing function für smoothere Animation (ease-out)
+        const easeOutQuad = 1 - Math.pow(1 - progress, 3);
+        setCount(progress < 1 ? Math.floor(easeOutQuad * number) : number);
+
+        if (progress >= 1) setIsRunning(false);
+      },
+    },
+    { elementRef: spanRef, enabled: isRunning }
+  );
+
+  return <span ref={spanRef} className={cn(className)}>{count}</span>;
 }
@@ -0,0 +1,89 @@
+import * as React from "react";
+import { imageManifest } from "virtual:responsive-images";
+
+import { cn } from "@/shared/lib/utils";
+
+interface OptimizedImageProps
+  extends Omit<React.ImgHTMLAttributes<HTMLImageElement>, "src" | "srcSet"> {
+  src: string;
+  alt: string;
+  /** Rendered width per breakpoint, e.g. "(min-width: 1024px) 50vw, 100vw". */
+  sizes?: string;
+  /** Above-the-fold slot (hero): loads eagerly with high fetch priority. */
+  priority?: boolean;
+}
+
+// Images known to the build (vite-plugins/responsive-images) get AVIF/WebP
+// srcsets, intrinsic width/height and a blurred placeholder. Anything else
+// falls back to a plain <img> with the same loading behaviour.
+const OptimizedImage = React.forwardRef<HTMLImageElement, OptimizedImageProps>(
+  (
+    {
+      src,
+      alt,
+      sizes = "100vw",
+      priority = false,
+      loading,
+      width,
+      height,
+      className,
+      style,
+      onLoad,
+      ...props
+    },
+    ref
+  ) => {
+    const entry = imageManifest[src];
+    const [isLoaded, setIsLoaded] = React.useState(false);
+
+    React.useEffect(() => setIsLoaded(false), [src]);
+
+    const placeholder = !isLoaded ? entry?.placeholder : undefined;
+    const sources = entry?.sources.filter((source) => source.srcSet) ?? [];
+
+    const image = (
+      <img
+        ref={ref}
+        src={src}
+        alt={alt}
+        width={width ?? entry?.width}
+        height={height ?? entry?.height}
+        loading={loading ?? (priority ? "eager" : "lazy")}
+        decoding={priority ? "sync" : "async"}
+        // React 18 only knows the lowercase attribute
+        {...(priority ? { fetchpriority: "high" } : {})}
+        className={cn(className)}
+        style={
+          placeholder
+            ? {
+                backgroundImage: `url("${placeholder}")`,
+                backgroundSize: "cover",
+                backgroundPosition: "center",
+                ...style,
+              }
+            : style
+        }
+        onLoad={(event) => {
+          setIsLoaded(true);
+          onLoad?.(event);
+        }}
+        {...props}
+      />
+    );
+
+    if (sources.length === 0) return image;
+
+    // display: contents keeps the <img> as the layout box of its parent
+    return (
+      <picture className="contents">
+        {sources.map((source) => (
+          <source key={source.type} type={source.type} srcSet={source.srcSet} sizes={sizes} />
+        ))}
+        {image}
+      </picture>
+    );
+  }
+);
+OptimizedImage.displayName = "OptimizedImage";
+
+export { OptimizedImage };
@@ -3,6 +3,7 @@ import { useTranslation } from 'react-i18next';
 import { Link, useLocation } from 'react-router-dom';
 import { Button } from '@/components/base/button';
 import { cn } from '@/shared/lib/utils';
+import { prefetchRoute } from '@/routes';
 
 // Hooks
 // (handled via useTranslation and useLocation)
@@ -20,7 +21,7 @@ import { cn } from '@/shared/lib/utils';
 // (path comparison for active state)
 
 // Event Handlers
-// (none - uses Link component)
+// Prefetch route chunk + translations on hover/focus/touch
 
 // Effects
 // (none)
@@ -56,7 +57,7 @@ export function NavigationHeader({ className }: NavigationHeaderProps) {
   };
 
   // 6. EVENT HANDLERS
-  // (none)
+  const handlePrefetch = (path: string) => () => prefetchRoute(path);
 
   // 7. EFFECTS
   // (none)
@@ -77,6 +78,8 @@ export function NavigationHeader({ className }: NavigationHeaderProps) {
             <Link
               key={link.path}
               to={link.path}
+              onMouseEnter={handlePrefetch(link.path)}
+              onFocus={handlePrefetch(link.path)}
               className={cn(
                 'text-sm font-medium transition-colors hover:text-primary',
                 isActivePath(link.path)
@@ -92,7 +95,7 @@ export function NavigationHeader({ className }: NavigationHeaderProps) {
         {/* Contact CTA */}
         <div className="hidden md:block">
           <Button size="sm" asChild>
-            <Link to="/sales">{t('navigation.contact')}</Link>
+            <Link to="/sales" onMouseEnter={handlePrefetch('/sales')} onFocus={handlePrefetch('/sales')}>{t('navigation.contact')}</Link>
           </Button>
         </div>
 
@@ -103,7 +106,7 @@ export function NavigationHeader({ className }: NavigationHeaderProps) {
           className="md:hidden"
           asChild
         >
-          <Link to="/sales">{t('navigation.contact')}</Link>
+          <Link to="/sales" onTouchStart={handlePrefetch('/sales')}>{t('navigation.contact')}</Link>
         </Button>
       </div>
 
@@ -114,6 +117,8 @@ export function NavigationHeader({ className }: NavigationHeaderProps) {
             <Link
               key={link.path}
               to={link.path}
+              onTouchStart={handlePrefetch(link.path)}
+              onFocus={handlePrefetch(link.path)}
               className={cn(
                 'text-xs font-medium transition-colors',
                 isActivePath(link.path)
@@ -1,11 +1,14 @@
 // External Libraries
-import { useState, useEffect } from "react";
+import { useRef, useState } from "react";
 import { useTranslation } from "react-i18next";
 
 // Components
 import { Button } from "@/components/base/button";
 import { Card, CardContent } from "@/components/base/card";
 
+// Hooks
+import { useFrameInterval, usePrefersReducedMotion } from "@/shared/hooks/use-frame-scheduler";
+
 // Types
 import type { Testimonial } from "@/shared/data/mock-testimonials";
 
@@ -31,6 +34,8 @@ export interface TestimonialSliderProps {
 export function TestimonialSlider({ testimonials, type }: TestimonialSliderProps) {
   // Hooks
   const [currentIndex, setCurrentIndex] = useState(0);
+  const sliderRef = useRef<HTMLDivElement>(null);
+  const isReducedMotion = usePrefersReducedMotion();
 
   // Translations
   const { t } = useTranslation();
@@ -41,6 +46,15 @@ export function TestimonialSlider({ testimonials, type }: TestimonialSliderProps
   const filteredTestimonials = testimonials
     .filter(testimonial => testimonial.type === type)
     .sort((a, b) => a.displayOrder - b.displayOrder);
+  const totalSlides = filteredTestimonials.length;
+
+  // Auto-advance every 8 seconds of visible time; paused in background tabs,
+  // off-screen and for reduced motion. Manual navigation restarts the interval.
+  useFrameInterval(
+    () => setCurrentIndex((prev) => (prev + 1) % totalSlides),
+    8000,
+    { elementRef: sliderRef, enabled: totalSlides > 1 && !isReducedMotion, resetKey: currentIndex }
+  );
 
   if (filteredTestimonials.length === 0) {
     return null;
@@ -48,7 +62,6 @@ export function TestimonialSlider({ testimonials, type }: TestimonialSliderProps
 
   // Computed Data
   const currentTestimonial = filteredTestimonials[currentIndex];
-  const totalSlides = filteredTestimonials.length;
 
   // Event Handlers
   const handleNext = () => {
@@ -63,20 +76,8 @@ export function TestimonialSlider({ testimonials, type }: TestimonialSliderProps
     setCurrentIndex(index);
   };
 
-  // Effects
-  // Auto-advance slider every 8 seconds
-  useEffect(() => {
-    if (totalSlides > 1) {
-      const interval = setInterval(() => {
-        handleNext();
-      }, 8000);
-
-      return () => clearInterval(interval);
-    }
-  }, [totalSlides, currentIndex]);
-
   return (
-    <div className="space-y-6">
+    <div ref={sliderRef} className="space-y-6">
       <Card className="min-h-[200px]">
         <CardContent className="p-8">
           <blockquote className="text-lg leading-relaxed text-center mb-6">
@@ -15,6 +15,7 @@ import {
 } from "lucide-react";
 
 import { Button } from "@/components/base/button";
+import { VirtualPdfViewer } from "@/components/features/pdf-viewer/pdf-viewer";
 import { FileText, Bookmark, Paperclip } from "lucide-react";
 
 interface PdfToolbarProps {
@@ -278,7 +279,24 @@ export const PdfToolbar = ({
   );
 };
 
-export function PdfViewer() {
+interface PdfViewerProps {
+  fileUrl?: string;
+  /**
+   * "virtualized": range-loaded, renders only visible pages with a shared
+   * worker and page cache - use for long manuals.
+   */
+  mode?: "default" | "virtualized";
+}
+
+export function PdfViewer({ fileUrl = "/Anleitung MFA.pdf", mode = "default" }: PdfViewerProps) {
+  if (mode === "virtualized") {
+    return <VirtualPdfViewer fileUrl={fileUrl} />;
+  }
+
+  return <DefaultPdfViewer fileUrl={fileUrl} />;
+}
+
+function DefaultPdfViewer({ fileUrl }: { fileUrl: string }) {
   const [autoZoom, setAutoZoom] = useState(true);
 
   const defaultLayoutPluginInstance = defaultLayoutPlugin({
@@ -317,7 +335,7 @@ export function PdfViewer() {
       <Worker workerUrl="https://unpkg.com/pdfjs-dist@3.11.174/build/pdf.worker.min.js">
         {" "}
         <Viewer
-          fileUrl="/Anleitung MFA.pdf"
+          fileUrl={fileUrl}
           plugins={[defaultLayoutPluginInstance]}
           defaultScale={autoZoom ? SpecialZoomLevel.PageWidth : undefined}
           theme="dark"
@@ -1,5 +1,5 @@
 // External Libraries
-import { useState, useEffect } from "react";
+import { useState, useEffect, useRef } from "react";
 import { useForm } from "react-hook-form";
 import { zodResolver } from "@hookform/resolvers/zod";
 import { useTranslation } from "react-i18next";
@@ -14,6 +14,8 @@ import { Checkbox } from "@/components/base/checkbox";
 
 // Types and Validation
 import { jobApplicationSchema, type JobApplicationData, type FormState } from "@/shared/lib/form-validation";
+import { submitViaOutbox, takeFailedSubmission } from "@/shared/services/submission-outbox";
+import { isDuplicateSubmission } from "@/shared/services/duplicate-detection";
 
 // Hooks
 
@@ -38,6 +40,8 @@ export function ApplicationForm({ prefilledJobTitle = "", onSubmitSuccess }: App
   // Hooks
   const [formState, setFormState] = useState<FormState>("idle");
   const [submitMessage, setSubmitMessage] = useState<string>("");
+  const [uploadPercent, setUploadPercent] = useState<number | null>(null);
+  const abortControllerRef = useRef<AbortController | null>(null);
 
   // Translations
   const { t } = useTranslation();
@@ -63,87 +67,47 @@ export function ApplicationForm({ prefilledJobTitle = "", onSubmitSuccess }: App
   const isError = formState === "error";
 
   // Event Handlers
-  const handleFileToBase64 = (file: File): Promise<string> => {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader();
-      reader.onload = () => {
-        if (typeof reader.result === 'string') {
-          // Remove data URL prefix
-          const base64 = reader.result.split(',')[1];
-          resolve(base64);
-        } else {
-          reject(new Error('Failed to convert file to base64'));
-        }
-      };
-      reader.onerror = reject;
-      reader.readAsDataURL(file);
-    });
-  };
-
-  const checkDuplicateSubmission = (email: string): boolean => {
-    const key = `application_${email}`;
-    const lastSubmission = localStorage.getItem(key);
-
-    if (lastSubmission) {
-      const lastSubmissionTime = new Date(lastSubmission).getTime();
-      const now = new Date().getTime();
-      const twentyFourHours = 24 * 60 * 60 * 1000;
-
-      return (now - lastSubmissionTime) < twentyFourHours;
-    }
-
-    return false;
-  };
-
   const onSubmit = async (data: JobApplicationData) => {
     try {
       setFormState("submitting");
       setSubmitMessage("");
 
       // Check for duplicate submission
-      if (checkDuplicateSubmission(data.email)) {
+      if (await isDuplicateSubmission(data.email, "career")) {
         setFormState("error");
         setSubmitMessage(t("applicationForm.duplicateSubmission"));
         return;
       }
 
-      // Convert CV file to base64
-      let cvBase64 = "";
-      if (data.cvFile) {
-        cvBase64 = await handleFileToBase64(data.cvFile);
-      }
+      // Stream CV as binary with progress; an unmount aborts the upload and
+      // leaves the application queued in the outbox
+      abortControllerRef.current?.abort();
+      const abortController = new AbortController();
+      abortControllerRef.current = abortController;
+      setUploadPercent(0);
 
-      // Prepare form data for FormSubmit.co
-      const formData = new FormData();
-      formData.append("name", data.name);
-      formData.append("email", data.email);
-      formData.append("location", data.location || "");
-      formData.append("jobTitle", data.jobTitle);
-      formData.append("message", data.message || "");
-      formData.append("cvFileName", data.cvFile.name);
-      formData.append("cvBase64", cvBase64);
-      formData.append("submissionType", "job_application");
-
-      // Submit to FormSubmit.co (replace with actual endpoint)
-      const response = await fetch("https://formsubmit.co/your-email@example.com", {
-        method: "POST",
-        body: formData,
+      const result = await submitViaOutbox("career", data, {
+        signal: abortController.signal,
+        onProgress: (progress) => setUploadPercent(progress.percent),
       });
 
-      if (response.ok) {
-        // Store submission timestamp to prevent duplicates
-        localStorage.setItem(`application_${data.email}`, new Date().toISOString());
+      if (abortController.signal.aborted) {
+        return;
+      }
 
+      if (result.state === "success" || result.state === "queued") {
         setFormState("success");
-        setSubmitMessage(t("applicationForm.submitSuccess"));
+        setSubmitMessage(result.state === "queued" ? t("applicationForm.submitQueued") : t("applicationForm.submitSuccess"));
         form.reset();
         onSubmitSuccess?.();
       } else {
-        throw new Error("Network response was not ok");
+        throw new Error(result.message);
       }
     } catch (error) {
       setFormState("error");
       setSubmitMessage(t("applicationForm.submitError"));
+    } finally {
+      setUploadPercent(null);
     }
   };
 
@@ -159,6 +123,22 @@ export function ApplicationForm({ prefilledJobTitle = "", onSubmitSuccess }: App
     }
   }, [prefilledJobTitle, form]);
 
+  useEffect(() => {
+    return () => abortControllerRef.current?.abort();
+  }, []);
+
+  // An application the outbox could not deliver comes back into the form
+  useEffect(() => {
+    takeFailedSubmission("career")
+      .then((payload) => {
+        if (!payload) return;
+        form.reset(payload);
+        setFormState("error");
+        setSubmitMessage(t("applicationForm.submitFailedInBackground"));
+      })
+      .catch((error) => console.error("Failed submission lookup error:", error));
+  }, [form, t]);
+
   return (
     <Card id="bewerben">
       <CardHeader>
@@ -328,7 +308,11 @@ export function ApplicationForm({ prefilledJobTitle = "", onSubmitSuccess }: App
               )}
 
               <Button type="submit" disabled={isSubmitting} className="w-full">
-                {isSubmitting ? t("applicationForm.submitting") : t("applicationForm.submitButton")}
+                {isSubmitting
+                  ? uploadPercent !== null
+                    ? t("applicationForm.uploading", { percent: uploadPercent })
+                    : t("applicationForm.submitting")
+                  : t("applicationForm.submitButton")}
               </Button>
             </form>
           </Form>
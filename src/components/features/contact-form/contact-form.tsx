@@ -1,5 +1,5 @@
 // React Core
-import { useState } from "react";
+import { useEffect, useState } from "react";
 
 // External Libraries
 import { useForm } from "react-hook-form";
@@ -18,11 +18,11 @@ import { Alert, AlertDescription } from "@/components/base/alert";
 
 // Services & Validation
 import { contactFormSchema, type ContactFormData } from "@/shared/lib/form-validation";
-import { submitContactForm } from "@/shared/services/form-submission";
-import { isDuplicateSubmission, recordSubmission, getDuplicateMessage } from "@/shared/services/duplicate-detection";
+import { submitViaOutbox, takeFailedSubmission } from "@/shared/services/submission-outbox";
+import { isDuplicateSubmission, getDuplicateMessage } from "@/shared/services/duplicate-detection";
 
 // Types
-type FormState = 'idle' | 'submitting' | 'success' | 'error' | 'duplicate';
+type FormState = 'idle' | 'submitting' | 'success' | 'queued' | 'error' | 'duplicate';
 
 interface ContactFormProps {
   className?: string;
@@ -73,7 +73,7 @@ export function ContactForm({ className = "" }: ContactFormProps) {
 
   // 5. Computed Data
   const isLoading = formState === 'submitting';
-  const isDisabled = isLoading || formState === 'success';
+  const isDisabled = isLoading || formState === 'success' || formState === 'queued';
   const consentValue = watch('consent');
 
   // 6. Event Handlers
@@ -83,21 +83,23 @@ export function ContactForm({ className = "" }: ContactFormProps) {
       setSubmitMessage('');
 
       // Check for duplicate submission (FR-049)
-      if (isDuplicateSubmission(data.email, 'sales')) {
+      if (await isDuplicateSubmission(data.email, 'sales')) {
         setFormState('duplicate');
         setSubmitMessage(getDuplicateMessage('sales'));
         return;
       }
 
-      // Submit form (FR-017)
-      const result = await submitContactForm(data);
+      // Submit form (FR-017) - queued and retried in the background when offline
+      const result = await submitViaOutbox('sales', data);
 
       if (result.state === 'success') {
-        // Record successful submission for duplicate detection
-        recordSubmission(data.email, 'sales');
         setFormState('success');
         setSubmitMessage(result.message || 'Danke. Wir melden uns binnen 1 Werktag.');
         reset(); // Clear form
+      } else if (result.state === 'queued') {
+        setFormState('queued');
+        setSubmitMessage(result.message || '');
+        reset();
       } else {
         setFormState('error');
         setSubmitMessage(result.message || 'Ein Fehler ist aufgetreten. Bitte versuchen Sie es erneut.');
@@ -122,7 +124,17 @@ export function ContactForm({ className = "" }: ContactFormProps) {
   };
 
   // 7. Effects
-  // (none needed)
+  // A queued request the outbox could not deliver comes back into the form
+  useEffect(() => {
+    takeFailedSubmission('sales')
+      .then((payload) => {
+        if (!payload) return;
+        reset(payload);
+        setFormState('error');
+        setSubmitMessage('Ihre Anfrage konnte nicht gesendet werden. Bitte prüfen Sie Ihre Angaben und senden Sie sie erneut.');
+      })
+      .catch((error) => console.error('Failed submission lookup error:', error));
+  }, [reset]);
 
   return (
     <div className={`space-y-6 ${className}`}>
@@ -280,7 +292,7 @@ export function ContactForm({ className = "" }: ContactFormProps) {
 
             {/* Status Messages */}
             {submitMessage && (
-              <Alert className={formState === 'success' || formState === 'duplicate' ? 'border-green-500' : 'border-red-500'}>
+              <Alert className={formState === 'success' || formState === 'queued' || formState === 'duplicate' ? 'border-green-500' : 'border-red-500'}>
                 <AlertDescription>
                   {submitMessage}
                   {formState === 'error' && (
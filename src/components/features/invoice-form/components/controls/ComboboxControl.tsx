@@ -1,25 +1,22 @@
 import { useState } from "react";
 import { Button } from "@/components/base/button";
-import {
-  Command,
-  CommandEmpty,
-  CommandGroup,
-  CommandInput,
-  CommandItem,
-  CommandList,
-} from "@/components/base/command";
 import {
   Popover,
   PopoverContent,
   PopoverTrigger,
 } from "@/components/base/popover";
-import { Check, ChevronsUpDown } from "lucide-react";
-import { cn } from "@/shared/lib/utils";
+import { ChevronsUpDown } from "lucide-react";
+import {
+  useOptionLabel,
+  useOptionSource,
+  type OptionsInput,
+} from "../../lib/options";
+import { OptionPicker } from "./OptionPicker";
 
 interface ComboboxControlProps {
   value: any;
   onChange: (value: any) => void;
-  options: string[] | { value: string; label: string }[];
+  options: OptionsInput;
   placeholder?: string;
   disabled?: boolean;
 }
@@ -32,6 +29,8 @@ export function ComboboxControl({
   disabled,
 }: ComboboxControlProps) {
   const [open, setOpen] = useState(false);
+  const source = useOptionSource(options);
+  const label = useOptionLabel(source, value ? String(value) : undefined);
 
   return (
     <Popover open={open} onOpenChange={setOpen}>
@@ -43,50 +42,21 @@ export function ComboboxControl({
           className="w-full justify-between"
           disabled={disabled}
         >
-          {value
-            ? (() => {
-                const selected = options.find(
-                  (opt) => (typeof opt === "string" ? opt : opt.value) === value
-                );
-                return typeof selected === "string"
-                  ? selected
-                  : selected?.label;
-              })()
-            : placeholder || "Auswählen..."}
+          <span className="truncate">
+            {value ? label : placeholder || "Auswählen..."}
+          </span>
           <ChevronsUpDown className="ml-2 h-4 w-4 shrink-0 opacity-50" />
         </Button>
       </PopoverTrigger>
-      <PopoverContent className="w-full p-0">
-        <Command>
-          <CommandInput placeholder="Suchen..." />
-          <CommandList>
-            <CommandEmpty>Keine Ergebnisse.</CommandEmpty>
-            <CommandGroup>
-              {options.map((option) => {
-                const val = typeof option === "string" ? option : option.value;
-                const lbl = typeof option === "string" ? option : option.label;
-                return (
-                  <CommandItem
-                    key={val}
-                    value={val}
-                    onSelect={() => {
-                      onChange(val);
-                      setOpen(false);
-                    }}
-                  >
-                    <Check
-                      className={cn(
-                        "mr-2 h-4 w-4",
-                        value === val ? "opacity-100" : "opacity-0"
-                      )}
-                    />
-                    {lbl}
-                  </CommandItem>
-                );
-              })}
-            </CommandGroup>
-          </CommandList>
-        </Command>
+      <PopoverContent className="w-[var(--radix-popover-trigger-width)] min-w-[220px] p-0">
+        <OptionPicker
+          source={source}
+          value={value ? String(value) : undefined}
+          onSelect={(next) => {
+            onChange(next);
+            setOpen(false);
+          }}
+        />
       </PopoverContent>
     </Popover>
   );
@@ -0,0 +1,147 @@
+import { useEffect, useId, useRef, useState, type KeyboardEvent, type ReactNode } from "react";
+import { MagnifyingGlassIcon } from "@radix-ui/react-icons";
+import { Check } from "lucide-react";
+import { cn } from "@/shared/lib/utils";
+import { useOptionSearch, type OptionSource } from "../../lib/options";
+
+interface OptionPickerProps {
+  source: OptionSource;
+  value: string | undefined;
+  onSelect: (value: string) => void;
+}
+
+// Fixed row height keeps the window math O(1) for any result count
+const ROW_HEIGHT = 32;
+const LIST_HEIGHT = 300;
+const OVERSCAN = 6;
+const PAGE_ROWS = Math.floor(LIST_HEIGHT / ROW_HEIGHT);
+
+// Search input plus a windowed listbox - only the visible results are rendered
+export function OptionPicker({ source, value, onSelect }: OptionPickerProps) {
+  const [text, setText] = useState("");
+  const [activeIndex, setActiveIndex] = useState(0);
+  const [scrollTop, setScrollTop] = useState(0);
+  const listRef = useRef<HTMLDivElement>(null);
+  const listId = useId();
+  const { results, loading, error, loadRange } = useOptionSearch(source, text);
+
+  const total = results?.total ?? 0;
+  const start = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+  const end = Math.min(total, Math.ceil((scrollTop + LIST_HEIGHT) / ROW_HEIGHT) + OVERSCAN);
+
+  useEffect(() => {
+    loadRange(start, end);
+  }, [loadRange, start, end]);
+
+  // New results start at the top
+  useEffect(() => {
+    setActiveIndex(0);
+    setScrollTop(0);
+    if (listRef.current) listRef.current.scrollTop = 0;
+  }, [results]);
+
+  const moveTo = (index: number) => {
+    if (total === 0) return;
+    const next = Math.max(0, Math.min(total - 1, index));
+    setActiveIndex(next);
+
+    const list = listRef.current;
+    if (!list) return;
+    const top = next * ROW_HEIGHT;
+    if (top < list.scrollTop) list.scrollTop = top;
+    else if (top + ROW_HEIGHT > list.scrollTop + list.clientHeight) list.scrollTop = top + ROW_HEIGHT - list.clientHeight;
+  };
+
+  const handleKeyDown = (event: KeyboardEvent<HTMLInputElement>) => {
+    switch (event.key) {
+      case "ArrowDown":
+        moveTo(activeIndex + 1);
+        break;
+      case "ArrowUp":
+        moveTo(activeIndex - 1);
+        break;
+      case "PageDown":
+        moveTo(activeIndex + PAGE_ROWS);
+        break;
+      case "PageUp":
+        moveTo(activeIndex - PAGE_ROWS);
+        break;
+      case "Enter": {
+        const item = results?.getItem(activeIndex);
+        if (item) onSelect(item.value);
+        break;
+      }
+      default:
+        return;
+    }
+    event.preventDefault();
+  };
+
+  const rows: ReactNode[] = [];
+  for (let index = start; index < end; index++) {
+    const item = results?.getItem(index);
+    rows.push(
+      <div
+        key={index}
+        id={`${listId}-${index}`}
+        role="option"
+        aria-selected={item !== undefined && item.value === value}
+        data-selected={index === activeIndex}
+        className="absolute left-1 right-1 flex cursor-default select-none items-center gap-2 rounded-sm px-2 text-sm outline-none data-[selected=true]:bg-accent data-[selected=true]:text-accent-foreground"
+        style={{ top: index * ROW_HEIGHT, height: ROW_HEIGHT }}
+        onMouseMove={() => setActiveIndex(index)}
+        onMouseDown={(event) => event.preventDefault()}
+        onClick={() => item && onSelect(item.value)}
+      >
+        <Check
+          className={cn(
+            "h-4 w-4 shrink-0",
+            item !== undefined && item.value === value ? "opacity-100" : "opacity-0"
+          )}
+        />
+        <span className={cn("truncate", !item && "text-muted-foreground")}>
+          {item ? item.label : "Laden..."}
+        </span>
+      </div>
+    );
+  }
+
+  return (
+    <div className="flex flex-col overflow-hidden rounded-md bg-popover text-popover-foreground">
+      <div className="flex items-center border-b px-3">
+        <MagnifyingGlassIcon className="mr-2 h-4 w-4 shrink-0 opacity-50" />
+        <input
+          role="combobox"
+          aria-expanded
+          aria-controls={listId}
+          aria-autocomplete="list"
+          aria-activedescendant={total > 0 ? `${listId}-${activeIndex}` : undefined}
+          autoFocus
+          value={text}
+          onChange={(event) => setText(event.target.value)}
+          onKeyDown={handleKeyDown}
+          placeholder="Suchen..."
+          className="flex h-10 w-full rounded-md bg-transparent py-3 text-sm outline-none placeholder:text-muted-foreground"
+        />
+      </div>
+      {total === 0 ? (
+        <div className="py-6 text-center text-sm">
+          {error ? "Fehler beim Laden." : loading ? "Laden..." : "Keine Ergebnisse."}
+        </div>
+      ) : (
+        <div
+          ref={listRef}
+          id={listId}
+          role="listbox"
+          className="overflow-y-auto overflow-x-hidden"
+          style={{ maxHeight: LIST_HEIGHT }}
+          onScroll={(event) => setScrollTop(event.currentTarget.scrollTop)}
+        >
+          <div className="relative" style={{ height: total * ROW_HEIGHT }}>
+            {rows}
+          </div>
+        </div>
+      )}
+    </div>
+  );
+}
@@ -5,11 +5,16 @@ import {
   SelectTrigger,
   SelectValue,
 } from "@/components/base/select";
+import { isOptionSource, type OptionsInput } from "../../lib/options";
+import { ComboboxControl } from "./ComboboxControl";
+
+// Radix Select mounts every item; longer or async lists get the searchable, windowed picker
+const SELECT_MAX_OPTIONS = 100;
 
 interface SelectControlProps {
   value: any;
   onChange: (value: any) => void;
-  options: string[] | { value: string; label: string }[];
+  options: OptionsInput;
   placeholder?: string;
   disabled?: boolean;
 }
@@ -21,6 +26,18 @@ export function SelectControl({
   placeholder,
   disabled,
 }: SelectControlProps) {
+  if (isOptionSource(options) || options.length > SELECT_MAX_OPTIONS) {
+    return (
+      <ComboboxControl
+        value={value}
+        onChange={onChange}
+        options={options}
+        placeholder={placeholder}
+        disabled={disabled}
+      />
+    );
+  }
+
   return (
     <Select onValueChange={onChange} value={value} disabled={disabled}>
       <SelectTrigger className="w-full">
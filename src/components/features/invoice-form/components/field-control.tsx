@@ -0,0 +1,175 @@
+"use client";
+
+import { AlertCircle } from "lucide-react";
+
+import {
+  InputControl,
+  TextareaControl,
+  SelectControl,
+  RadioControl,
+  CheckboxControl,
+  SliderControl,
+  DatePickerControl,
+  ComboboxControl,
+} from "./controls";
+
+import {
+  TEXT_ICONS,
+  NUMBER_ICONS,
+  DATE_ICONS,
+  BOOLEAN_ICONS,
+  CHOICE_ICONS,
+  getNumberSuffix,
+} from "../lib/validation";
+import type { ControlType, Datatype, FieldOptions } from "../lib/engine/types";
+import { isOptionSource } from "../lib/options/resolve-source";
+
+interface FieldHeaderProps {
+  label: string;
+  datatype: Datatype;
+  format?: string;
+  status?: "error";
+}
+
+export interface FieldControlProps {
+  name: string;
+  label: string;
+  datatype: Datatype;
+  controlType: ControlType;
+  format?: string;
+  min?: number;
+  max?: number;
+  step?: number;
+  options?: FieldOptions;
+  placeholder?: string;
+  disabled?: boolean;
+  rows?: number;
+  value: any;
+  onChange: (value: any) => void;
+}
+
+// Stable fallback - the controls build their option source per list reference
+const NO_OPTIONS: string[] = [];
+
+// Label row with datatype icon and error marker (shared by UnifiedFormField and the form engine)
+export function FieldHeader({ label, datatype, format, status }: FieldHeaderProps) {
+  const getDataTypeIcon = () => {
+    const iconMap = {
+      text: TEXT_ICONS[format as keyof typeof TEXT_ICONS] || TEXT_ICONS.text,
+      number:
+        NUMBER_ICONS[format as keyof typeof NUMBER_ICONS] ||
+        NUMBER_ICONS.number,
+      date: DATE_ICONS[format as keyof typeof DATE_ICONS] || DATE_ICONS.date,
+      boolean: BOOLEAN_ICONS.boolean,
+      choice: CHOICE_ICONS.choice,
+    };
+
+    const Icon = iconMap[datatype];
+    return Icon ? <Icon className="h-4 w-4" /> : null;
+  };
+
+  const statusColor = status === "error" ? "text-error border-error" : undefined;
+
+  return (
+    <div className="flex flex-row justify-between items-center mb-2">
+      <div
+        className={`inline-flex justify-start items-center gap-1 border-b-2 ${statusColor} rounded-md px-2`}
+      >
+        {getDataTypeIcon()}
+        <span>{label}</span>
+      </div>
+      {status === "error" && <AlertCircle className="h-4 w-4 text-error" />}
+    </div>
+  );
+}
+
+// Control for a datatype/controlType pair
+export function FieldControl({
+  name,
+  label,
+  datatype,
+  controlType,
+  format,
+  min,
+  max,
+  step,
+  options,
+  placeholder,
+  disabled,
+  rows,
+  value,
+  onChange,
+}: FieldControlProps) {
+  // Radio and checkbox groups only take inline lists (compileFormDefinition enforces this)
+  const optionList = isOptionSource(options) ? undefined : options;
+
+  const baseProps = {
+    value,
+    onChange,
+    placeholder,
+    disabled,
+  };
+
+  switch (controlType) {
+    case "textarea":
+      return <TextareaControl {...baseProps} rows={rows} />;
+
+    case "select":
+      return <SelectControl {...baseProps} options={options ?? NO_OPTIONS} />;
+
+    case "radio":
+      return (
+        <RadioControl
+          value={String(value)}
+          onChange={(val) => {
+            // Convert to number if datatype is number
+            onChange(datatype === "number" ? parseFloat(val) : val);
+          }}
+          options={optionList || []}
+          name={name}
+          disabled={disabled}
+        />
+      );
+
+    case "checkbox":
+      return <CheckboxControl {...baseProps} options={optionList} label={label} />;
+
+    case "slider":
+      return <SliderControl {...baseProps} min={min} max={max} step={step} />;
+
+    case "datepicker":
+      return <DatePickerControl {...baseProps} />;
+
+    case "combobox":
+      return <ComboboxControl {...baseProps} options={options ?? NO_OPTIONS} />;
+
+    case "input":
+    default:
+      const inputType =
+        datatype === "number"
+          ? "number"
+          : format === "password"
+          ? "password"
+          : format === "email"
+          ? "email"
+          : format === "url"
+          ? "url"
+          : format === "tel"
+          ? "tel"
+          : "text";
+
+      const suffix =
+        datatype === "number" ? getNumberSuffix(format as any) : undefined;
+
+      return (
+        <InputControl
+          {...baseProps}
+          type={inputType}
+          min={min}
+          max={max}
+          step={step}
+          suffix={suffix}
+        />
+      );
+  }
+}
@@ -0,0 +1,155 @@
+"use client";
+
+import { memo, useCallback, useMemo, useRef, type FormEvent } from "react";
+
+import { Button } from "@/components/base/button";
+import { cn } from "@/shared/lib/utils";
+
+import { FieldControl, FieldHeader } from "./field-control";
+import {
+  createFormStore,
+  useEngineField,
+  useVirtualRows,
+  type CompiledField,
+  type CompiledForm,
+  type FieldValue,
+  type FormStore,
+  type FormValues,
+  type LayoutRow,
+} from "../lib/engine";
+
+interface FormEngineProps {
+  form: CompiledForm;
+  onSubmit: (values: FormValues) => void;
+  className?: string;
+}
+
+interface EngineRowProps {
+  row: LayoutRow;
+  index: number;
+  store: FormStore;
+  measureRow: (index: number, element: Element | null) => void;
+}
+
+interface EngineFieldProps {
+  field: CompiledField;
+  store: FormStore;
+}
+
+// Forms with more rows than this only render the rows in view
+const VIRTUALIZE_MIN_ROWS = 30;
+
+const ROW_STYLE = {
+  gridTemplateColumns: "repeat(auto-fit, minmax(min(220px, 100%), 1fr))",
+};
+
+/**
+ * Renders a compiled form definition. Fields read their own slice of the
+ * store, so typing re-renders one field (plus computed dependents) instead of
+ * the whole form; large forms are windowed by grid row.
+ */
+export function FormEngine({ form, onSubmit, className }: FormEngineProps) {
+  const store = useMemo(() => createFormStore(form), [form]);
+  const scrollRef = useRef<HTMLDivElement>(null);
+
+  const { start, end, paddingTop, paddingBottom, measureRow, scrollToRow } = useVirtualRows({
+    count: form.rows.length,
+    scrollRef,
+    enabled: form.rows.length > VIRTUALIZE_MIN_ROWS,
+  });
+
+  const handleSubmit = (event: FormEvent<HTMLFormElement>) => {
+    event.preventDefault();
+    const result = store.submit();
+
+    if (result.valid) {
+      onSubmit(result.values);
+      return;
+    }
+
+    // The first invalid field may be outside the rendered window: bring its row in, then center it
+    const [firstInvalid] = result.invalidFields;
+    scrollToRow(form.fieldsByName.get(firstInvalid)!.row);
+    requestAnimationFrame(() =>
+      scrollRef.current
+        ?.querySelector(`[data-field="${CSS.escape(firstInvalid)}"]`)
+        ?.scrollIntoView({ block: "center" })
+    );
+  };
+
+  return (
+    <form
+      onSubmit={handleSubmit}
+      noValidate
+      className={cn("w-full h-full flex flex-col gap-6 border rounded-lg p-6", className)}
+    >
+      <h2 className="text-2xl font-bold">{form.definition.title}</h2>
+
+      <div ref={scrollRef} className="min-h-0 flex-1 overflow-auto">
+        <div style={{ paddingTop, paddingBottom }}>
+          {form.rows.slice(start, end).map((row, offset) => (
+            <EngineRow key={row.key} row={row} index={start + offset} store={store} measureRow={measureRow} />
+          ))}
+        </div>
+      </div>
+
+      <div>
+        <Button type="submit">{form.definition.submitLabel ?? "Submit"}</Button>
+      </div>
+    </form>
+  );
+}
+
+// Rows never re-render on typing - only the fields inside them do
+const EngineRow = memo(function EngineRow({ row, index, store, measureRow }: EngineRowProps) {
+  const rowRef = useCallback((element: HTMLDivElement | null) => measureRow(index, element), [index, measureRow]);
+
+  return (
+    <div ref={rowRef} className="grid gap-4 pb-6" style={ROW_STYLE}>
+      {row.cells.map((cell, cellIndex) => (
+        <div key={cellIndex} style={{ gridColumn: cell.span > 1 ? `span ${cell.span}` : undefined }}>
+          {cell.field && <EngineField field={cell.field} store={store} />}
+        </div>
+      ))}
+    </div>
+  );
+});
+
+const EngineField = memo(function EngineField({ field, store }: EngineFieldProps) {
+  const { definition, name } = field;
+  const { value, error } = useEngineField(store, name);
+
+  const handleChange = useCallback((next: FieldValue) => store.setValue(name, next), [store, name]);
+  const handleBlur = useCallback(() => store.markTouched(name), [store, name]);
+
+  return (
+    <div className="space-y-2" data-field={name} onBlur={handleBlur}>
+      <FieldHeader
+        label={definition.label}
+        datatype={definition.datatype}
+        format={definition.format}
+        status={error ? "error" : undefined}
+      />
+      <FieldControl
+        name={name}
+        label={definition.label}
+        datatype={definition.datatype}
+        controlType={definition.controlType}
+        format={definition.format}
+        min={definition.min}
+        max={definition.max}
+        step={definition.step}
+        options={definition.options}
+        placeholder={definition.placeholder}
+        disabled={definition.disabled}
+        rows={definition.rows}
+        value={value}
+        onChange={handleChange}
+      />
+      {definition.description && (
+        <p className="text-[0.8rem] text-muted-foreground">{definition.description}</p>
+      )}
+      {error && <p className="text-[0.8rem] font-medium text-destructive">{error}</p>}
+    </div>
+  );
+});
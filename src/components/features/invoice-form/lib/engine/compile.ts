@@ -0,0 +1,317 @@
+import type { FieldErrors } from "react-hook-form";
+import type { z } from "zod";
+
+import {
+  getBooleanSchema,
+  getChoiceSchema,
+  getDateSchema,
+  getNumberSchema,
+  getTextSchema,
+  type DateFormat,
+  type NumberFormat,
+  type TextFormat,
+} from "../validation";
+import { isOptionSource } from "../options/resolve-source";
+import type {
+  CompiledField,
+  CompiledForm,
+  FieldDefinition,
+  FieldValidator,
+  FieldValue,
+  FormDefinition,
+  FormValues,
+  LayoutRow,
+} from "./types";
+
+type Parser = (raw: FieldValue) => FieldValue;
+
+const DATATYPES = new Set(["text", "number", "date", "boolean", "choice"]);
+const CONTROL_TYPES = new Set(["input", "textarea", "select", "radio", "checkbox", "slider", "datepicker", "combobox"]);
+
+// Compiled once per definition object - JSON modules and constants are stable references
+const compiledForms = new WeakMap<FormDefinition, CompiledForm>();
+
+/**
+ * Compile a form definition into per-field validators, a dependency graph and
+ * a grid layout. Throws on invalid definitions (unknown types, duplicate names,
+ * overlapping cells, unknown or circular references).
+ */
+export function compileFormDefinition(definition: FormDefinition): CompiledForm {
+  const cached = compiledForms.get(definition);
+  if (cached) return cached;
+
+  assertDefinition(definition);
+
+  const ys = [...new Set(definition.fields.map((field) => field.y))].sort((a, b) => a - b);
+  const rowIndexByY = new Map(ys.map((y, index) => [y, index]));
+  const parsers = new Map(definition.fields.map((field) => [field.name, compileParser(field)]));
+  const { dependents, order } = compileDependents(definition);
+
+  const fields: CompiledField[] = definition.fields.map((field) => {
+    const schema = compileSchema(field);
+    const parse = parsers.get(field.name)!;
+
+    return {
+      definition: field,
+      name: field.name,
+      row: rowIndexByY.get(field.y)!,
+      schema,
+      parse,
+      validate: compileValidator(field, schema, parse, parsers),
+      compute: field.compute && compileCompute(field, parsers),
+      dependents: dependents.get(field.name) ?? [],
+    };
+  });
+
+  const fieldsByName = new Map(fields.map((field) => [field.name, field]));
+
+  const compiled: CompiledForm = {
+    definition,
+    fields,
+    fieldsByName,
+    rows: compileLayout(definition, ys, fieldsByName),
+    defaultValues: Object.fromEntries(fields.map((field) => [field.name, getDefaultValue(field.definition)])),
+    computeOrder: order.filter((name) => fieldsByName.get(name)!.compute),
+    resolver: (values) => {
+      const errors: Record<string, { type: string; message: string }> = {};
+      const parsed: FormValues = {};
+
+      fields.forEach((field) => {
+        const message = field.validate(values[field.name], values);
+        if (message) errors[field.name] = { type: "validate", message };
+        else parsed[field.name] = field.parse(values[field.name]);
+      });
+
+      return Object.keys(errors).length > 0
+        ? { values: {}, errors: errors as FieldErrors<FormValues> }
+        : { values: parsed, errors: {} };
+    },
+  };
+
+  compiledForms.set(definition, compiled);
+  return compiled;
+}
+
+export function isEmptyValue(value: FieldValue): boolean {
+  return value === undefined || value === "" || (Array.isArray(value) && value.length === 0);
+}
+
+function assertDefinition(definition: FormDefinition) {
+  const fail = (message: string): never => {
+    throw new Error(`Form definition "${definition.id}": ${message}`);
+  };
+
+  if (!Array.isArray(definition.fields) || definition.fields.length === 0) fail("no fields");
+
+  const names = new Set<string>();
+  definition.fields.forEach((field) => {
+    if (names.has(field.name)) fail(`duplicate field "${field.name}"`);
+    names.add(field.name);
+
+    if (!DATATYPES.has(field.datatype)) fail(`"${field.name}" has unknown datatype "${field.datatype}"`);
+    if (!CONTROL_TYPES.has(field.controlType)) fail(`"${field.name}" has unknown controlType "${field.controlType}"`);
+    if (!Number.isInteger(field.x) || !Number.isInteger(field.y) || field.x < 0 || field.y < 0) {
+      fail(`"${field.name}" needs non-negative integer x/y`);
+    }
+    if (isOptionSource(field.options) && field.controlType !== "select" && field.controlType !== "combobox") {
+      fail(`"${field.name}" uses an option source, which needs controlType "select" or "combobox"`);
+    }
+  });
+
+  definition.fields.forEach((field) => {
+    getReferences(field).forEach((reference) => {
+      if (!names.has(reference)) fail(`"${field.name}" references unknown field "${reference}"`);
+      if (reference === field.name) fail(`"${field.name}" references itself`);
+    });
+  });
+}
+
+// Rows sorted by y (gaps collapse); each row is split into cells of `span` columns
+function compileLayout(definition: FormDefinition, ys: number[], fieldsByName: Map<string, CompiledField>): LayoutRow[] {
+  const occupied = new Map<string, string>();
+  let columns = 1;
+
+  definition.fields.forEach((field) => {
+    const span = Math.max(1, field.colSpan ?? 1);
+    columns = Math.max(columns, field.x + span);
+
+    for (let x = field.x; x < field.x + span; x++) {
+      const key = `${x},${field.y}`;
+      if (occupied.has(key)) {
+        throw new Error(`Form definition "${definition.id}": "${field.name}" overlaps "${occupied.get(key)}"`);
+      }
+      occupied.set(key, field.name);
+    }
+  });
+
+  const byPosition = new Map(definition.fields.map((field) => [`${field.x},${field.y}`, field]));
+
+  return ys.map((y) => {
+    const cells: LayoutRow["cells"] = [];
+
+    for (let x = 0; x < columns; ) {
+      const field = byPosition.get(`${x},${y}`);
+      const span = field ? Math.max(1, field.colSpan ?? 1) : 1;
+      cells.push({ field: field ? fieldsByName.get(field.name)! : null, span });
+      x += span;
+    }
+
+    return { key: y, cells };
+  });
+}
+
+// Field -> everything that (transitively) reads it, in topological order
+function compileDependents(definition: FormDefinition) {
+  const readers = new Map<string, string[]>();
+  const inDegree = new Map(definition.fields.map((field) => [field.name, 0]));
+
+  definition.fields.forEach((field) => {
+    getReferences(field).forEach((reference) => {
+      readers.set(reference, [...(readers.get(reference) ?? []), field.name]);
+      inDegree.set(field.name, inDegree.get(field.name)! + 1);
+    });
+  });
+
+  // Kahn's algorithm: fields left over afterwards are part of a cycle
+  const order: string[] = [...inDegree].filter(([, degree]) => degree === 0).map(([name]) => name);
+  for (let i = 0; i < order.length; i++) {
+    (readers.get(order[i]) ?? []).forEach((reader) => {
+      const degree = inDegree.get(reader)! - 1;
+      inDegree.set(reader, degree);
+      if (degree === 0) order.push(reader);
+    });
+  }
+
+  if (order.length < definition.fields.length) {
+    const cycle = [...inDegree].filter(([, degree]) => degree > 0).map(([name]) => name);
+    throw new Error(`Form definition "${definition.id}": circular dependency between ${cycle.join(", ")}`);
+  }
+
+  const position = new Map(order.map((name, index) => [name, index]));
+  const dependents = new Map<string, string[]>();
+
+  readers.forEach((_, name) => {
+    const reachable = new Set<string>();
+    const stack = [...(readers.get(name) ?? [])];
+    while (stack.length > 0) {
+      const next = stack.pop()!;
+      if (reachable.has(next)) continue;
+      reachable.add(next);
+      stack.push(...(readers.get(next) ?? []));
+    }
+    dependents.set(name, [...reachable].sort((a, b) => position.get(a)! - position.get(b)!));
+  });
+
+  return { dependents, order };
+}
+
+function compileSchema(field: FieldDefinition): z.ZodType {
+  switch (field.datatype) {
+    case "number":
+      return getNumberSchema(field.format as NumberFormat, field.required, field.min, field.max);
+    case "date":
+      return getDateSchema(field.format as DateFormat, field.required);
+    case "boolean":
+      return getBooleanSchema(field.required);
+    case "choice":
+      // Source values are not enumerable up front - only the required check applies
+      if (isOptionSource(field.options)) return getTextSchema(undefined, field.required);
+      return getChoiceSchema(field.options ?? [], field.required, isMultiple(field));
+    case "text":
+    default:
+      return getTextSchema(field.format as TextFormat, field.required);
+  }
+}
+
+function compileParser(field: FieldDefinition): Parser {
+  switch (field.datatype) {
+    case "number":
+      return (raw) => {
+        if (typeof raw === "number" || raw === undefined) return raw;
+        const text = String(raw).trim();
+        if (text === "") return undefined;
+        const parsed = Number(text.replace(",", "."));
+        return Number.isNaN(parsed) ? text : parsed;
+      };
+    case "boolean":
+      return (raw) => raw === true || raw === "true";
+    default:
+      return (raw) => raw;
+  }
+}
+
+function compileValidator(
+  field: FieldDefinition,
+  schema: z.ZodType,
+  parse: Parser,
+  parsers: Map<string, Parser>
+): FieldValidator {
+  const requiredMessage = field.requiredMessage ?? "Dieses Feld ist erforderlich";
+  const rules = (field.rules ?? []).map((rule) => {
+    const parseOther = parsers.get(rule.field)!;
+    return (value: FieldValue, values: FormValues) => {
+      const other = parseOther(values[rule.field]);
+      if (isEmptyValue(other)) return undefined;
+      return compareValues(value, other) < 0 ? rule.message : undefined;
+    };
+  });
+
+  return (raw, values) => {
+    if (isEmptyValue(raw)) return field.required ? requiredMessage : undefined;
+
+    const value = parse(raw);
+    if (field.datatype === "number" && typeof value !== "number") return "Bitte eine gültige Zahl eingeben";
+
+    const result = schema.safeParse(value);
+    if (!result.success) return result.error.issues[0]?.message;
+
+    for (const rule of rules) {
+      const message = rule(value, values);
+      if (message) return message;
+    }
+    return undefined;
+  };
+}
+
+function compileCompute(field: FieldDefinition, parsers: Map<string, Parser>) {
+  const read = (name: string, values: FormValues) => {
+    const value = parsers.get(name)!(values[name]);
+    return typeof value === "number" ? value : 0;
+  };
+  const compute = field.compute!;
+
+  switch (compute.op) {
+    case "sum":
+      return (values: FormValues) => roundCents(compute.fields.reduce((total, name) => total + read(name, values), 0));
+    case "percentOf":
+      return (values: FormValues) => roundCents((read(compute.base, values) * read(compute.rate, values)) / 100);
+  }
+}
+
+function getReferences(field: FieldDefinition): string[] {
+  const references = (field.rules ?? []).map((rule) => rule.field);
+  if (field.compute?.op === "sum") references.push(...field.compute.fields);
+  if (field.compute?.op === "percentOf") references.push(field.compute.base, field.compute.rate);
+  return [...new Set(references)];
+}
+
+function getDefaultValue(field: FieldDefinition): FieldValue {
+  if (field.defaultValue !== undefined) return field.defaultValue;
+  if (field.datatype === "boolean") return false;
+  if (isMultiple(field)) return [];
+  return "";
+}
+
+function isMultiple(field: FieldDefinition): boolean {
+  return field.controlType === "checkbox" && Array.isArray(field.options) && field.options.length > 0;
+}
+
+// Numbers numerically, everything else as strings (ISO dates sort lexically)
+function compareValues(a: FieldValue, b: FieldValue): number {
+  if (typeof a === "number" && typeof b === "number") return a - b;
+  return String(a).localeCompare(String(b));
+}
+
+function roundCents(value: number): number {
+  return Math.round(value * 100) / 100;
+}
@@ -0,0 +1,23 @@
+import { compileFormDefinition } from "./compile";
+import type { CompiledForm, FormDefinition } from "./types";
+
+// Definitions are plain JSON in ../../definitions; each one is its own chunk
+const definitionModules = import.meta.glob<FormDefinition>("../../definitions/*.json", { import: "default" });
+
+const loadedForms = new Map<string, Promise<CompiledForm>>();
+
+/** Load and compile a JSON form definition by id (file name without .json). */
+export function loadFormDefinition(id: string): Promise<CompiledForm> {
+  let loaded = loadedForms.get(id);
+
+  if (!loaded) {
+    const load = definitionModules[`../../definitions/${id}.json`];
+    if (!load) return Promise.reject(new Error(`Unknown form definition "${id}"`));
+
+    loaded = load().then(compileFormDefinition);
+    loaded.catch(() => loadedForms.delete(id));
+    loadedForms.set(id, loaded);
+  }
+
+  return loaded;
+}
@@ -0,0 +1,168 @@
+import type { CompiledForm, FieldValue, FormValues } from "./types";
+
+type Listener = () => void;
+
+export interface FormSubmitResult {
+  valid: boolean;
+  values: FormValues;
+  /** Fields with errors, in definition order. */
+  invalidFields: string[];
+}
+
+export interface FormStore {
+  form: CompiledForm;
+  getValue: (name: string) => FieldValue;
+  /** Error to display - only once the field was blurred or the form submitted. */
+  getError: (name: string) => string | undefined;
+  getValues: () => FormValues;
+  subscribe: (name: string, listener: Listener) => () => void;
+  setValue: (name: string, value: FieldValue) => void;
+  markTouched: (name: string) => void;
+  submit: () => FormSubmitResult;
+}
+
+// Validation runs in idle time, in slices, so typing never waits for it
+const IDLE_TIMEOUT_MS = 150;
+const SLICE_BUDGET_MS = 4;
+
+/**
+ * Field-level form state. Each field subscribes to its own name only, so a
+ * keystroke re-renders the edited field plus the fields computed from it.
+ * Validation of the edited field and its dependents is queued and flushed
+ * when the browser is idle.
+ */
+export function createFormStore(form: CompiledForm): FormStore {
+  const values: FormValues = { ...form.defaultValues };
+  const errors = new Map<string, string>();
+  const touched = new Set<string>();
+  const listeners = new Map<string, Set<Listener>>();
+  const pending = new Set<string>();
+  let submitted = false;
+  let idleHandle: number | null = null;
+
+  const isVisible = (name: string) => submitted || touched.has(name);
+
+  const notify = (name: string) => listeners.get(name)?.forEach((listener) => listener());
+
+  const runValidation = (name: string) => {
+    const message = form.fieldsByName.get(name)!.validate(values[name], values);
+    if (message === errors.get(name)) return;
+
+    if (message) errors.set(name, message);
+    else errors.delete(name);
+    if (isVisible(name)) notify(name);
+  };
+
+  const flush = (deadline?: IdleDeadline) => {
+    idleHandle = null;
+    const started = performance.now();
+    const hasTime = () =>
+      deadline ? deadline.timeRemaining() > 1 || deadline.didTimeout : performance.now() - started < SLICE_BUDGET_MS;
+
+    for (const name of pending) {
+      pending.delete(name);
+      runValidation(name);
+      if (!hasTime()) break;
+    }
+
+    if (pending.size > 0) scheduleFlush();
+  };
+
+  const scheduleFlush = () => {
+    if (idleHandle !== null) return;
+    idleHandle =
+      typeof requestIdleCallback === "function"
+        ? requestIdleCallback(flush, { timeout: IDLE_TIMEOUT_MS })
+        : window.setTimeout(flush, 0);
+  };
+
+  const cancelFlush = () => {
+    if (idleHandle === null) return;
+    if (typeof cancelIdleCallback === "function") cancelIdleCallback(idleHandle);
+    else window.clearTimeout(idleHandle);
+    idleHandle = null;
+  };
+
+  // Derived fields, in dependency order
+  const recompute = (names: string[]) => {
+    names.forEach((name) => {
+      const field = form.fieldsByName.get(name)!;
+      if (!field.compute) return;
+
+      const next = field.compute(values);
+      if (next === values[name]) return;
+      values[name] = next;
+      notify(name);
+    });
+  };
+
+  recompute(form.computeOrder);
+  // Seed errors so the first blur/submit does not have to validate everything synchronously
+  form.fields.forEach((field) => pending.add(field.name));
+  scheduleFlush();
+
+  return {
+    form,
+    getValue: (name) => values[name],
+    getError: (name) => (isVisible(name) ? errors.get(name) : undefined),
+    getValues: () => parsedValues(),
+
+    subscribe: (name, listener) => {
+      const set = listeners.get(name) ?? new Set();
+      set.add(listener);
+      listeners.set(name, set);
+      return () => {
+        set.delete(listener);
+      };
+    },
+
+    setValue: (name, value) => {
+      if (values[name] === value) return;
+      values[name] = value;
+      notify(name);
+
+      const { dependents } = form.fieldsByName.get(name)!;
+      recompute(dependents);
+
+      pending.add(name);
+      dependents.forEach((dependent) => pending.add(dependent));
+      scheduleFlush();
+    },
+
+    markTouched: (name) => {
+      if (touched.has(name)) return;
+      touched.add(name);
+      // A single field is cheap - validate now so the message appears on blur
+      pending.delete(name);
+      runValidation(name);
+      notify(name);
+    },
+
+    submit: () => {
+      cancelFlush();
+      pending.clear();
+      const wasSubmitted = submitted;
+      submitted = true;
+
+      const invalidFields: string[] = [];
+      form.fields.forEach(({ name, validate }) => {
+        const before = wasSubmitted || touched.has(name) ? errors.get(name) : undefined;
+        const message = validate(values[name], values);
+
+        if (message) {
+          errors.set(name, message);
+          invalidFields.push(name);
+        } else {
+          errors.delete(name);
+        }
+        if (message !== before) notify(name);
+      });
+
+      return { valid: invalidFields.length === 0, values: invalidFields.length === 0 ? parsedValues() : {}, invalidFields };
+    },
+  };
+
+  function parsedValues(): FormValues {
+    return Object.fromEntries(form.fields.map((field) => [field.name, field.parse(values[field.name])]));
+  }
+}
@@ -0,0 +1,6 @@
+export * from "./types";
+export * from "./compile";
+export * from "./form-store";
+export * from "./definitions";
+export * from "./use-engine-field";
+export * from "./use-virtual-rows";
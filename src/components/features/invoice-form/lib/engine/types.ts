@@ -0,0 +1,104 @@
+import type { Resolver } from "react-hook-form";
+import type { z } from "zod";
+
+import type { OptionsInput } from "../options/types";
+
+export type Datatype = "text" | "number" | "date" | "boolean" | "choice";
+
+export type ControlType =
+  | "input"
+  | "textarea"
+  | "select"
+  | "radio"
+  | "checkbox"
+  | "slider"
+  | "datepicker"
+  | "combobox";
+
+// Inline lists (JSON) or an option source for master data (select/combobox only)
+export type FieldOptions = OptionsInput;
+
+export type FieldValue = string | number | boolean | string[] | undefined;
+
+export type FormValues = Record<string, FieldValue>;
+
+// Derived values - JSON-safe so definitions can live outside the bundle
+export type FieldCompute =
+  | { op: "sum"; fields: string[] }
+  | { op: "percentOf"; base: string; rate: string };
+
+// Cross-field checks; the referenced field becomes a dependency
+export type FieldRule = { type: "minField"; field: string; message: string };
+
+export interface FieldDefinition {
+  name: string;
+  label: string;
+  datatype: Datatype;
+  controlType: ControlType;
+  format?: string;
+  min?: number;
+  max?: number;
+  step?: number;
+  options?: FieldOptions;
+  placeholder?: string;
+  description?: string;
+  required?: boolean;
+  /** Shown instead of the generic message when a required field is empty. */
+  requiredMessage?: string;
+  disabled?: boolean;
+  rows?: number;
+  defaultValue?: FieldValue;
+  compute?: FieldCompute;
+  rules?: FieldRule[];
+
+  // Grid placement
+  x: number;
+  y: number;
+  colSpan?: number;
+}
+
+export interface FormDefinition {
+  id: string;
+  title: string;
+  submitLabel?: string;
+  fields: FieldDefinition[];
+}
+
+export type FieldValidator = (value: FieldValue, values: FormValues) => string | undefined;
+
+export interface CompiledField {
+  definition: FieldDefinition;
+  name: string;
+  /** Index into CompiledForm.rows. */
+  row: number;
+  schema: z.ZodType;
+  /** Raw control value -> typed value (number inputs report strings). */
+  parse: (raw: FieldValue) => FieldValue;
+  validate: FieldValidator;
+  compute?: (values: FormValues) => FieldValue;
+  /** Fields to recompute/revalidate when this one changes, in dependency order. */
+  dependents: string[];
+}
+
+export interface LayoutCell {
+  field: CompiledField | null;
+  span: number;
+}
+
+export interface LayoutRow {
+  /** Original y coordinate; stable React key. */
+  key: number;
+  cells: LayoutCell[];
+}
+
+export interface CompiledForm {
+  definition: FormDefinition;
+  fields: CompiledField[];
+  fieldsByName: Map<string, CompiledField>;
+  rows: LayoutRow[];
+  defaultValues: FormValues;
+  /** Computed fields in dependency order (initial values). */
+  computeOrder: string[];
+  /** Whole-form validation (submit), also usable as a react-hook-form resolver. */
+  resolver: Resolver<FormValues>;
+}
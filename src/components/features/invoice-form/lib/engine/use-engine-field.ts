@@ -0,0 +1,13 @@
+import { useCallback, useSyncExternalStore } from "react";
+
+import type { FormStore } from "./form-store";
+
+/** Value and visible error of one field; re-renders only when that field changes. */
+export function useEngineField(store: FormStore, name: string) {
+  const subscribe = useCallback((listener: () => void) => store.subscribe(name, listener), [store, name]);
+
+  const value = useSyncExternalStore(subscribe, () => store.getValue(name));
+  const error = useSyncExternalStore(subscribe, () => store.getError(name));
+
+  return { value, error };
+}
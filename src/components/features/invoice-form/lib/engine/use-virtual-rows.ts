@@ -0,0 +1,150 @@
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState, type RefObject } from "react";
+
+interface VirtualRowsOptions {
+  count: number;
+  scrollRef: RefObject<HTMLElement>;
+  /** Height assumed for rows that have not been measured yet. */
+  estimateHeight?: number;
+  /** Rows rendered above and below the viewport. */
+  overscan?: number;
+  enabled?: boolean;
+}
+
+interface RowRange {
+  start: number;
+  end: number;
+}
+
+/**
+ * Windowing for variable-height rows inside a scroll container. Rendered rows
+ * are measured with one shared ResizeObserver; the hook only re-renders when
+ * the visible range or a measured height changes.
+ */
+export function useVirtualRows({
+  count,
+  scrollRef,
+  estimateHeight = 96,
+  overscan = 4,
+  enabled = true,
+}: VirtualRowsOptions) {
+  const heightsRef = useRef<number[]>([]);
+  const observedRef = useRef(new Map<number, Element>());
+  const indexByElementRef = useRef(new WeakMap<Element, number>());
+  const observerRef = useRef<ResizeObserver | null>(null);
+  const [measureVersion, setMeasureVersion] = useState(0);
+  const [range, setRange] = useState<RowRange>({ start: 0, end: enabled ? Math.min(count, 20) : count });
+
+  // offsets[i] = top of row i, offsets[count] = total height
+  const offsets = useMemo(() => {
+    const result = new Float64Array(count + 1);
+    for (let i = 0; i < count; i++) {
+      result[i + 1] = result[i] + (heightsRef.current[i] ?? estimateHeight);
+    }
+    return result;
+    // measureVersion: heightsRef was updated
+  }, [count, estimateHeight, measureVersion]);
+
+  const offsetsRef = useRef(offsets);
+  offsetsRef.current = offsets;
+
+  const updateRange = useCallback(() => {
+    const element = scrollRef.current;
+    if (!enabled || !element) return;
+
+    const top = element.scrollTop;
+    const bottom = top + element.clientHeight;
+    const next = {
+      start: Math.max(0, findRow(offsetsRef.current, top) - overscan),
+      end: Math.min(count, findRow(offsetsRef.current, bottom) + 1 + overscan),
+    };
+
+    setRange((previous) => (previous.start === next.start && previous.end === next.end ? previous : next));
+  }, [count, enabled, overscan, scrollRef]);
+
+  // Measurements changed -> rows moved
+  useLayoutEffect(updateRange, [offsets, updateRange]);
+
+  useEffect(() => {
+    const element = scrollRef.current;
+    if (!enabled || !element) return;
+
+    const resizeObserver = new ResizeObserver(updateRange);
+    resizeObserver.observe(element);
+    element.addEventListener("scroll", updateRange, { passive: true });
+
+    return () => {
+      resizeObserver.disconnect();
+      element.removeEventListener("scroll", updateRange);
+    };
+  }, [enabled, scrollRef, updateRange]);
+
+  useEffect(() => () => observerRef.current?.disconnect(), []);
+
+  // Ref callback per row: (index, element | null)
+  const measureRow = useCallback(
+    (index: number, element: Element | null) => {
+      if (!enabled) return;
+
+      const observer = (observerRef.current ??= new ResizeObserver((entries) => {
+        let changed = false;
+        entries.forEach((entry) => {
+          const rowIndex = indexByElementRef.current.get(entry.target);
+          if (rowIndex === undefined) return;
+
+          const height = entry.borderBoxSize?.[0]?.blockSize ?? (entry.target as HTMLElement).offsetHeight;
+          if (heightsRef.current[rowIndex] !== height) {
+            heightsRef.current[rowIndex] = height;
+            changed = true;
+          }
+        });
+        if (changed) setMeasureVersion((version) => version + 1);
+      }));
+
+      const previous = observedRef.current.get(index);
+      if (previous && previous !== element) {
+        observer.unobserve(previous);
+        observedRef.current.delete(index);
+      }
+      if (element) {
+        indexByElementRef.current.set(element, index);
+        observedRef.current.set(index, element);
+        observer.observe(element);
+      }
+    },
+    [enabled]
+  );
+
+  const scrollToRow = useCallback(
+    (index: number) => {
+      const element = scrollRef.current;
+      if (element) element.scrollTop = offsetsRef.current[Math.min(index, count)];
+    },
+    [count, scrollRef]
+  );
+
+  const start = enabled ? Math.min(range.start, count) : 0;
+  const end = enabled ? Math.min(range.end, count) : count;
+
+  return {
+    start,
+    end,
+    paddingTop: enabled ? offsets[start] : 0,
+    paddingBottom: enabled ? offsets[count] - offsets[end] : 0,
+    measureRow,
+    scrollToRow,
+  };
+}
+
+// Index of the row containing `position` (binary search over row offsets)
+function findRow(offsets: Float64Array, position: number): number {
+  let low = 0;
+  let high = offsets.length - 2;
+
+  while (low < high) {
+    const middle = (low + high + 1) >> 1;
+    if (offsets[middle] <= position) low = middle;
+    else high = middle - 1;
+  }
+
+  return Math.max(0, low);
+}
@@ -0,0 +1,74 @@
+import { abortable } from "./abort";
+import type { AsyncOptionSourceConfig, OptionItem, OptionResults, OptionSource } from "./types";
+
+const DEFAULT_PAGE_SIZE = 50;
+const DEFAULT_DEBOUNCE_MS = 250;
+
+/**
+ * Options loaded page by page from a server (e.g. a PostgREST range query).
+ * Searches are debounced by the controls and cancelled through the signal;
+ * labels of loaded items are remembered for the trigger.
+ */
+export function createAsyncOptionSource({
+  load,
+  resolveLabel,
+  pageSize = DEFAULT_PAGE_SIZE,
+  debounceMs = DEFAULT_DEBOUNCE_MS,
+}: AsyncOptionSourceConfig): OptionSource {
+  const labels = new Map<string, string>();
+
+  const remember = (items: OptionItem[]) => items.forEach((item) => labels.set(item.value, item.label));
+
+  const search = async (text: string, signal: AbortSignal): Promise<OptionResults> => {
+    const pages = new Map<number, OptionItem[]>();
+    const loading = new Map<number, Promise<void>>();
+    let total = 0;
+
+    const loadPage = (page: number, pageSignal: AbortSignal): Promise<void> => {
+      if (pages.has(page)) return Promise.resolve();
+
+      let request = loading.get(page);
+      if (!request) {
+        request = abortable(load({ text, offset: page * pageSize, limit: pageSize }, pageSignal), pageSignal)
+          .then((result) => {
+            pages.set(page, result.items);
+            remember(result.items);
+            total = result.total;
+          })
+          .finally(() => loading.delete(page));
+        loading.set(page, request);
+      }
+      return request;
+    };
+
+    await loadPage(0, signal);
+
+    return {
+      get total() {
+        return total;
+      },
+      getItem: (index) => pages.get(Math.floor(index / pageSize))?.[index % pageSize],
+      loadRange: async (start, end, rangeSignal) => {
+        const requests: Promise<void>[] = [];
+        for (let page = Math.floor(start / pageSize); page * pageSize < Math.min(end, total); page++) {
+          requests.push(loadPage(page, rangeSignal));
+        }
+        await Promise.all(requests);
+      },
+    };
+  };
+
+  return {
+    kind: "async",
+    debounceMs,
+    search,
+    getLabel: (value) => labels.get(value),
+    resolveLabel: resolveLabel
+      ? async (value, signal) => {
+          const label = await abortable(resolveLabel(value, signal), signal);
+          if (label !== undefined) labels.set(value, label);
+          return label;
+        }
+      : undefined,
+  };
+}
@@ -0,0 +1,6 @@
+export * from "./types";
+export * from "./search-index";
+export * from "./memory-source";
+export * from "./async-source";
+export * from "./resolve-source";
+export * from "./use-option-search";
@@ -0,0 +1,109 @@
+import { abortable } from "./abort";
+import { buildSearchIndex, searchIndex, type SearchIndex } from "./search-index";
+import type { SearchWorkerRequest, SearchWorkerResponse } from "./search-index.worker";
+import type { OptionItem, OptionList, OptionResults, OptionSource } from "./types";
+
+// Below this the index is built and queried on the main thread (well under a frame)
+const WORKER_MIN_OPTIONS = 2000;
+
+let worker: Worker | null = null;
+let nextSourceId = 0;
+let nextRequestId = 0;
+const pendingSearches = new Map<number, (matches: Int32Array | null) => void>();
+
+// Sources are shared per list reference (resolve-source) with no owner to
+// dispose them; the worker index goes when the source is collected
+const workerIndexRegistry =
+  typeof FinalizationRegistry === "undefined"
+    ? null
+    : new FinalizationRegistry<number>((sourceId) => disposeWorkerIndex(sourceId));
+
+// One worker holds the indexes of all large option lists
+function getSearchWorker(): Worker | null {
+  if (worker || typeof Worker === "undefined") return worker;
+
+  worker = new Worker(new URL("./search-index.worker.ts", import.meta.url), { type: "module" });
+  worker.onmessage = (event: MessageEvent<SearchWorkerResponse>) => {
+    const { requestId, matches } = event.data;
+    pendingSearches.get(requestId)?.(matches);
+    pendingSearches.delete(requestId);
+  };
+  return worker;
+}
+
+function disposeWorkerIndex(sourceId: number) {
+  const request: SearchWorkerRequest = { type: "dispose", sourceId };
+  worker?.postMessage(request);
+}
+
+export function toOptionItems(options: OptionList): OptionItem[] {
+  return options.map((option) => (typeof option === "string" ? { value: option, label: option } : option));
+}
+
+/**
+ * In-memory options: value -> label is a prebuilt map, search runs against a
+ * prefix/trigram index. Lists of WORKER_MIN_OPTIONS and more are indexed in a
+ * Web Worker, starting in idle time after creation (about a second for 100k
+ * labels); searches posted before it is done queue behind the build. The
+ * index is freed on `dispose()` or once the source is garbage collected.
+ */
+export function createMemoryOptionSource(options: OptionList): OptionSource {
+  const items = toOptionItems(options);
+  const labels = new Map(items.map((item) => [item.value, item.label]));
+  const sourceId = nextSourceId++;
+  let localIndex: SearchIndex | null = null;
+  let workerIndexed = false;
+
+  const toResults = (matches: Int32Array | null): OptionResults =>
+    matches
+      ? { total: matches.length, getItem: (index) => items[matches[index]] }
+      : { total: items.length, getItem: (index) => items[index] };
+
+  const searchWorker = items.length >= WORKER_MIN_OPTIONS ? getSearchWorker() : null;
+
+  const buildWorkerIndex = () => {
+    if (workerIndexed || !searchWorker) return;
+    workerIndexed = true;
+    workerIndexRegistry?.register(source, sourceId, source);
+    const request: SearchWorkerRequest = { type: "build", sourceId, labels: items.map((item) => item.label) };
+    searchWorker.postMessage(request);
+  };
+
+  if (searchWorker) {
+    if (typeof requestIdleCallback === "function") requestIdleCallback(buildWorkerIndex, { timeout: 1000 });
+    else setTimeout(buildWorkerIndex, 0);
+  }
+
+  const query = (text: string): Promise<Int32Array | null> => {
+    if (!searchWorker) {
+      localIndex ??= buildSearchIndex(items.map((item) => item.label));
+      return Promise.resolve(searchIndex(localIndex, text));
+    }
+
+    buildWorkerIndex();
+    if (!text.trim()) return Promise.resolve(null);
+
+    const requestId = nextRequestId++;
+    const request: SearchWorkerRequest = { type: "search", sourceId, requestId, text };
+    return new Promise((resolve) => {
+      pendingSearches.set(requestId, resolve);
+      searchWorker.postMessage(request);
+    });
+  };
+
+  const source: OptionSource = {
+    kind: "memory",
+    debounceMs: 0,
+    getLabel: (value) => labels.get(value),
+    search: (text, signal) => abortable(query(text), signal).then(toResults),
+    dispose: () => {
+      localIndex = null;
+      if (!workerIndexed) return;
+      workerIndexed = false;
+      workerIndexRegistry?.unregister(source);
+      disposeWorkerIndex(sourceId);
+    },
+  };
+
+  return source;
+}
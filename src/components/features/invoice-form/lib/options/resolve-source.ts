@@ -0,0 +1,20 @@
+import { createMemoryOptionSource } from "./memory-source";
+import type { OptionList, OptionSource, OptionsInput } from "./types";
+
+// One source (and index) per list - definition JSON and constants are stable references
+const sourceCache = new WeakMap<OptionList, OptionSource>();
+
+export function isOptionSource(options: OptionsInput | undefined): options is OptionSource {
+  return options !== undefined && !Array.isArray(options);
+}
+
+export function resolveOptionSource(options: OptionsInput): OptionSource {
+  if (isOptionSource(options)) return options;
+
+  let source = sourceCache.get(options);
+  if (!source) {
+    source = createMemoryOptionSource(options);
+    sourceCache.set(options, source);
+  }
+  return source;
+}
@@ -0,0 +1,169 @@
+// Pure index code - runs in the search worker and, for short lists, on the main thread
+
+export interface SearchIndex {
+  /** Normalized labels, by item index. */
+  texts: string[];
+  /** Distinct words of all labels, sorted - prefix lookups are a binary search. */
+  words: string[];
+  /** Ascending item indices for each entry of `words`. */
+  wordItems: Int32Array[];
+  /** Trigram key (see trigramKey) -> ascending item indices containing it. */
+  trigrams: Map<number, Int32Array>;
+}
+
+// Tokens shorter than this match word prefixes instead of substrings
+const TRIGRAM_LENGTH = 3;
+
+const WORD_SEPARATOR = /[^\p{L}\p{N}]+/u;
+const NON_ASCII = /[^\x00-\x7f]/;
+
+// Lowercase, without diacritics ("Müller" finds "muller" and "müller" alike)
+export function normalizeText(text: string): string {
+  return NON_ASCII.test(text)
+    ? text.normalize("NFD").replace(/[\u0300-\u036f]/g, "").toLowerCase()
+    : text.toLowerCase();
+}
+
+export function buildSearchIndex(labels: string[]): SearchIndex {
+  const texts = labels.map(normalizeText);
+  const itemsByWord = new Map<string, number[]>();
+  const postings = new Map<number, number[]>();
+
+  texts.forEach((text, item) => {
+    text.split(WORD_SEPARATOR).forEach((word) => word && add(itemsByWord, word, item));
+
+    // Rolling key over three UTF-16 code units - numbers hash much faster than strings
+    let key = text.charCodeAt(0) * 0x10000 + text.charCodeAt(1);
+    for (let i = TRIGRAM_LENGTH - 1; i < text.length; i++) {
+      key = (key % 0x100000000) * 0x10000 + text.charCodeAt(i);
+      add(postings, key, item);
+    }
+  });
+
+  const words = [...itemsByWord.keys()].sort();
+  const trigrams = new Map<number, Int32Array>();
+  postings.forEach((list, key) => trigrams.set(key, Int32Array.from(list)));
+
+  return {
+    texts,
+    words,
+    wordItems: words.map((word) => Int32Array.from(itemsByWord.get(word)!)),
+    trigrams,
+  };
+}
+
+// Items are visited in order, so a repeat can only be the last entry of a list
+function add<K>(map: Map<K, number[]>, key: K, item: number) {
+  const list = map.get(key);
+  if (!list) map.set(key, [item]);
+  else if (list[list.length - 1] !== item) list.push(item);
+}
+
+function trigramKey(text: string, at: number): number {
+  return (text.charCodeAt(at) * 0x10000 + text.charCodeAt(at + 1)) * 0x10000 + text.charCodeAt(at + 2);
+}
+
+/**
+ * Item indices matching every token of `query`, best first: label starts with
+ * the first token, then all tokens at word starts, then plain substring
+ * matches; ties keep the original option order. `null` means "no filter".
+ */
+export function searchIndex(index: SearchIndex, query: string): Int32Array | null {
+  const tokens = normalizeText(query).split(/\s+/).filter(Boolean);
+  if (tokens.length === 0) return null;
+
+  // Narrow with the most selective token, then verify all tokens on the survivors
+  let candidates: Int32Array | null = null;
+  for (const token of tokens) {
+    const matches = token.length < TRIGRAM_LENGTH ? prefixCandidates(index, token) : trigramCandidates(index, token);
+    if (!candidates || matches.length < candidates.length) candidates = matches;
+    if (candidates.length === 0) return candidates;
+  }
+
+  const buckets: number[][] = [[], [], []];
+  candidates!.forEach((item) => {
+    const text = index.texts[item];
+    let atWordStarts = true;
+
+    for (const token of tokens) {
+      const position = findWordStart(text, token);
+      if (position === -1) atWordStarts = false;
+      if (position === -1 && (token.length < TRIGRAM_LENGTH || !text.includes(token))) return;
+    }
+
+    buckets[text.startsWith(tokens[0]) ? 0 : atWordStarts ? 1 : 2].push(item);
+  });
+
+  const ranked = new Int32Array(buckets[0].length + buckets[1].length + buckets[2].length);
+  ranked.set(buckets[0]);
+  ranked.set(buckets[1], buckets[0].length);
+  ranked.set(buckets[2], buckets[0].length + buckets[1].length);
+  return ranked;
+}
+
+// Items with a word starting with `prefix`, ascending
+function prefixCandidates(index: SearchIndex, prefix: string): Int32Array {
+  const { words, wordItems, texts } = index;
+  let low = 0;
+  let high = words.length;
+  while (low < high) {
+    const middle = (low + high) >> 1;
+    if (words[middle] < prefix) low = middle + 1;
+    else high = middle;
+  }
+
+  const seen = new Uint8Array(texts.length);
+  let count = 0;
+  for (let i = low; i < words.length && words[i].startsWith(prefix); i++) {
+    wordItems[i].forEach((item) => {
+      if (seen[item]) return;
+      seen[item] = 1;
+      count++;
+    });
+  }
+
+  const result = new Int32Array(count);
+  for (let item = 0, next = 0; next < count; item++) {
+    if (seen[item]) result[next++] = item;
+  }
+  return result;
+}
+
+// Items containing every trigram of `token` (a superset of the substring matches)
+function trigramCandidates(index: SearchIndex, token: string): Int32Array {
+  const lists: Int32Array[] = [];
+  for (let i = 0; i + TRIGRAM_LENGTH <= token.length; i++) {
+    const list = index.trigrams.get(trigramKey(token, i));
+    if (!list) return new Int32Array(0);
+    lists.push(list);
+  }
+  lists.sort((a, b) => a.length - b.length);
+
+  let result = lists[0];
+  for (let i = 1; i < lists.length && result.length > 0; i++) {
+    result = intersect(result, lists[i]);
+  }
+  return result;
+}
+
+function intersect(a: Int32Array, b: Int32Array): Int32Array {
+  const result = new Int32Array(Math.min(a.length, b.length));
+  let count = 0;
+  for (let i = 0, j = 0; i < a.length && j < b.length; ) {
+    if (a[i] === b[j]) {
+      result[count++] = a[i];
+      i++;
+      j++;
+    } else if (a[i] < b[j]) i++;
+    else j++;
+  }
+  return result.subarray(0, count);
+}
+
+// Position of `token` at the start of a word in `text`, or -1
+function findWordStart(text: string, token: string): number {
+  for (let position = text.indexOf(token); position !== -1; position = text.indexOf(token, position + 1)) {
+    if (position === 0 || WORD_SEPARATOR.test(text[position - 1])) return position;
+  }
+  return -1;
+}
@@ -0,0 +1,36 @@
+import { buildSearchIndex, searchIndex, type SearchIndex } from "./search-index";
+
+export type SearchWorkerRequest =
+  | { type: "build"; sourceId: number; labels: string[] }
+  | { type: "search"; sourceId: number; requestId: number; text: string }
+  | { type: "dispose"; sourceId: number };
+
+export interface SearchWorkerResponse {
+  requestId: number;
+  /** Ranked item indices; `null` = every item in original order. */
+  matches: Int32Array | null;
+}
+
+// One index per memory option source, dropped on "dispose"; messages are
+// handled in order, so a search posted right after "build" waits for the index
+const indexes = new Map<number, SearchIndex>();
+
+self.onmessage = (event: MessageEvent<SearchWorkerRequest>) => {
+  const request = event.data;
+
+  if (request.type === "build") {
+    indexes.set(request.sourceId, buildSearchIndex(request.labels));
+    return;
+  }
+
+  if (request.type === "dispose") {
+    indexes.delete(request.sourceId);
+    return;
+  }
+
+  const index = indexes.get(request.sourceId);
+  const matches = index ? searchIndex(index, request.text) : null;
+  const response: SearchWorkerResponse = { requestId: request.requestId, matches };
+  // Transfer, not copy: a broad query on 100k options matches most of them
+  self.postMessage(response, { transfer: matches ? [matches.buffer] : [] });
+};
@@ -0,0 +1,49 @@
+export interface OptionItem {
+  value: string;
+  label: string;
+}
+
+/** Inline option lists as written in form definitions. */
+export type OptionList = string[] | OptionItem[];
+
+/**
+ * Results of one search. Items are read by index so only the rendered window
+ * is materialized; async sources fill pages on demand via `loadRange`.
+ */
+export interface OptionResults {
+  total: number;
+  /** `undefined` while the page holding `index` has not been loaded. */
+  getItem: (index: number) => OptionItem | undefined;
+  /** Loads the pages covering [start, end). Absent when all items are in memory. */
+  loadRange?: (start: number, end: number, signal: AbortSignal) => Promise<void>;
+}
+
+export interface OptionSource {
+  kind: "memory" | "async";
+  /** Delay between the last keystroke and the search. */
+  debounceMs: number;
+  /** Rejects with an AbortError once `signal` is aborted. */
+  search: (text: string, signal: AbortSignal) => Promise<OptionResults>;
+  /** Label of a value, from the prebuilt map (memory) or items seen so far (async). */
+  getLabel: (value: string) => string | undefined;
+  /** Label of a value that has not been seen yet (async sources only). */
+  resolveLabel?: (value: string, signal: AbortSignal) => Promise<string | undefined>;
+  /** Frees the search index now instead of when the source is garbage collected; a later search rebuilds it. */
+  dispose?: () => void;
+}
+
+/** What the controls accept: an inline list or a source. */
+export type OptionsInput = OptionList | OptionSource;
+
+export interface AsyncOptionPage {
+  items: OptionItem[];
+  /** Number of matches for the query across all pages. */
+  total: number;
+}
+
+export interface AsyncOptionSourceConfig {
+  load: (query: { text: string; offset: number; limit: number }, signal: AbortSignal) => Promise<AsyncOptionPage>;
+  resolveLabel?: (value: string, signal: AbortSignal) => Promise<string | undefined>;
+  pageSize?: number;
+  debounceMs?: number;
+}
@@ -0,0 +1,95 @@
+import { useCallback, useEffect, useMemo, useRef, useState } from "react";
+
+import { isAbortError } from "./abort";
+import { resolveOptionSource } from "./resolve-source";
+import type { OptionResults, OptionSource, OptionsInput } from "./types";
+
+interface OptionSearchState {
+  /** Results of the last finished search; kept while the next one runs. */
+  results: OptionResults | null;
+  loading: boolean;
+  error: boolean;
+}
+
+export function useOptionSource(options: OptionsInput): OptionSource {
+  return useMemo(() => resolveOptionSource(options), [options]);
+}
+
+/**
+ * Searches `source` for `text` while mounted (the popover is open). Each
+ * keystroke aborts the previous search; async sources wait `debounceMs` first.
+ * `loadRange` fills the pages of the rendered window and bumps `version`.
+ */
+export function useOptionSearch(source: OptionSource, text: string) {
+  const [state, setState] = useState<OptionSearchState>({ results: null, loading: false, error: false });
+  const [version, setVersion] = useState(0);
+  const controllerRef = useRef<AbortController | null>(null);
+
+  useEffect(() => {
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    setState((previous) => (previous.loading ? previous : { ...previous, loading: true }));
+
+    const run = () =>
+      source.search(text, controller.signal).then(
+        (results) => setState({ results, loading: false, error: false }),
+        (error) => {
+          if (!isAbortError(error)) setState((previous) => ({ ...previous, loading: false, error: true }));
+        }
+      );
+
+    if (source.debounceMs <= 0) {
+      run();
+      return () => controller.abort();
+    }
+
+    const timer = window.setTimeout(run, source.debounceMs);
+    return () => {
+      window.clearTimeout(timer);
+      controller.abort();
+    };
+  }, [source, text]);
+
+  const { results } = state;
+
+  const loadRange = useCallback(
+    (start: number, end: number) => {
+      const controller = controllerRef.current;
+      if (!results?.loadRange || !controller) return;
+
+      for (let index = start; index < Math.min(end, results.total); index++) {
+        if (results.getItem(index)) continue;
+        results.loadRange(index, end, controller.signal).then(
+          () => setVersion((current) => current + 1),
+          (error) => {
+            if (!isAbortError(error)) setState((previous) => ({ ...previous, error: true }));
+          }
+        );
+        return;
+      }
+    },
+    [results]
+  );
+
+  return { ...state, version, loadRange };
+}
+
+/** Label for the trigger: prebuilt/remembered label, else resolved by the source. */
+export function useOptionLabel(source: OptionSource, value: string | undefined): string | undefined {
+  const known = value ? source.getLabel(value) : undefined;
+  const [resolved, setResolved] = useState<{ value: string; label: string | undefined } | null>(null);
+
+  useEffect(() => {
+    if (!value || known !== undefined || !source.resolveLabel) return;
+
+    const controller = new AbortController();
+    source.resolveLabel(value, controller.signal).then(
+      (label) => setResolved({ value, label }),
+      () => undefined
+    );
+    return () => controller.abort();
+  }, [source, value, known]);
+
+  if (!value) return undefined;
+  return known ?? (resolved?.value === value ? resolved.label : undefined) ?? value;
+}
@@ -6,6 +6,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 
 // Types
 import type { LocationFilter } from "@/shared/lib/form-validation";
+import type { JobLocationCounts } from "@/shared/services/content";
 
 // Hooks
 
@@ -24,9 +25,11 @@ import type { LocationFilter } from "@/shared/lib/form-validation";
 export interface JobFilterProps {
   selectedLocation: LocationFilter;
   onLocationChange: (location: LocationFilter) => void;
+  /** Open positions per location; labels show the count once loaded. */
+  locationCounts?: JobLocationCounts;
 }
 
-export function JobFilter({ selectedLocation, onLocationChange }: JobFilterProps) {
+export function JobFilter({ selectedLocation, onLocationChange, locationCounts }: JobFilterProps) {
   // Hooks
 
   // Translations
@@ -63,7 +66,7 @@ export function JobFilter({ selectedLocation, onLocationChange }: JobFilterProps
         <SelectContent>
           {locationOptions.map((option) => (
             <SelectItem key={option.value} value={option.value}>
-              {option.label}
+              {locationCounts ? `${option.label} (${locationCounts[option.value] ?? 0})` : option.label}
             </SelectItem>
           ))}
         </SelectContent>
@@ -0,0 +1,111 @@
+// Types
+interface CachedPage {
+  bitmap: ImageBitmap;
+  scale: number;
+  bytes: number;
+}
+
+// Constants
+const DEFAULT_CACHE_LIMIT_BYTES = 96 * 1024 * 1024; // ~96MB of RGBA pixels
+
+// Module state
+// Map iteration order = LRU order (oldest first); touched entries are re-inserted.
+const entries = new Map<string, CachedPage>();
+// "<url>#<page>" -> cache keys of all scales rendered for that page
+const pageIndex = new Map<string, Set<string>>();
+let cacheLimitBytes = DEFAULT_CACHE_LIMIT_BYTES;
+let cachedBytes = 0;
+
+// Service: Look up an exact render
+export function getCachedPage(url: string, page: number, scale: number): ImageBitmap | null {
+  const key = toKey(url, page, scale);
+  const entry = entries.get(key);
+  if (!entry) return null;
+
+  entries.delete(key);
+  entries.set(key, entry);
+  return entry.bitmap;
+}
+
+// Service: Best available render of a page at any zoom level
+// Prefers the smallest scale >= target, otherwise the largest below it.
+export function findClosestCachedPage(
+  url: string,
+  page: number,
+  scale: number
+): { bitmap: ImageBitmap; scale: number } | null {
+  const keys = pageIndex.get(toPageKey(url, page));
+  if (!keys) return null;
+
+  let best: CachedPage | null = null;
+  for (const key of keys) {
+    const entry = entries.get(key);
+    if (!entry) continue;
+
+    const isBetter = !best
+      || (entry.scale >= scale && (best.scale < scale || entry.scale < best.scale))
+      || (entry.scale < scale && best.scale < scale && entry.scale > best.scale);
+    if (isBetter) best = entry;
+  }
+
+  return best ? { bitmap: best.bitmap, scale: best.scale } : null;
+}
+
+// Service: Store a render and evict least recently used entries over the cap
+export function setCachedPage(url: string, page: number, scale: number, bitmap: ImageBitmap): void {
+  const key = toKey(url, page, scale);
+  removeEntry(key);
+
+  const bytes = bitmap.width * bitmap.height * 4;
+  entries.set(key, { bitmap, scale, bytes });
+  cachedBytes += bytes;
+
+  const pageKey = toPageKey(url, page);
+  if (!pageIndex.has(pageKey)) pageIndex.set(pageKey, new Set());
+  pageIndex.get(pageKey)!.add(key);
+
+  for (const oldestKey of entries.keys()) {
+    if (cachedBytes <= cacheLimitBytes || oldestKey === key) break;
+    removeEntry(oldestKey);
+  }
+}
+
+// Service: Drop every render of a document
+export function evictCachedDocument(url: string): void {
+  [...entries.keys()]
+    .filter((key) => key.startsWith(`${url}#`))
+    .forEach(removeEntry);
+}
+
+// Service: Adjust the memory cap (shared by all viewers)
+export function setPageCacheLimit(bytes: number): void {
+  cacheLimitBytes = bytes;
+
+  for (const oldestKey of entries.keys()) {
+    if (cachedBytes <= cacheLimitBytes) break;
+    removeEntry(oldestKey);
+  }
+}
+
+// Helper: Remove entry and free its bitmap
+function removeEntry(key: string): void {
+  const entry = entries.get(key);
+  if (!entry) return;
+
+  entries.delete(key);
+  cachedBytes -= entry.bytes;
+  entry.bitmap.close();
+
+  const pageKey = key.slice(0, key.lastIndexOf("@"));
+  const keys = pageIndex.get(pageKey);
+  keys?.delete(key);
+  if (keys?.size === 0) pageIndex.delete(pageKey);
+}
+
+function toPageKey(url: string, page: number): string {
+  return `${url}#${page}`;
+}
+
+function toKey(url: string, page: number, scale: number): string {
+  return `${toPageKey(url, page)}@${scale.toFixed(3)}`;
+}
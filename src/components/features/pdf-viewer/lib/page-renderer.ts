@@ -0,0 +1,111 @@
+// External Libraries
+import type { PDFDocumentProxy } from "pdfjs-dist";
+
+// Local Module
+import { getCachedPage, setCachedPage } from "./page-render-cache";
+
+// Types
+export interface PageRenderRequest {
+  pdfDocument: PDFDocumentProxy;
+  url: string;
+  page: number; // 0-based
+  scale: number; // device pixels per PDF unit
+  priority: number; // lower runs first
+  signal: AbortSignal;
+}
+
+export interface PageSize {
+  width: number;
+  height: number;
+}
+
+interface QueuedRender extends PageRenderRequest {
+  resolve: (bitmap: ImageBitmap | null) => void;
+  reject: (error: unknown) => void;
+}
+
+// Constants
+// pdf.js renders on the main thread after parsing in the worker; two at a
+// time keeps the worker busy without starving input handling.
+const MAX_CONCURRENT_RENDERS = 2;
+
+// Module state
+const queue: QueuedRender[] = [];
+let activeRenders = 0;
+
+// Service: Rasterize a page (cached), resolves null when aborted
+export function renderPage(request: PageRenderRequest): Promise<ImageBitmap | null> {
+  const cached = getCachedPage(request.url, request.page, request.scale);
+  if (cached) return Promise.resolve(cached);
+
+  return new Promise((resolve, reject) => {
+    queue.push({ ...request, resolve, reject });
+    queue.sort((a, b) => a.priority - b.priority);
+    pumpQueue();
+  });
+}
+
+// Service: Unscaled page size (PDF units)
+export async function getPageSize(pdfDocument: PDFDocumentProxy, page: number): Promise<PageSize> {
+  const pdfPage = await pdfDocument.getPage(page + 1);
+  const viewport = pdfPage.getViewport({ scale: 1 });
+  return { width: viewport.width, height: viewport.height };
+}
+
+// Helper: Start queued renders up to the concurrency limit
+function pumpQueue(): void {
+  while (activeRenders < MAX_CONCURRENT_RENDERS && queue.length > 0) {
+    const job = queue.shift()!;
+
+    if (job.signal.aborted) {
+      job.resolve(null);
+      continue;
+    }
+
+    activeRenders++;
+    runRender(job)
+      .then(job.resolve, job.reject)
+      .finally(() => {
+        activeRenders--;
+        pumpQueue();
+      });
+  }
+}
+
+async function runRender(job: QueuedRender): Promise<ImageBitmap | null> {
+  // Another request may have produced it while this one was queued
+  const cached = getCachedPage(job.url, job.page, job.scale);
+  if (cached) return cached;
+
+  const pdfPage = await job.pdfDocument.getPage(job.page + 1);
+  if (job.signal.aborted) return null;
+
+  const viewport = pdfPage.getViewport({ scale: job.scale });
+  const canvas = document.createElement("canvas");
+  canvas.width = Math.ceil(viewport.width);
+  canvas.height = Math.ceil(viewport.height);
+
+  const canvasContext = canvas.getContext("2d", { alpha: false });
+  if (!canvasContext) return null;
+
+  const renderTask = pdfPage.render({ canvasContext, viewport });
+  const handleAbort = () => renderTask.cancel();
+  job.signal.addEventListener("abort", handleAbort, { once: true });
+
+  try {
+    await renderTask.promise;
+  } catch (error) {
+    if (job.signal.aborted) return null;
+    throw error;
+  } finally {
+    job.signal.removeEventListener("abort", handleAbort);
+  }
+
+  const bitmap = await createImageBitmap(canvas);
+  // Release the backing store right away instead of waiting for GC
+  canvas.width = 0;
+  canvas.height = 0;
+
+  setCachedPage(job.url, job.page, job.scale, bitmap);
+  return bitmap;
+}
@@ -0,0 +1,66 @@
+// External Libraries
+import { GlobalWorkerOptions, PDFWorker, getDocument, type PDFDocumentProxy } from "pdfjs-dist";
+import pdfWorkerUrl from "pdfjs-dist/build/pdf.worker.min.js?url";
+
+// Local Module
+import { evictCachedDocument } from "./page-render-cache";
+
+// Types
+interface DocumentEntry {
+  promise: Promise<PDFDocumentProxy>;
+  refCount: number;
+}
+
+// Constants
+const RANGE_CHUNK_SIZE = 128 * 1024; // 128KB per HTTP range request
+
+// Module state
+let sharedWorker: PDFWorker | null = null;
+const openDocuments = new Map<string, DocumentEntry>();
+
+// Service: One pdf.js worker for all viewer instances
+export function getSharedPdfWorker(): PDFWorker {
+  if (!sharedWorker) {
+    GlobalWorkerOptions.workerSrc = pdfWorkerUrl;
+    sharedWorker = new PDFWorker({ name: "pacon-pdf-worker" });
+  }
+  return sharedWorker;
+}
+
+// Service: Open a document via HTTP range requests (shared per URL, ref-counted)
+// disableStream/disableAutoFetch keep pdf.js from pulling the whole file:
+// only the byte ranges of pages that are actually rendered are fetched.
+export function acquirePdfDocument(url: string): Promise<PDFDocumentProxy> {
+  const existing = openDocuments.get(url);
+  if (existing) {
+    existing.refCount++;
+    return existing.promise;
+  }
+
+  const promise = getDocument({
+    url,
+    worker: getSharedPdfWorker(),
+    rangeChunkSize: RANGE_CHUNK_SIZE,
+    disableStream: true,
+    disableAutoFetch: true,
+  }).promise;
+
+  promise.catch(() => openDocuments.delete(url));
+  openDocuments.set(url, { promise, refCount: 1 });
+
+  return promise;
+}
+
+// Service: Release a document; destroyed when the last viewer lets go
+export function releasePdfDocument(url: string): void {
+  const entry = openDocuments.get(url);
+  if (!entry) return;
+
+  entry.refCount--;
+  if (entry.refCount > 0) return;
+
+  openDocuments.delete(url);
+  evictCachedDocument(url);
+  // The shared worker survives - it was passed in explicitly
+  entry.promise.then((pdfDocument) => pdfDocument.destroy()).catch(() => undefined);
+}
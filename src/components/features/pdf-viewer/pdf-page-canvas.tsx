@@ -0,0 +1,136 @@
+//###--------------------------------------------------------IMPORTS-----------------------------------------------------------------------##
+//#region IMPORTS
+//#region Core/Libs
+
+//  React Core
+import { memo, useEffect, useRef } from "react";
+
+//  External Libraries
+import type { PDFDocumentProxy } from "pdfjs-dist";
+//#endregion
+
+//#region Local Module (in-feature-only-ordered-by-hierachie)
+import { findClosestCachedPage } from "./lib/page-render-cache";
+import { getPageSize, renderPage, type PageSize } from "./lib/page-renderer";
+//#endregion
+
+//#endregion
+//###--------------------------------------------------------IMPORTS-----------------------------------------------------------------------##
+
+//###--------------------------------------------------------INTERFACE-----------------------------------------------------------------------##
+//#region Interfaces
+// Component Props
+interface PdfPageCanvasProps {
+  pdfDocument: PDFDocumentProxy;
+  fileUrl: string;
+  page: number; // 0-based
+  scale: number; // CSS zoom
+  top: number;
+  width: number;
+  height: number;
+  thumbnailOnly: boolean;
+  priority: number;
+  onPageSize: (page: number, size: PageSize) => void;
+}
+//#endregion
+//###--------------------------------------------------------INTERFACE-----------------------------------------------------------------------##
+
+//#region Constants
+const THUMBNAIL_SCALE = 0.25;
+//#endregion
+
+export const PdfPageCanvas = memo(function PdfPageCanvas({
+  pdfDocument,
+  fileUrl,
+  page,
+  scale,
+  top,
+  width,
+  height,
+  thumbnailOnly,
+  priority,
+  onPageSize,
+}: PdfPageCanvasProps) {
+  //###-------------------------COMPONENT LOGIC-----------------------------##
+  //#region COMPONENT LOGIC
+
+  //#region Hooks
+  const canvasRef = useRef<HTMLCanvasElement>(null);
+  // Read at enqueue time only - a changing priority must not restart renders
+  const priorityRef = useRef(priority);
+  priorityRef.current = priority;
+  //#endregion
+
+  //#region Computed Data
+  const pixelRatio = typeof window !== "undefined" ? window.devicePixelRatio || 1 : 1;
+  const renderScale = scale * pixelRatio;
+  //#endregion
+
+  //#region Effects
+  // Report the real page size once (layout starts from page 1 as estimate)
+  useEffect(() => {
+    let isActive = true;
+    getPageSize(pdfDocument, page).then((size) => {
+      if (isActive) onPageSize(page, size);
+    });
+    return () => {
+      isActive = false;
+    };
+  }, [pdfDocument, page, onPageSize]);
+
+  // Progressive paint: closest cached render -> thumbnail -> full resolution
+  useEffect(() => {
+    const canvas = canvasRef.current;
+    if (!canvas) return;
+
+    const abortController = new AbortController();
+    const { signal } = abortController;
+
+    canvas.width = Math.ceil(width * pixelRatio);
+    canvas.height = Math.ceil(height * pixelRatio);
+
+    const draw = (bitmap: ImageBitmap | null) => {
+      if (!bitmap || signal.aborted) return;
+      canvas.getContext("2d")?.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+    };
+
+    const closest = findClosestCachedPage(fileUrl, page, renderScale);
+    draw(closest?.bitmap ?? null);
+
+    if (closest?.scale === renderScale) {
+      return () => abortController.abort();
+    }
+
+    const request = { pdfDocument, url: fileUrl, page, signal };
+    const renderThumbnail = () =>
+      closest ? Promise.resolve(null) : renderPage({ ...request, scale: THUMBNAIL_SCALE, priority: priorityRef.current - 1000 });
+
+    renderThumbnail()
+      .then((thumbnail) => {
+        draw(thumbnail);
+        if (thumbnailOnly || signal.aborted) return null;
+        return renderPage({ ...request, scale: renderScale, priority: priorityRef.current });
+      })
+      .then(draw)
+      .catch((error) => console.error(`PDF page ${page + 1} render error:`, error));
+
+    return () => abortController.abort();
+  }, [pdfDocument, fileUrl, page, renderScale, width, height, pixelRatio, thumbnailOnly]);
+  //#endregion
+
+  //#endregion
+  //###-------------------------COMPONENT LOGIC-----------------------------##
+
+  //###-------------------------RETURN-----------------------------##
+  //#region RETURN
+  return (
+    <canvas
+      ref={canvasRef}
+      className="absolute left-1/2 -translate-x-1/2 bg-white shadow-md"
+      style={{ top, width, height }}
+      aria-label={`Seite ${page + 1}`}
+    />
+  );
+  //#endregion
+  //###-------------------------RETURN-----------------------------##
+});
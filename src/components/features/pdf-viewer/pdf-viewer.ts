@@ -0,0 +1,3 @@
+export { VirtualPdfViewer } from "./virtual-pdf-viewer";
+export type { VirtualPdfViewerProps } from "./virtual-pdf-viewer";
+export { setPageCacheLimit } from "./lib/page-render-cache";
@@ -0,0 +1,169 @@
+//###--------------------------------------------------------IMPORTS-----------------------------------------------------------------------##
+//#region IMPORTS
+//#region Core/Libs
+
+//  React Core
+import { useState } from "react";
+//#endregion
+
+//#region Components
+
+//Components - base (shadcn)
+import { Button } from "@/components/base/button";
+
+//#endregion
+
+//#region Icons
+import { ChevronLeft, ChevronRight, ScanEye, ZoomIn, ZoomOut } from "lucide-react";
+//#endregion
+
+//#endregion
+//###--------------------------------------------------------IMPORTS-----------------------------------------------------------------------##
+
+//###--------------------------------------------------------INTERFACE-----------------------------------------------------------------------##
+//#region Interfaces
+// Component Props
+interface VirtualPdfToolbarProps {
+  currentPage: number; // 0-based
+  numberOfPages: number;
+  scale: number;
+  autoZoom: boolean;
+  onJumpToPage: (page: number) => void;
+  onZoom: (scale: number) => void;
+  onAutoZoomToggle: () => void;
+}
+//#endregion
+//###--------------------------------------------------------INTERFACE-----------------------------------------------------------------------##
+
+//#region Constants
+const MIN_ZOOM = 0.1;
+const MAX_ZOOM = 3;
+const ZOOM_STEP = 0.1;
+//#endregion
+
+export function VirtualPdfToolbar({
+  currentPage,
+  numberOfPages,
+  scale,
+  autoZoom,
+  onJumpToPage,
+  onZoom,
+  onAutoZoomToggle,
+}: VirtualPdfToolbarProps) {
+  //###-------------------------COMPONENT LOGIC-----------------------------##
+  //#region COMPONENT LOGIC
+
+  //#region Hooks
+  const [isEditingPage, setIsEditingPage] = useState(false);
+  const [pageInput, setPageInput] = useState("");
+  //#endregion
+
+  //#region Computed Data
+  const zoomPercent = Math.round(scale * 100);
+  //#endregion
+
+  //#region Event Handlers
+  const commitPageInput = () => {
+    const page = parseInt(pageInput);
+    const targetPage = Number.isNaN(page) ? currentPage + 1 : Math.min(Math.max(page, 1), numberOfPages);
+    onJumpToPage(targetPage - 1);
+    setIsEditingPage(false);
+  };
+
+  const handleZoomBy = (delta: number) => () => {
+    onZoom(Math.min(Math.max(scale + delta, MIN_ZOOM), MAX_ZOOM));
+  };
+  //#endregion
+
+  //#endregion
+  //###-------------------------COMPONENT LOGIC-----------------------------##
+
+  //###-------------------------RETURN-----------------------------##
+  //#region RETURN
+  return (
+    <div className="w-full items-center gap-2 py-2 px-2 flex flex-row justify-between border-b bg-background">
+      {/* Page Navigation */}
+      <div className="flex flex-1 justify-start gap-1">
+        <Button
+          variant="outline"
+          size="sm"
+          onClick={() => onJumpToPage(currentPage - 1)}
+          disabled={currentPage <= 0}
+          className="h-8 w-8 p-0"
+        >
+          <ChevronLeft className="h-3 w-3" />
+        </Button>
+
+        {!isEditingPage ? (
+          <Button
+            variant="outline"
+            size="sm"
+            className="h-8 px-3"
+            onClick={() => {
+              setIsEditingPage(true);
+              setPageInput(String(currentPage + 1));
+            }}
+          >
+            {currentPage + 1} / {numberOfPages}
+          </Button>
+        ) : (
+          <input
+            type="number"
+            min={1}
+            max={numberOfPages}
+            value={pageInput}
+            autoFocus
+            onChange={(e) => setPageInput(e.target.value)}
+            onBlur={commitPageInput}
+            onKeyDown={(e) => {
+              if (e.key === "Enter") commitPageInput();
+            }}
+            className="h-8 w-16 px-2 text-center text-sm border rounded-md [appearance:textfield] [&::-webkit-outer-spin-button]:appearance-none [&::-webkit-inner-spin-button]:appearance-none"
+          />
+        )}
+
+        <Button
+          variant="outline"
+          size="sm"
+          onClick={() => onJumpToPage(currentPage + 1)}
+          disabled={currentPage >= numberOfPages - 1}
+          className="h-8 w-8 p-0"
+        >
+          <ChevronRight className="h-3 w-3" />
+        </Button>
+      </div>
+
+      {/* Seperator */}
+      <div className="mx-2 h-6 w-px bg-border" />
+
+      {/* Zoom */}
+      <div className="flex flex-1 justify-end items-center gap-1">
+        <Button
+          variant="default"
+          size={autoZoom ? "icon" : "sm"}
+          onClick={onAutoZoomToggle}
+          className={`h-8 px-3 border-2 ${
+            autoZoom
+              ? "border-green-700 bg-background text-green-700 font-bold bg-green-200"
+              : "border-red-700 bg-background text-red-700 font-bold bg-red-200"
+          }`}
+        >
+          <ScanEye />
+          {autoZoom ? "" : "Autozoom"}
+        </Button>
+
+        <Button variant="outline" size="sm" onClick={handleZoomBy(-ZOOM_STEP)} className="h-8 w-8 p-0">
+          <ZoomOut className="h-3 w-3" />
+        </Button>
+
+        <span className="text-xs font-medium min-w-[50px] text-center">{zoomPercent}%</span>
+
+        <Button variant="outline" size="sm" onClick={handleZoomBy(ZOOM_STEP)} className="h-8 w-8 p-0">
+          <ZoomIn className="h-3 w-3" />
+        </Button>
+      </div>
+    </div>
+  );
+  //#endregion
+  //###-------------------------RETURN-----------------------------##
+}
@@ -0,0 +1,300 @@
+//###--------------------------------------------------------IMPORTS-----------------------------------------------------------------------##
+//#region IMPORTS
+//#region Core/Libs
+
+//  React Core
+import { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from "react";
+
+//  External Libraries
+import type { PDFDocumentProxy } from "pdfjs-dist";
+//#endregion
+
+//#region Components
+
+//Components - base (shadcn)
+
+//Components - blocks (reusable UI)
+
+//Components - features (business logic)
+
+//#endregion
+
+//#region Local Module (in-feature-only-ordered-by-hierachie)
+import { VirtualPdfToolbar } from "./virtual-pdf-toolbar";
+import { PdfPageCanvas } from "./pdf-page-canvas";
+import { acquirePdfDocument, releasePdfDocument } from "./lib/pdf-document";
+import { setPageCacheLimit } from "./lib/page-render-cache";
+import { getPageSize, type PageSize } from "./lib/page-renderer";
+//#endregion
+
+//#endregion
+//###--------------------------------------------------------IMPORTS-----------------------------------------------------------------------##
+
+//###--------------------------------------------------------INTERFACE-----------------------------------------------------------------------##
+//#region Interfaces
+// Component Props
+export interface VirtualPdfViewerProps {
+  fileUrl: string;
+  /** Pages rendered above/below the viewport. */
+  bufferPages?: number;
+  /** Memory cap for rasterized pages, shared by all viewers. */
+  cacheLimitBytes?: number;
+  className?: string;
+}
+//#endregion
+//###--------------------------------------------------------INTERFACE-----------------------------------------------------------------------##
+
+//#region Constants
+const PAGE_GAP = 16;
+const PAGE_PADDING = 16;
+const FAST_SCROLL_VELOCITY = 2; // px per ms
+const SCROLL_SETTLE_MS = 150;
+//#endregion
+
+export function VirtualPdfViewer({
+  fileUrl,
+  bufferPages = 2,
+  cacheLimitBytes,
+  className = "",
+}: VirtualPdfViewerProps) {
+  //###-------------------------COMPONENT LOGIC-----------------------------##
+  //#region COMPONENT LOGIC
+
+  //#region Hooks
+  const containerRef = useRef<HTMLDivElement>(null);
+  const lastScrollRef = useRef({ top: 0, time: 0 });
+  const settleTimerRef = useRef<ReturnType<typeof setTimeout> | undefined>(undefined);
+  const scrollFrameRef = useRef<number | undefined>(undefined);
+  const previousScaleRef = useRef(1);
+
+  const [pdfDocument, setPdfDocument] = useState<PDFDocumentProxy | null>(null);
+  const [loadError, setLoadError] = useState(false);
+  const [estimatedSize, setEstimatedSize] = useState<PageSize | null>(null);
+  const [pageSizes, setPageSizes] = useState<(PageSize | undefined)[]>([]);
+  const [manualScale, setManualScale] = useState(1);
+  const [autoZoom, setAutoZoom] = useState(true);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewport, setViewport] = useState({ width: 0, height: 0 });
+  const [isFastScrolling, setIsFastScrolling] = useState(false);
+  //#endregion
+
+  //#region Data Loading
+  useEffect(() => {
+    let isActive = true;
+
+    acquirePdfDocument(fileUrl)
+      .then(async (loadedDocument) => {
+        // Page 1 is the size estimate for every page until it is rendered
+        const firstPageSize = await getPageSize(loadedDocument, 0);
+        if (!isActive) return;
+        setPdfDocument(loadedDocument);
+        setEstimatedSize(firstPageSize);
+        setPageSizes(new Array(loadedDocument.numPages));
+      })
+      .catch((error) => {
+        console.error("PDF load error:", error);
+        if (isActive) setLoadError(true);
+      });
+
+    return () => {
+      isActive = false;
+      setPdfDocument(null);
+      releasePdfDocument(fileUrl);
+    };
+  }, [fileUrl]);
+  //#endregion
+
+  //#region Computed Data
+  const numberOfPages = pdfDocument?.numPages ?? 0;
+
+  const scale = autoZoom && estimatedSize && viewport.width > 0
+    ? (viewport.width - PAGE_PADDING * 2) / estimatedSize.width
+    : manualScale;
+
+  // Prefix sums of page tops - O(n) once per zoom/size change, not per scroll
+  const layout = useMemo(() => {
+    const tops: number[] = new Array(numberOfPages);
+    const sizes: PageSize[] = new Array(numberOfPages);
+    let offset = PAGE_PADDING;
+
+    for (let page = 0; page < numberOfPages; page++) {
+      const size = pageSizes[page] ?? estimatedSize ?? { width: 0, height: 0 };
+      sizes[page] = { width: size.width * scale, height: size.height * scale };
+      tops[page] = offset;
+      offset += sizes[page].height + PAGE_GAP;
+    }
+
+    return { tops, sizes, totalHeight: offset + PAGE_PADDING };
+  }, [numberOfPages, pageSizes, estimatedSize, scale]);
+
+  const firstVisiblePage = findPageAt(layout.tops, scrollTop);
+  const lastVisiblePage = findPageAt(layout.tops, scrollTop + viewport.height);
+  const currentPage = findPageAt(layout.tops, scrollTop + viewport.height / 3);
+
+  const renderedPages: number[] = [];
+  if (numberOfPages > 0) {
+    const start = Math.max(0, firstVisiblePage - bufferPages);
+    const end = Math.min(numberOfPages - 1, lastVisiblePage + bufferPages);
+    for (let page = start; page <= end; page++) renderedPages.push(page);
+  }
+  //#endregion
+
+  //#region Event Handlers
+  const markScrolling = (isFast: boolean) => {
+    if (isFast) setIsFastScrolling(true);
+    clearTimeout(settleTimerRef.current);
+    settleTimerRef.current = setTimeout(() => setIsFastScrolling(false), SCROLL_SETTLE_MS);
+  };
+
+  const handleScroll = () => {
+    const container = containerRef.current;
+    if (!container) return;
+
+    const now = performance.now();
+    const { top, time } = lastScrollRef.current;
+    const velocity = Math.abs(container.scrollTop - top) / Math.max(now - time, 1);
+    lastScrollRef.current = { top: container.scrollTop, time: now };
+    markScrolling(velocity > FAST_SCROLL_VELOCITY);
+
+    // One state update per frame at most
+    if (scrollFrameRef.current !== undefined) return;
+    scrollFrameRef.current = requestAnimationFrame(() => {
+      scrollFrameRef.current = undefined;
+      setScrollTop(container.scrollTop);
+    });
+  };
+
+  const handleJumpToPage = (page: number) => {
+    const container = containerRef.current;
+    if (!container || page < 0 || page >= numberOfPages) return;
+
+    // Show thumbnails at the target first, full resolution once settled
+    markScrolling(true);
+    container.scrollTop = layout.tops[page] - PAGE_PADDING;
+  };
+
+  const handleZoom = (nextScale: number) => {
+    setAutoZoom(false);
+    setManualScale(nextScale);
+  };
+
+  const handleAutoZoomToggle = () => {
+    if (autoZoom) setManualScale(scale);
+    setAutoZoom(!autoZoom);
+  };
+
+  const handlePageSize = useCallback((page: number, size: PageSize) => {
+    setPageSizes((previous) => {
+      const known = previous[page];
+      if (known && known.width === size.width && known.height === size.height) return previous;
+      const next = previous.slice();
+      next[page] = size;
+      return next;
+    });
+  }, []);
+  //#endregion
+
+  //#region Effects
+  useEffect(() => {
+    if (cacheLimitBytes) setPageCacheLimit(cacheLimitBytes);
+  }, [cacheLimitBytes]);
+
+  useEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+
+    const observer = new ResizeObserver(([entry]) => {
+      setViewport({ width: entry.contentRect.width, height: entry.contentRect.height });
+    });
+    observer.observe(container);
+
+    return () => observer.disconnect();
+  }, []);
+
+  // Keep the reading position when zooming
+  useLayoutEffect(() => {
+    const container = containerRef.current;
+    const previousScale = previousScaleRef.current;
+    previousScaleRef.current = scale;
+    if (!container || previousScale === scale) return;
+
+    container.scrollTop = container.scrollTop * (scale / previousScale);
+    setScrollTop(container.scrollTop);
+  }, [scale]);
+
+  useEffect(() => {
+    return () => {
+      clearTimeout(settleTimerRef.current);
+      if (scrollFrameRef.current !== undefined) cancelAnimationFrame(scrollFrameRef.current);
+    };
+  }, []);
+  //#endregion
+
+  //#endregion
+  //###-------------------------COMPONENT LOGIC-----------------------------##
+
+  //###-------------------------RETURN-----------------------------##
+  //#region RETURN
+  return (
+    <div className={`flex h-full w-full flex-col ${className}`}>
+      <VirtualPdfToolbar
+        currentPage={currentPage}
+        numberOfPages={numberOfPages}
+        scale={scale}
+        autoZoom={autoZoom}
+        onJumpToPage={handleJumpToPage}
+        onZoom={handleZoom}
+        onAutoZoomToggle={handleAutoZoomToggle}
+      />
+
+      <div ref={containerRef} onScroll={handleScroll} className="relative flex-1 overflow-auto bg-muted">
+        {loadError && (
+          <div className="p-8 text-center text-sm text-destructive">
+            Das Dokument konnte nicht geladen werden.
+          </div>
+        )}
+
+        {pdfDocument && (
+          <div className="relative w-full" style={{ height: layout.totalHeight }}>
+            {renderedPages.map((page) => (
+              <PdfPageCanvas
+                key={page}
+                pdfDocument={pdfDocument}
+                fileUrl={fileUrl}
+                page={page}
+                scale={scale}
+                top={layout.tops[page]}
+                width={layout.sizes[page].width}
+                height={layout.sizes[page].height}
+                thumbnailOnly={isFastScrolling}
+                priority={Math.abs(page - currentPage)}
+                onPageSize={handlePageSize}
+              />
+            ))}
+          </div>
+        )}
+      </div>
+    </div>
+  );
+  //#endregion
+  //###-------------------------RETURN-----------------------------##
+}
+
+//#region Helpers
+// Binary search: index of the page whose top is <= offset
+function findPageAt(tops: number[], offset: number): number {
+  let low = 0;
+  let high = tops.length - 1;
+
+  while (low < high) {
+    const middle = Math.ceil((low + high) / 2);
+    if (tops[middle] <= offset) {
+      low = middle;
+    } else {
+      high = middle - 1;
+    }
+  }
+
+  return Math.max(low, 0);
+}
+//#endregion
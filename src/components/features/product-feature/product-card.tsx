@@ -7,6 +7,9 @@ import { useEffect, useRef } from "react";
 
 //  External Libraries
 import { useTranslation } from "react-i18next";
+
+//  Shared
+import { prefersReducedMotion, subscribeFrame } from "@/shared/lib/frame-scheduler";
 //#endregion
 
 //#region Components
@@ -71,7 +74,7 @@ export function ProductCard({
   //#region Hooks
   const cardRef = useRef<HTMLDivElement>(null);
   const imageRef = useRef<HTMLImageElement>(null);
-  const animationFrameRef = useRef<number | undefined>(undefined);
+  const unsubscribeRef = useRef<(() => void) | undefined>(undefined);
   const lastMousePosition = useRef({ x: 0, y: 0 });
   //#endregion
 
@@ -108,19 +111,12 @@ export function ProductCard({
 
     if (!card || !image) return;
 
-    let rect: DOMRect;
-    let centerX: number;
-    let centerY: number;
-
-    const updateCardTransform = (mouseX: number, mouseY: number) => {
-      if (!rect) {
-        rect = card.getBoundingClientRect();
-        centerX = rect.left + rect.width / 2;
-        centerY = rect.top + rect.height / 2;
-      }
+    let rect: DOMRect | null = null;
+    let hasPendingMove = false;
 
-      const relativeX = mouseX - centerX;
-      const relativeY = mouseY - centerY;
+    const updateCardTransform = (mouseX: number, mouseY: number, cardRect: DOMRect) => {
+      const relativeX = mouseX - (cardRect.left + cardRect.width / 2);
+      const relativeY = mouseY - (cardRect.top + cardRect.height / 2);
 
       const cardTransform: CardTransformParams = {
         rotateX: -relativeY * 0.035,
@@ -137,34 +133,49 @@ export function ProductCard({
       return { cardTransform, imageTransform };
     };
 
-    const animate = () => {
+    // Shared frame loop: layout reads of all cards run before any style write
+    const readFrame = () => {
+      if (hasPendingMove) rect = card.getBoundingClientRect();
+    };
+
+    const writeFrame = () => {
+      if (!hasPendingMove || !rect) return;
+      hasPendingMove = false;
+
       const { cardTransform, imageTransform } = updateCardTransform(
         lastMousePosition.current.x,
-        lastMousePosition.current.y
+        lastMousePosition.current.y,
+        rect
       );
 
       card.style.transform = `perspective(1000px) rotateX(${cardTransform.rotateX}deg) rotateY(${cardTransform.rotateY}deg) scale3d(${cardTransform.scale}, ${cardTransform.scale}, ${cardTransform.scale})`;
       card.style.boxShadow = "0 10px 35px rgba(0, 0, 0, 0.2)";
 
       image.style.transform = `perspective(1000px) rotateX(${imageTransform.rotateX}deg) rotateY(${imageTransform.rotateY}deg) scale3d(${imageTransform.scale}, ${imageTransform.scale}, ${imageTransform.scale})`;
+    };
 
-      animationFrameRef.current = requestAnimationFrame(animate);
+    const stopAnimation = () => {
+      unsubscribeRef.current?.();
+      unsubscribeRef.current = undefined;
     };
 
     const handleMouseMove = (e: MouseEvent) => {
       lastMousePosition.current = { x: e.clientX, y: e.clientY };
+      hasPendingMove = true;
     };
 
-    const handleMouseEnter = () => {
+    const handleMouseEnter = (e: MouseEvent) => {
+      if (prefersReducedMotion()) return;
+
       card.style.transition = "transform 0.2s ease, box-shadow 0.2s ease";
       image.style.transition = "transform 0.2s ease";
-      animate();
+      handleMouseMove(e);
+      stopAnimation();
+      unsubscribeRef.current = subscribeFrame({ read: readFrame, write: writeFrame }, { element: card });
     };
 
     const handleMouseLeave = () => {
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current);
-      }
+      stopAnimation();
 
       card.style.transform =
         "perspective(1000px) rotateX(0) rotateY(0) scale3d(1, 1, 1)";
@@ -181,9 +192,7 @@ export function ProductCard({
     card.addEventListener("mouseleave", handleMouseLeave);
 
     return () => {
-      if (animationFrameRef.current) {
-        cancelAnimationFrame(animationFrameRef.current);
-      }
+      stopAnimation();
 
       card.removeEventListener("mouseenter", handleMouseEnter);
       card.removeEventListener("mousemove", handleMouseMove);
@@ -4,11 +4,18 @@ import App from "./App";
 import "./index.css";
 import "./shared/i18n/config";
 import { BrowserRouter } from "react-router-dom";
+import { PersistQueryClientProvider } from "@tanstack/react-query-persist-client";
+import { persistOptions, queryClient } from "./shared/lib/query-client";
+import { startSubmissionOutbox } from "./shared/services/submission-outbox";
+
+startSubmissionOutbox();
 
 ReactDOM.createRoot(document.getElementById("root")!).render(
   <React.StrictMode>
-    <BrowserRouter>
-      <App />
-    </BrowserRouter>
+    <PersistQueryClientProvider client={queryClient} persistOptions={persistOptions}>
+      <BrowserRouter>
+        <App />
+      </BrowserRouter>
+    </PersistQueryClientProvider>
   </React.StrictMode>
 );
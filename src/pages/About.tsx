@@ -10,22 +10,24 @@ import { CTACard } from '@/components/blocks/cta-card/cta-card';
 
 // Data
 import { mockCustomerLogos } from '@/shared/data/mock-customers';
-import { mockProjectReferences } from '@/shared/data/mock-projects';
-import { mockTestimonials } from '@/shared/data/mock-testimonials';
 import { mockCertifications } from '@/shared/data/mock-certifications';
 import { mockNews } from '@/shared/data/mock-news';
 
 // Hooks
 import { useAnchorScroll } from '@/shared/hooks/use-anchor-scroll';
+import { useProjectReferences, useTestimonials } from '@/shared/hooks/use-content';
 
 // Hooks
 const useAboutPage = () => {
   useAnchorScroll();
+  const { data: testimonials = [] } = useTestimonials();
+  const { data: projects = [] } = useProjectReferences();
 
-  const customerTestimonials = mockTestimonials.filter(t => t.type === 'customer');
+  const customerTestimonials = testimonials.filter(t => t.type === 'customer');
 
   return {
-    customerTestimonials
+    customerTestimonials,
+    projects
   };
 };
 
@@ -55,7 +57,7 @@ const scrollToSection = (sectionId: string) => {
 
 export function About() {
   const { t } = useTranslation();
-  const { customerTestimonials } = useAboutPage();
+  const { customerTestimonials, projects } = useAboutPage();
 
   // T073: SEO Meta Tags - Set document title and meta
   React.useEffect(() => {
@@ -168,7 +170,7 @@ export function About() {
               {t('about.references.description')}
             </p>
           </div>
-          <ProjectGallery projects={mockProjectReferences} />
+          <ProjectGallery projects={projects} />
         </div>
       </section>
 
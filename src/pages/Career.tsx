@@ -13,14 +13,23 @@ import { TeamProfile } from "@/components/blocks/team-profile/team-profile";
 import { ApplicationForm } from "@/components/features/application-form/application-form";
 
 // Data
-import { mockJobListings } from "@/shared/data/mock-jobs";
-import { mockTeamProfiles } from "@/shared/data/mock-team";
 import { mockBenefits } from "@/shared/data/mock-benefits";
-import { mockTestimonials } from "@/shared/data/mock-testimonials";
+import {
+  useJobListings,
+  useJobLocationCounts,
+  useTeamMembers,
+  useTestimonials,
+} from "@/shared/hooks/use-content";
 
 // Types
 import type { LocationFilter } from "@/shared/lib/form-validation";
 
+// Utils
+import { cn } from "@/shared/lib/utils";
+
+// Benefits are static - sorted once on a copy instead of mutating the shared array per render
+const sortedBenefits = [...mockBenefits].sort((a, b) => a.displayOrder - b.displayOrder);
+
 // Hooks
 
 // Translations
@@ -45,17 +54,23 @@ export function Career() {
   const { t } = useTranslation();
 
   // Data Loading
+  // Jobs are paged and filtered per location on the server; each location is cached separately
+  const {
+    jobs: filteredJobs,
+    isPending: isJobsPending,
+    isError: isJobsError,
+    isPlaceholderData: isSwitchingLocation,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = useJobListings(selectedLocation);
+  const { data: locationCounts } = useJobLocationCounts();
+  const { data: sortedTeam = [] } = useTeamMembers();
+  const { data: testimonials = [] } = useTestimonials();
 
   // Early Returns
 
   // Computed Data
-  const filteredJobs = mockJobListings.filter(job => {
-    if (selectedLocation === "Alle") return job.active;
-    return job.active && job.location === selectedLocation;
-  });
-
-  const sortedTeam = mockTeamProfiles.sort((a, b) => a.displayOrder - b.displayOrder);
-  const sortedBenefits = mockBenefits.sort((a, b) => a.displayOrder - b.displayOrder);
 
   // Event Handlers
   const handleLocationChange = (location: LocationFilter) => {
@@ -132,7 +147,7 @@ export function Career() {
           <h2 className="text-3xl font-bold text-center mb-12">
             {t("career.employeeTestimonialsTitle")}
           </h2>
-          <TestimonialSlider testimonials={mockTestimonials} type="employee" />
+          <TestimonialSlider testimonials={testimonials} type="employee" />
         </div>
       </section>
 
@@ -147,25 +162,46 @@ export function Career() {
             <JobFilter
               selectedLocation={selectedLocation}
               onLocationChange={handleLocationChange}
+              locationCounts={locationCounts}
             />
           </div>
 
           {filteredJobs.length === 0 ? (
             <div className="text-center py-12">
               <p className="text-lg text-muted-foreground">
-                {t("career.noPositionsMessage")}
+                {isJobsPending
+                  ? t("career.loadingPositionsMessage")
+                  : isJobsError
+                    ? t("career.positionsErrorMessage")
+                    : t("career.noPositionsMessage")}
               </p>
             </div>
           ) : (
-            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-              {filteredJobs.map((job) => (
-                <JobListing
-                  key={job.id}
-                  job={job}
-                  onApply={handleJobApply}
-                />
-              ))}
-            </div>
+            <>
+              <div
+                className={cn(
+                  "grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6 transition-opacity",
+                  isSwitchingLocation && "opacity-60"
+                )}
+                aria-busy={isSwitchingLocation}
+              >
+                {filteredJobs.map((job) => (
+                  <JobListing
+                    key={job.id}
+                    job={job}
+                    onApply={handleJobApply}
+                  />
+                ))}
+              </div>
+
+              {hasNextPage && !isSwitchingLocation && (
+                <div className="mt-8 flex justify-center">
+                  <Button variant="outline" onClick={() => fetchNextPage()} disabled={isFetchingNextPage}>
+                    {t("career.loadMorePositions")}
+                  </Button>
+                </div>
+              )}
+            </>
           )}
         </div>
       </section>
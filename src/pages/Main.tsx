@@ -10,10 +10,9 @@ import { CustomerLogoWall } from "@/components/blocks/customer-logo-wall/custome
 import { ProjectGallery } from "@/components/blocks/project-gallery/project-gallery";
 import { CTACard } from "@/components/blocks/cta-card/cta-card";
 
-// Mock Data
-import { mockServices } from "@/shared/data/mock-services";
+// Data
 import { mockCustomerLogos } from "@/shared/data/mock-customers";
-import { mockProjectReferences } from "@/shared/data/mock-projects";
+import { useProjectReferences, useServices } from "@/shared/hooks/use-content";
 
 export function Main() {
   // 1. Hooks
@@ -21,6 +20,8 @@ export function Main() {
   const { t } = useTranslation();
 
   // 3. Data Loading
+  const { data: services = [] } = useServices();
+  const { data: projects = [] } = useProjectReferences();
 
   // 4. Early Returns
 
@@ -88,7 +89,7 @@ export function Main() {
 
             {/* Services Grid */}
             <div className="grid gap-6 md:grid-cols-2 lg:grid-cols-3">
-              {mockServices.slice(0, 5).map((service) => (
+              {services.slice(0, 5).map((service) => (
                 <ServiceCard key={service.id} service={service} />
               ))}
             </div>
@@ -174,7 +175,7 @@ export function Main() {
               </p>
             </div>
 
-            <ProjectGallery projects={mockProjectReferences.slice(0, 6)} />
+            <ProjectGallery projects={projects.slice(0, 6)} />
 
             <div className="text-center">
               <Button variant="outline" asChild>
@@ -8,9 +8,8 @@ import { useTranslation } from "react-i18next";
 import { Button } from "@/components/base/button";
 import { Card, CardContent } from "@/components/base/card";
 
-// Mock Data
-import { mockServices } from "@/shared/data/mock-services";
-import { mockProjectReferences } from "@/shared/data/mock-projects";
+// Data
+import { useProjectReferences, useServices } from "@/shared/hooks/use-content";
 
 // Feature Components
 import { ContactForm } from "@/components/features/contact-form/contact-form";
@@ -24,6 +23,8 @@ interface Metric {
 export function Sales() {
   // 1. Hooks
   const { t } = useTranslation();
+  const { data: services = [] } = useServices();
+  const { data: projectReferences = [] } = useProjectReferences();
 
   // 2. Translations
   // (handled by useTranslation hook)
@@ -35,8 +36,8 @@ export function Sales() {
     { value: "30", label: "Rechnungen nicht geprüft" }
   ];
 
-  const services = mockServices.sort((a, b) => a.displayOrder - b.displayOrder);
-  const projects = mockProjectReferences.slice(0, 6).sort((a, b) => a.displayOrder - b.displayOrder);
+  // services and projects arrive sorted by displayOrder
+  const projects = projectReferences.slice(0, 6);
 
   // 4. Early Returns
   // (none needed)
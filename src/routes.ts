@@ -0,0 +1,57 @@
+// i18n
+import { loadRouteNamespaces } from "@/shared/i18n/namespaces";
+
+// Data
+import { queryClient } from "@/shared/lib/query-client";
+import { contentQueries } from "@/shared/services/content";
+
+// Route chunks - each page is code-split and ships with its own i18n namespaces
+const routeModules = {
+  "/": () => import("@/pages/Main"),
+  "/about": () => import("@/pages/About"),
+  "/career": () => import("@/pages/Career"),
+  "/sales": () => import("@/pages/Sales"),
+};
+
+// Types
+export type RoutePath = keyof typeof routeModules;
+
+type RouteModule<P extends RoutePath> = Awaited<ReturnType<(typeof routeModules)[P]>>;
+
+// Content each page renders - warmed on prefetch so it is cached before the first paint
+const routeContent: Record<RoutePath, () => Promise<unknown>[]> = {
+  "/": () => [
+    queryClient.prefetchQuery(contentQueries.services()),
+    queryClient.prefetchQuery(contentQueries.projects()),
+  ],
+  "/about": () => [
+    queryClient.prefetchQuery(contentQueries.projects()),
+    queryClient.prefetchQuery(contentQueries.testimonials()),
+  ],
+  "/career": () => [
+    queryClient.prefetchQuery(contentQueries.testimonials()),
+    queryClient.prefetchQuery(contentQueries.team()),
+    queryClient.prefetchQuery(contentQueries.jobLocationCounts()),
+    queryClient.prefetchInfiniteQuery(contentQueries.jobs("Alle")),
+  ],
+  "/sales": () => [
+    queryClient.prefetchQuery(contentQueries.services()),
+    queryClient.prefetchQuery(contentQueries.projects()),
+  ],
+};
+
+// Service: Load a route chunk together with its translations
+export function loadRoute<P extends RoutePath>(path: P): Promise<RouteModule<P>> {
+  const moduleLoad = routeModules[path]() as Promise<RouteModule<P>>;
+  return Promise.all([moduleLoad, loadRouteNamespaces(path)]).then(([module]) => module);
+}
+
+// Service: Warm a route on hover/focus so navigation renders without a spinner
+// Fresh cache entries are skipped, so repeated hovers cost nothing.
+export function prefetchRoute(path: string): void {
+  if (path in routeModules) {
+    // A failed prefetch is harmless - the real navigation loads (and reports) again
+    loadRoute(path as RoutePath).catch(() => {});
+    routeContent[path as RoutePath]();
+  }
+}
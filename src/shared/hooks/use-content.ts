@@ -0,0 +1,50 @@
+// External Libraries
+import { useMemo } from "react";
+import { keepPreviousData, useInfiniteQuery, useQuery } from "@tanstack/react-query";
+
+// Services
+import { contentQueries } from "@/shared/services/content";
+
+// Types
+import type { LocationFilter } from "@/shared/lib/form-validation";
+
+// Hook: Paged job listings for one location
+// Each location is its own cache entry; switching keeps the previous list on
+// screen until the new one arrives.
+export function useJobListings(location: LocationFilter) {
+  // Hooks
+  const { data, isPending, isError, isPlaceholderData, hasNextPage, isFetchingNextPage, fetchNextPage } =
+    useInfiniteQuery({ ...contentQueries.jobs(location), placeholderData: keepPreviousData });
+
+  // Computed Data
+  const jobs = useMemo(() => data?.pages.flatMap((page) => page.jobs) ?? [], [data]);
+  const total = data?.pages[0]?.total ?? 0;
+
+  // Only the fields read here are tracked, so unrelated query updates don't re-render
+  return { jobs, total, isPending, isError, isPlaceholderData, hasNextPage, isFetchingNextPage, fetchNextPage };
+}
+
+// Hook: Open positions per location
+export function useJobLocationCounts() {
+  return useQuery(contentQueries.jobLocationCounts());
+}
+
+// Hook: Team members
+export function useTeamMembers() {
+  return useQuery(contentQueries.team());
+}
+
+// Hook: Customer and employee testimonials
+export function useTestimonials() {
+  return useQuery(contentQueries.testimonials());
+}
+
+// Hook: Project references
+export function useProjectReferences() {
+  return useQuery(contentQueries.projects());
+}
+
+// Hook: Services
+export function useServices() {
+  return useQuery(contentQueries.services());
+}
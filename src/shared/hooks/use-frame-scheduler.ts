@@ -0,0 +1,72 @@
+// External Libraries
+import { useEffect, useRef, useState, type RefObject } from "react";
+
+// Local
+import {
+  onReducedMotionChange,
+  prefersReducedMotion,
+  scheduleInterval,
+  subscribeFrame,
+  type FrameCallbacks,
+} from "@/shared/lib/frame-scheduler";
+
+// Types
+export interface UseFrameOptions {
+  elementRef?: RefObject<Element>; // pause while off-screen
+  enabled?: boolean;
+}
+
+// Hook: Track prefers-reduced-motion
+export function usePrefersReducedMotion() {
+  // Hooks
+  const [isReduced, setIsReduced] = useState(prefersReducedMotion);
+
+  // Effects
+  useEffect(() => onReducedMotionChange(setIsReduced), []);
+
+  return isReduced;
+}
+
+// Hook: Run read/write callbacks on the shared animation frame
+// Callbacks may change every render; the subscription does not.
+export function useFrameCallback(callbacks: FrameCallbacks, options: UseFrameOptions = {}) {
+  const { elementRef, enabled = true } = options;
+
+  // Hooks
+  const callbacksRef = useRef(callbacks);
+  callbacksRef.current = callbacks;
+
+  // Effects
+  useEffect(() => {
+    if (!enabled) return;
+
+    return subscribeFrame(
+      {
+        read: (frame) => callbacksRef.current.read?.(frame),
+        write: (frame) => callbacksRef.current.write?.(frame),
+      },
+      { element: elementRef?.current }
+    );
+  }, [enabled, elementRef]);
+}
+
+// Hook: Interval that pauses while the tab is hidden or the element is off-screen
+// Restarts from a full interval whenever resetKey changes (e.g. manual navigation).
+export function useFrameInterval(
+  callback: () => void,
+  intervalMs: number,
+  options: UseFrameOptions & { resetKey?: unknown } = {}
+) {
+  const { elementRef, enabled = true, resetKey } = options;
+
+  // Hooks
+  const callbackRef = useRef(callback);
+  callbackRef.current = callback;
+
+  // Effects
+  useEffect(() => {
+    if (!enabled) return;
+
+    return scheduleInterval(() => callbackRef.current(), intervalMs, { element: elementRef?.current });
+  }, [enabled, intervalMs, elementRef, resetKey]);
+}
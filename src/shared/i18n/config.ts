@@ -2,41 +2,31 @@
 import i18n from "i18next";
 import { initReactI18next } from "react-i18next";
 
-// Common Translations
-import commonDe from "./locales/de.json";
+// Generated Namespace Table (vite-plugins/i18n-namespaces.ts)
+import { eagerResources } from "virtual:i18n-namespaces";
 
-// Page Translations
-import pagesDe from "@/pages/i18n/locales/de.json";
-import aboutDe from "@/pages/about/i18n/locales/de.json";
-
-// Feature Translations
-import themeToggleDe from "@/components/features/theme-toggle/i18n/locales/de.json";
-import contactFormDe from "@/components/features/contact-form/i18n/locales/de.json";
-import applicationFormDe from "@/components/features/application-form/i18n/locales/de.json";
-import jobFilterDe from "@/components/features/job-filter/i18n/locales/de.json";
-
-// Merge all translations into one flat object
-const mergedDe = {
-  ...commonDe,
-  ...pagesDe,
-  ...aboutDe,
-  ...themeToggleDe,
-  ...contactFormDe,
-  ...applicationFormDe,
-  ...jobFilterDe,
-};
+// Constants
+export const DEFAULT_LANGUAGE = "de";
 
 i18n.use(initReactI18next).init({
-  resources: {
-    de: {
-      translation: mergedDe, // Single merged translation object
-    },
-  },
-  lng: "de",
-  fallbackLng: "de",
+  resources: {},
+  lng: DEFAULT_LANGUAGE,
+  fallbackLng: DEFAULT_LANGUAGE,
+  partialBundledLanguages: true,
   interpolation: {
     escapeValue: false,
   },
+  react: {
+    // Re-render when a lazy namespace is merged in (e.g. after a language switch)
+    bindI18nStore: "added",
+  },
+});
+
+// App shell translations (common, theme-toggle) are bundled with the entry.
+// Route namespaces are deep-merged into the same flat "translation"
+// namespace on demand, see ./namespaces.ts.
+Object.entries(eagerResources).forEach(([language, bundles]) => {
+  bundles.forEach((bundle) => i18n.addResourceBundle(language, "translation", bundle, true, true));
 });
 
 export default i18n;
@@ -0,0 +1,62 @@
+// External Libraries
+import i18n from "i18next";
+
+// Generated Namespace Table (vite-plugins/i18n-namespaces.ts)
+import { namespaceLoaders, routeNamespaces } from "virtual:i18n-namespaces";
+
+// Config
+import { DEFAULT_LANGUAGE } from "@/shared/i18n/config";
+
+// Module state
+// Keyed by language, namespace and content hash: a rebuilt namespace gets a
+// new key, an unchanged one is never fetched or parsed twice.
+const namespaceCache = new Map<string, Promise<void>>();
+const requestedNamespaces = new Set<string>();
+
+// Service: Load namespaces into the flat "translation" namespace
+export function loadNamespaces(namespaces: string[], language: string = i18n.language): Promise<void> {
+  namespaces.forEach((namespace) => requestedNamespaces.add(namespace));
+
+  const languages = [...new Set([language, DEFAULT_LANGUAGE])];
+  const loads = namespaces.flatMap((namespace) =>
+    languages.map((lng) => loadNamespace(namespace, lng))
+  );
+
+  return Promise.all(loads).then(() => undefined);
+}
+
+// Service: Load the namespaces a route needs
+export function loadRouteNamespaces(path: string): Promise<void> {
+  return loadNamespaces(routeNamespaces[path] ?? []);
+}
+
+// Helper: Fetch one namespace/language once and merge it in
+function loadNamespace(namespace: string, language: string): Promise<void> {
+  const entry = namespaceLoaders[namespace];
+  const loader = entry?.locales[language];
+
+  // Unknown namespace or no file for this language (fallback covers it)
+  if (!loader) return Promise.resolve();
+
+  const cacheKey = `${language}:${namespace}@${entry.version}`;
+  const cached = namespaceCache.get(cacheKey);
+  if (cached) return cached;
+
+  const pending = loader()
+    .then((module) => {
+      i18n.addResourceBundle(language, "translation", module.default, true, true);
+    })
+    .catch((error) => {
+      // Allow a retry on the next navigation (e.g. flaky network)
+      namespaceCache.delete(cacheKey);
+      console.error(`Failed to load i18n namespace "${namespace}" (${language}):`, error);
+    });
+
+  namespaceCache.set(cacheKey, pending);
+  return pending;
+}
+
+// Reload everything already in use when the language changes
+i18n.on("languageChanged", (language) => {
+  void loadNamespaces([...requestedNamespaces], language);
+});
@@ -54,10 +54,11 @@ export type Location = "Berlin" | "Hamburg" | "Heidelberg" | "anderes";
 export type LocationFilter = "Alle" | Location;
 
 // Form state type
-export type FormState = "idle" | "submitting" | "success" | "error";
+export type FormState = "idle" | "submitting" | "success" | "queued" | "error";
 
 export interface FormSubmissionResult {
   state: FormState;
   message?: string;
   errors?: Record<string, string>;
+  retryable?: boolean; // Network failure, 408/429 or 5xx - worth retrying later
 }
\ No newline at end of file
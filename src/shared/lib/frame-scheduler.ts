@@ -0,0 +1,271 @@
+// Types
+export interface FrameInfo {
+  time: number; // rAF timestamp
+  delta: number; // ms since the previous frame this subscriber was active (0 after a pause)
+}
+
+export interface FrameCallbacks {
+  /** DOM reads (getBoundingClientRect, ...). Runs for all subscribers before any write. */
+  read?: (frame: FrameInfo) => void;
+  /** DOM writes (style, textContent, setState). */
+  write?: (frame: FrameInfo) => void;
+}
+
+export interface SubscribeOptions {
+  /** Pause while this element is outside the viewport. */
+  element?: Element | null;
+}
+
+export interface IntervalOptions {
+  element?: Element | null;
+}
+
+export interface FrameStats {
+  frames: number;
+  overBudgetFrames: number;
+  lastFrameMs: number;
+  averageFrameMs: number;
+  maxFrameMs: number;
+  budgetMs: number;
+  subscribers: number;
+  activeSubscribers: number;
+  timers: number;
+}
+
+interface Subscriber {
+  callbacks: FrameCallbacks;
+  element: Element | null;
+  lastTime: number | null;
+}
+
+interface Timer {
+  callback: () => void;
+  intervalMs: number;
+  element: Element | null;
+  remainingMs: number;
+  startedAt: number;
+  handle: ReturnType<typeof setTimeout> | null;
+}
+
+// Constants
+const FRAME_BUDGET_MS = 1000 / 60;
+const REDUCED_MOTION_QUERY = "(prefers-reduced-motion: reduce)";
+
+// Module state
+// One rAF loop, one IntersectionObserver and one visibility listener for the whole app.
+const subscribers = new Set<Subscriber>();
+const timers = new Set<Timer>();
+const visibleElements = new WeakSet<Element>();
+const observedElements = new Map<Element, number>(); // element -> ref count
+let intersectionObserver: IntersectionObserver | null = null;
+let frameHandle: number | null = null;
+let isListening = false;
+const stats = { frames: 0, overBudgetFrames: 0, lastFrameMs: 0, totalFrameMs: 0, maxFrameMs: 0 };
+
+// Service: Run callbacks on the shared animation frame
+// Returns an unsubscribe function.
+export function subscribeFrame(callbacks: FrameCallbacks, options: SubscribeOptions = {}): () => void {
+  const subscriber: Subscriber = { callbacks, element: options.element ?? null, lastTime: null };
+
+  ensureListeners();
+  subscribers.add(subscriber);
+  if (subscriber.element) observeElement(subscriber.element);
+  requestTick();
+
+  return () => {
+    subscribers.delete(subscriber);
+    if (subscriber.element) unobserveElement(subscriber.element);
+  };
+}
+
+// Service: setInterval replacement that pauses while hidden or off-screen
+// Remaining time is kept across pauses, so a slide never advances unseen.
+export function scheduleInterval(callback: () => void, intervalMs: number, options: IntervalOptions = {}): () => void {
+  const timer: Timer = {
+    callback,
+    intervalMs,
+    element: options.element ?? null,
+    remainingMs: intervalMs,
+    startedAt: 0,
+    handle: null,
+  };
+
+  ensureListeners();
+  timers.add(timer);
+  if (timer.element) observeElement(timer.element);
+  syncTimer(timer);
+
+  return () => {
+    pauseTimer(timer);
+    timers.delete(timer);
+    if (timer.element) unobserveElement(timer.element);
+  };
+}
+
+// Service: Current user preference for reduced motion
+export function prefersReducedMotion(): boolean {
+  return typeof window !== "undefined" && window.matchMedia(REDUCED_MOTION_QUERY).matches;
+}
+
+// Service: Listen for reduced-motion changes
+export function onReducedMotionChange(listener: (reduced: boolean) => void): () => void {
+  const query = window.matchMedia(REDUCED_MOTION_QUERY);
+  const handleChange = () => listener(query.matches);
+  query.addEventListener("change", handleChange);
+  return () => query.removeEventListener("change", handleChange);
+}
+
+// Service: Per-frame timing counters (work time inside the shared tick)
+export function getFrameStats(): FrameStats {
+  return {
+    frames: stats.frames,
+    overBudgetFrames: stats.overBudgetFrames,
+    lastFrameMs: stats.lastFrameMs,
+    averageFrameMs: stats.frames > 0 ? stats.totalFrameMs / stats.frames : 0,
+    maxFrameMs: stats.maxFrameMs,
+    budgetMs: FRAME_BUDGET_MS,
+    subscribers: subscribers.size,
+    activeSubscribers: [...subscribers].filter(isSubscriberActive).length,
+    timers: timers.size,
+  };
+}
+
+export function resetFrameStats(): void {
+  stats.frames = 0;
+  stats.overBudgetFrames = 0;
+  stats.lastFrameMs = 0;
+  stats.totalFrameMs = 0;
+  stats.maxFrameMs = 0;
+}
+
+// Helper: The single frame loop
+function tick(time: number): void {
+  frameHandle = null;
+  const workStart = performance.now();
+
+  const active: { subscriber: Subscriber; frame: FrameInfo }[] = [];
+  subscribers.forEach((subscriber) => {
+    if (!isSubscriberActive(subscriber)) {
+      subscriber.lastTime = null; // resume without a jump
+      return;
+    }
+    const delta = subscriber.lastTime === null ? 0 : time - subscriber.lastTime;
+    subscriber.lastTime = time;
+    active.push({ subscriber, frame: { time, delta } });
+  });
+
+  // Batched: all reads, then all writes - no read/write interleaving across components
+  active.forEach(({ subscriber, frame }) => runSafely(subscriber.callbacks.read, frame));
+  active.forEach(({ subscriber, frame }) => runSafely(subscriber.callbacks.write, frame));
+
+  if (active.length > 0) {
+    const frameMs = performance.now() - workStart;
+    stats.frames++;
+    stats.lastFrameMs = frameMs;
+    stats.totalFrameMs += frameMs;
+    stats.maxFrameMs = Math.max(stats.maxFrameMs, frameMs);
+    if (frameMs > FRAME_BUDGET_MS) stats.overBudgetFrames++;
+  }
+
+  requestTick();
+}
+
+function requestTick(): void {
+  if (frameHandle !== null || document.hidden) return;
+
+  // Stop the loop entirely when nobody on screen needs frames
+  for (const subscriber of subscribers) {
+    if (isSubscriberActive(subscriber)) {
+      frameHandle = requestAnimationFrame(tick);
+      return;
+    }
+  }
+}
+
+function isSubscriberActive(subscriber: Subscriber): boolean {
+  return !document.hidden && (!subscriber.element || visibleElements.has(subscriber.element));
+}
+
+function runSafely(callback: ((frame: FrameInfo) => void) | undefined, frame: FrameInfo): void {
+  if (!callback) return;
+  try {
+    callback(frame);
+  } catch (error) {
+    console.error("Frame callback error:", error);
+  }
+}
+
+// Helper: Timers
+function syncTimer(timer: Timer): void {
+  const isActive = !document.hidden && (!timer.element || visibleElements.has(timer.element));
+  if (isActive) {
+    resumeTimer(timer);
+  } else {
+    pauseTimer(timer);
+  }
+}
+
+function resumeTimer(timer: Timer): void {
+  if (timer.handle !== null) return;
+
+  timer.startedAt = performance.now();
+  timer.handle = setTimeout(() => {
+    timer.handle = null;
+    timer.remainingMs = timer.intervalMs;
+    timer.callback();
+    if (timers.has(timer)) syncTimer(timer);
+  }, timer.remainingMs);
+}
+
+function pauseTimer(timer: Timer): void {
+  if (timer.handle === null) return;
+
+  clearTimeout(timer.handle);
+  timer.handle = null;
+  timer.remainingMs = Math.max(0, timer.remainingMs - (performance.now() - timer.startedAt));
+}
+
+// Helper: Shared visibility tracking
+function ensureListeners(): void {
+  if (isListening) return;
+  isListening = true;
+
+  document.addEventListener("visibilitychange", () => {
+    timers.forEach(syncTimer);
+    requestTick();
+  });
+
+  intersectionObserver = new IntersectionObserver((entries) => {
+    entries.forEach((entry) => {
+      if (entry.isIntersecting) {
+        visibleElements.add(entry.target);
+      } else {
+        visibleElements.delete(entry.target);
+      }
+    });
+    timers.forEach(syncTimer);
+    requestTick();
+  });
+}
+
+function observeElement(element: Element): void {
+  const count = observedElements.get(element) ?? 0;
+  observedElements.set(element, count + 1);
+  if (count === 0) intersectionObserver?.observe(element);
+}
+
+function unobserveElement(element: Element): void {
+  const count = observedElements.get(element) ?? 0;
+  if (count <= 1) {
+    observedElements.delete(element);
+    visibleElements.delete(element);
+    intersectionObserver?.unobserve(element);
+  } else {
+    observedElements.set(element, count - 1);
+  }
+}
+
+// Dev: inspect budget from the console via __frameScheduler.getFrameStats()
+if (import.meta.env.DEV && typeof window !== "undefined") {
+  (window as unknown as Record<string, unknown>).__frameScheduler = { getFrameStats, resetFrameStats };
+}
@@ -0,0 +1,37 @@
+// External Libraries
+import { QueryClient } from "@tanstack/react-query";
+import { createSyncStoragePersister } from "@tanstack/query-sync-storage-persister";
+import type { PersistQueryClientProviderProps } from "@tanstack/react-query-persist-client";
+
+// Constants
+const CONTENT_STALE_TIME = 5 * 60 * 1000; // 5 min - served from cache without revalidating
+const CONTENT_CACHE_MAX_AGE = 24 * 60 * 60 * 1000; // 24 h - persisted entries older than this are dropped
+// Bump when a content row shape changes so persisted caches from older builds are discarded
+const CONTENT_CACHE_VERSION = "content-v1";
+
+// Client: Stale-while-revalidate for CMS content
+// Identical keys share one in-flight request; stale entries render immediately
+// and refetch in the background on mount.
+export const queryClient = new QueryClient({
+  defaultOptions: {
+    queries: {
+      staleTime: CONTENT_STALE_TIME,
+      gcTime: CONTENT_CACHE_MAX_AGE, // must outlive maxAge or entries are evicted before they are persisted
+      retry: 2,
+    },
+  },
+});
+
+// Persistence: Content survives reloads and return visits via localStorage
+export const persistOptions: PersistQueryClientProviderProps["persistOptions"] = {
+  persister: createSyncStoragePersister({
+    storage: typeof window !== "undefined" ? window.localStorage : undefined,
+    key: "pacon-content-cache",
+    throttleTime: 1000,
+  }),
+  maxAge: CONTENT_CACHE_MAX_AGE,
+  buster: CONTENT_CACHE_VERSION,
+  dehydrateOptions: {
+    shouldDehydrateQuery: (query) => query.queryKey[0] === "content" && query.state.status === "success",
+  },
+};
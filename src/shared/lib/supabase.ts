@@ -0,0 +1,16 @@
+// External Libraries
+import { createClient, type SupabaseClient } from "@supabase/supabase-js";
+
+// Constants
+// A relative URL (e.g. /__mock/supabase from vite-plugins/mock-content-api) resolves against the page origin
+const SUPABASE_URL = import.meta.env.VITE_SUPABASE_URL;
+const SUPABASE_ANON_KEY = import.meta.env.VITE_SUPABASE_ANON_KEY;
+
+// Client: Public, read-only content access (no auth session on the marketing site)
+// null while Supabase is not configured - content services then serve the bundled seed data.
+export const supabase: SupabaseClient | null =
+  SUPABASE_URL && SUPABASE_ANON_KEY
+    ? createClient(new URL(SUPABASE_URL, window.location.origin).href, SUPABASE_ANON_KEY, {
+        auth: { persistSession: false, autoRefreshToken: false },
+      })
+    : null;
@@ -0,0 +1,268 @@
+// External Libraries
+import { infiniteQueryOptions, queryOptions } from "@tanstack/react-query";
+
+// Local
+import { supabase } from "@/shared/lib/supabase";
+
+// Types
+import type { JobListing } from "@/shared/data/mock-jobs";
+import type { TeamMemberProfile } from "@/shared/data/mock-team";
+import type { Testimonial } from "@/shared/data/mock-testimonials";
+import type { ProjectReference } from "@/shared/data/mock-projects";
+import type { ServiceItem } from "@/shared/data/mock-services";
+import type { LocationFilter } from "@/shared/lib/form-validation";
+
+export interface JobPage {
+  jobs: JobListing[];
+  total: number;
+  nextPage?: number;
+}
+
+export type JobLocationCounts = Partial<Record<LocationFilter, number>>;
+
+// Row shapes of supabase/migrations/007_content.sql
+interface JobListingRow {
+  id: string;
+  title: string;
+  location: JobListing["location"];
+  entry_level: string;
+  employment_type: string;
+  tasks: string[];
+  profile_requirements: string[];
+  active: boolean;
+}
+
+interface JobLocationCountRow {
+  location: JobListing["location"];
+  open_positions: number;
+}
+
+interface TeamMemberRow {
+  id: string;
+  name: string;
+  role: string;
+  focus: string;
+  photo_url: string | null;
+  display_order: number;
+}
+
+interface TestimonialRow {
+  id: string;
+  text: string;
+  author: string | null;
+  author_function: string | null;
+  type: Testimonial["type"];
+  display_order: number;
+}
+
+interface ProjectReferenceRow {
+  id: string;
+  title: string;
+  description: string;
+  image_url: string;
+  display_order: number;
+}
+
+interface ServiceRow {
+  id: string;
+  title: string;
+  description: string;
+  icon_name: string | null;
+  display_order: number;
+}
+
+// Constants
+export const JOB_PAGE_SIZE = 12;
+
+const JOB_COLUMNS = "id, title, location, entry_level, employment_type, tasks, profile_requirements, active";
+
+// Module state
+// Seed jobs indexed by location once, so the fallback never re-filters per request
+let seedJobIndex: Promise<Map<LocationFilter, JobListing[]>> | null = null;
+
+// Service: One page of active job listings, filtered by location on the server
+export async function fetchJobPage(location: LocationFilter, page: number, signal: AbortSignal): Promise<JobPage> {
+  const from = page * JOB_PAGE_SIZE;
+  const to = from + JOB_PAGE_SIZE - 1;
+
+  if (!supabase) {
+    const matches = (await loadSeedJobIndex()).get(location) ?? [];
+    return toJobPage(matches.slice(from, to + 1), matches.length, page);
+  }
+
+  let query = supabase.from("job_listings").select(JOB_COLUMNS, { count: "exact" }).eq("active", true);
+  if (location !== "Alle") query = query.eq("location", location);
+
+  const { data, count, error } = await query.order("id").range(from, to).abortSignal(signal);
+  if (error) throw new Error(error.message);
+
+  return toJobPage((data as JobListingRow[]).map(toJobListing), count ?? 0, page);
+}
+
+// Service: Open positions per location (drives the JobFilter counts)
+export async function fetchJobLocationCounts(signal: AbortSignal): Promise<JobLocationCounts> {
+  if (!supabase) {
+    const index = await loadSeedJobIndex();
+    return Object.fromEntries([...index].map(([location, jobs]) => [location, jobs.length]));
+  }
+
+  const { data, error } = await supabase.from("job_location_counts").select("location, open_positions").abortSignal(signal);
+  if (error) throw new Error(error.message);
+
+  const counts: JobLocationCounts = { Alle: 0 };
+  (data as JobLocationCountRow[]).forEach((row) => {
+    counts[row.location] = row.open_positions;
+    counts.Alle = (counts.Alle ?? 0) + row.open_positions;
+  });
+  return counts;
+}
+
+// Service: Team members in display order
+export async function fetchTeamMembers(signal: AbortSignal): Promise<TeamMemberProfile[]> {
+  return fetchOrdered<TeamMemberRow, TeamMemberProfile>(
+    "team_members",
+    "id, name, role, focus, photo_url, display_order",
+    (row) => ({
+      id: row.id,
+      name: row.name,
+      role: row.role,
+      focus: row.focus,
+      photoUrl: row.photo_url ?? undefined,
+      displayOrder: row.display_order,
+    }),
+    async () => (await import("@/shared/data/mock-team")).mockTeamProfiles,
+    signal
+  );
+}
+
+// Service: Customer and employee testimonials in display order
+export async function fetchTestimonials(signal: AbortSignal): Promise<Testimonial[]> {
+  return fetchOrdered<TestimonialRow, Testimonial>(
+    "testimonials",
+    "id, text, author, author_function, type, display_order",
+    (row) => ({
+      id: row.id,
+      text: row.text,
+      author: row.author ?? undefined,
+      authorFunction: row.author_function ?? undefined,
+      type: row.type,
+      displayOrder: row.display_order,
+    }),
+    async () => (await import("@/shared/data/mock-testimonials")).mockTestimonials,
+    signal
+  );
+}
+
+// Service: Project references in display order
+export async function fetchProjectReferences(signal: AbortSignal): Promise<ProjectReference[]> {
+  return fetchOrdered<ProjectReferenceRow, ProjectReference>(
+    "project_references",
+    "id, title, description, image_url, display_order",
+    (row) => ({
+      id: row.id,
+      title: row.title,
+      description: row.description,
+      imageUrl: row.image_url,
+      displayOrder: row.display_order,
+    }),
+    async () => (await import("@/shared/data/mock-projects")).mockProjectReferences,
+    signal
+  );
+}
+
+// Service: Services in display order
+export async function fetchServices(signal: AbortSignal): Promise<ServiceItem[]> {
+  return fetchOrdered<ServiceRow, ServiceItem>(
+    "services",
+    "id, title, description, icon_name, display_order",
+    (row) => ({
+      id: row.id,
+      title: row.title,
+      description: row.description,
+      iconName: row.icon_name ?? undefined,
+      displayOrder: row.display_order,
+    }),
+    async () => (await import("@/shared/data/mock-services")).mockServices,
+    signal
+  );
+}
+
+// Query Options: Shared by the content hooks and route prefetching, so both hit the same cache entry
+export const contentQueries = {
+  jobs: (location: LocationFilter) =>
+    infiniteQueryOptions({
+      queryKey: ["content", "jobs", location],
+      queryFn: ({ pageParam, signal }) => fetchJobPage(location, pageParam, signal),
+      initialPageParam: 0,
+      getNextPageParam: (lastPage: JobPage) => lastPage.nextPage,
+    }),
+  jobLocationCounts: () =>
+    queryOptions({
+      queryKey: ["content", "job-location-counts"],
+      queryFn: ({ signal }) => fetchJobLocationCounts(signal),
+    }),
+  team: () => queryOptions({ queryKey: ["content", "team"], queryFn: ({ signal }) => fetchTeamMembers(signal) }),
+  testimonials: () =>
+    queryOptions({ queryKey: ["content", "testimonials"], queryFn: ({ signal }) => fetchTestimonials(signal) }),
+  projects: () =>
+    queryOptions({ queryKey: ["content", "projects"], queryFn: ({ signal }) => fetchProjectReferences(signal) }),
+  services: () => queryOptions({ queryKey: ["content", "services"], queryFn: ({ signal }) => fetchServices(signal) }),
+};
+
+// Helper: Select a whole content table ordered by display_order, or sort a copy of the seed data
+async function fetchOrdered<Row, Item extends { displayOrder: number }>(
+  table: string,
+  columns: string,
+  toItem: (row: Row) => Item,
+  loadSeed: () => Promise<Item[]>,
+  signal: AbortSignal
+): Promise<Item[]> {
+  if (!supabase) {
+    return [...(await loadSeed())].sort((a, b) => a.displayOrder - b.displayOrder);
+  }
+
+  const { data, error } = await supabase.from(table).select(columns).order("display_order").abortSignal(signal);
+  if (error) throw new Error(error.message);
+
+  return (data as Row[]).map(toItem);
+}
+
+// Helper: Group active jobs by location ("Alle" holds every active job)
+export function buildJobLocationIndex(jobs: JobListing[]): Map<LocationFilter, JobListing[]> {
+  const index = new Map<LocationFilter, JobListing[]>([["Alle", []]]);
+
+  jobs.forEach((job) => {
+    if (!job.active) return;
+    index.get("Alle")!.push(job);
+    const bucket = index.get(job.location);
+    if (bucket) bucket.push(job);
+    else index.set(job.location, [job]);
+  });
+
+  return index;
+}
+
+function loadSeedJobIndex(): Promise<Map<LocationFilter, JobListing[]>> {
+  seedJobIndex ??= import("@/shared/data/mock-jobs").then(({ mockJobListings }) =>
+    buildJobLocationIndex(mockJobListings)
+  );
+  return seedJobIndex;
+}
+
+function toJobPage(jobs: JobListing[], total: number, page: number): JobPage {
+  const loaded = page * JOB_PAGE_SIZE + jobs.length;
+  return { jobs, total, nextPage: loaded < total ? page + 1 : undefined };
+}
+
+function toJobListing(row: JobListingRow): JobListing {
+  return {
+    id: row.id,
+    title: row.title,
+    location: row.location,
+    entryLevel: row.entry_level,
+    employmentType: row.employment_type,
+    tasks: row.tasks,
+    profileRequirements: row.profile_requirements,
+    active: row.active,
+  };
+}
@@ -4,16 +4,60 @@ export interface FileValidationResult {
   error?: string;
 }
 
-export interface FileConversionResult {
+export interface UploadProgress {
+  loaded: number;
+  total: number;
+  percent: number;
+}
+
+export interface UploadResult {
   success: boolean;
-  base64?: string;
-  fileName?: string;
+  status?: number;
+  body?: unknown;
+  uploadId?: string;
+  checksum?: string;
   error?: string;
 }
 
+export interface MultipartUploadOptions {
+  endpoint: string;
+  fields?: Record<string, string>;
+  fileFieldName?: string;
+  signal?: AbortSignal;
+  onProgress?: (progress: UploadProgress) => void;
+}
+
+export interface ChunkedUploadOptions {
+  endpoint: string;
+  chunkSize?: number;
+  maxRetries?: number;
+  signal?: AbortSignal;
+  onProgress?: (progress: UploadProgress) => void;
+}
+
+interface ChunkedUploadSession {
+  uploadId: string;
+  received: number[];
+}
+
+class UploadHttpError extends Error {
+  status: number;
+
+  constructor(status: number, statusText: string) {
+    super(`HTTP ${status}: ${statusText}`);
+    this.status = status;
+  }
+}
+
 // Constants
 const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
 const ALLOWED_MIME_TYPE = "application/pdf";
+const DEFAULT_CHUNK_SIZE = 512 * 1024; // 512KB - small enough to retry cheaply on mobile
+const DEFAULT_MAX_RETRIES = 3;
+const RETRY_BASE_DELAY_MS = 500;
+const RESUME_KEY_PREFIX = "pacon_upload_";
+const UPLOAD_ABORTED_ERROR = "Upload abgebrochen";
+const UPLOAD_FAILED_ERROR = "Fehler beim Hochladen der Datei";
 
 // Service: Validate CV file
 export function validateCVFile(file: File): FileValidationResult {
@@ -46,38 +90,141 @@ export function validateCVFile(file: File): FileValidationResult {
   };
 }
 
-// Service: Convert file to base64
-export function fileToBase64(file: File): Promise<FileConversionResult> {
+// Service: Upload file as multipart/form-data
+// The browser streams the File straight from disk - no base64 copy in memory.
+export function uploadFileMultipart(file: File, options: MultipartUploadOptions): Promise<UploadResult> {
+  const { endpoint, fields = {}, fileFieldName = "attachment", signal, onProgress } = options;
+
   return new Promise((resolve) => {
-    const reader = new FileReader();
-
-    reader.onload = () => {
-      try {
-        const result = reader.result as string;
-        resolve({
-          success: true,
-          base64: result,
-          fileName: file.name,
-        });
-      } catch (error) {
-        resolve({
-          success: false,
-          error: "Fehler beim Lesen der Datei",
-        });
+    if (signal?.aborted) {
+      resolve({ success: false, error: UPLOAD_ABORTED_ERROR });
+      return;
+    }
+
+    const formData = new FormData();
+    Object.entries(fields).forEach(([key, value]) => formData.append(key, value));
+    formData.append(fileFieldName, file, file.name);
+
+    const xhr = new XMLHttpRequest();
+    const handleAbort = () => xhr.abort();
+    const finish = (result: UploadResult) => {
+      signal?.removeEventListener("abort", handleAbort);
+      resolve(result);
+    };
+
+    xhr.open("POST", endpoint);
+    xhr.setRequestHeader("Accept", "application/json");
+
+    xhr.upload.onprogress = (event) => {
+      if (event.lengthComputable) {
+        onProgress?.(toProgress(event.loaded, event.total));
       }
     };
 
-    reader.onerror = () => {
-      resolve({
-        success: false,
-        error: "Fehler beim Lesen der Datei",
-      });
+    xhr.onload = () => {
+      const body = parseJson(xhr.responseText);
+
+      if (xhr.status < 200 || xhr.status >= 300) {
+        finish({ success: false, status: xhr.status, body, error: `HTTP ${xhr.status}: ${xhr.statusText}` });
+        return;
+      }
+
+      finish({ success: true, status: xhr.status, body });
     };
 
-    reader.readAsDataURL(file);
+    xhr.onerror = () => finish({ success: false, error: UPLOAD_FAILED_ERROR });
+    xhr.onabort = () => finish({ success: false, error: UPLOAD_ABORTED_ERROR });
+
+    signal?.addEventListener("abort", handleAbort, { once: true });
+    xhr.send(formData);
   });
 }
 
+// Service: Upload file as resumable binary chunks
+// Protocol (see specs/001-pacon-re/contracts/form-submission-api.md, 3.5):
+//   POST {endpoint}                      -> { uploadId }
+//   GET  {endpoint}/{uploadId}           -> { received: number[] }  (resume)
+//   PUT  {endpoint}/{uploadId}/{index}   raw bytes + X-Chunk-Checksum
+//   POST {endpoint}/{uploadId}/complete  { checksum, totalChunks }
+export async function uploadFileChunked(file: File, options: ChunkedUploadOptions): Promise<UploadResult> {
+  const {
+    endpoint,
+    chunkSize = DEFAULT_CHUNK_SIZE,
+    maxRetries = DEFAULT_MAX_RETRIES,
+    signal,
+    onProgress,
+  } = options;
+
+  const totalChunks = Math.max(1, Math.ceil(file.size / chunkSize));
+  const resumeKey = getResumeKey(file, chunkSize);
+
+  try {
+    const session = await withRetry(
+      () => openUploadSession(endpoint, file, chunkSize, totalChunks, resumeKey, signal),
+      maxRetries,
+      signal
+    );
+    const received = new Set(session.received);
+    const chunkDigests: string[] = [];
+    let loaded = 0;
+
+    for (let index = 0; index < totalChunks; index++) {
+      throwIfAborted(signal);
+
+      const start = index * chunkSize;
+      const chunk = file.slice(start, Math.min(start + chunkSize, file.size));
+      const bytes = await chunk.arrayBuffer();
+      const digest = await sha256Hex(bytes);
+      chunkDigests.push(digest);
+
+      if (!received.has(index)) {
+        await withRetry(
+          () => putChunk(endpoint, session.uploadId, index, bytes, start, file.size, digest, signal),
+          maxRetries,
+          signal
+        );
+      }
+
+      loaded += chunk.size;
+      onProgress?.(toProgress(loaded, file.size));
+    }
+
+    // File checksum = SHA-256 over the ordered chunk digests, so the whole
+    // file never has to be held in memory at once.
+    const checksum = await sha256Hex(new TextEncoder().encode(chunkDigests.join("")));
+    const body = await withRetry(
+      () => requestJson(`${endpoint}/${session.uploadId}/complete`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ checksum, totalChunks }),
+        signal,
+      }),
+      maxRetries,
+      signal
+    );
+
+    localStorage.removeItem(resumeKey);
+
+    return {
+      success: true,
+      uploadId: session.uploadId,
+      checksum,
+      body,
+    };
+  } catch (error) {
+    if (isAbortError(error)) {
+      return { success: false, error: UPLOAD_ABORTED_ERROR };
+    }
+
+    console.error("Chunked upload error:", error);
+    return {
+      success: false,
+      status: error instanceof UploadHttpError ? error.status : undefined,
+      error: UPLOAD_FAILED_ERROR,
+    };
+  }
+}
+
 // Service: Format file size for display
 export function formatFileSize(bytes: number): string {
   if (bytes === 0) return "0 B";
@@ -97,4 +244,158 @@ export function isPDFFile(file: File): boolean {
 // Service: Get file extension
 export function getFileExtension(fileName: string): string {
   return fileName.split('.').pop()?.toLowerCase() || '';
-}
\ No newline at end of file
+}
+
+// Helper: Open a new upload session or resume a stored one
+async function openUploadSession(
+  endpoint: string,
+  file: File,
+  chunkSize: number,
+  totalChunks: number,
+  resumeKey: string,
+  signal?: AbortSignal
+): Promise<ChunkedUploadSession> {
+  const storedUploadId = localStorage.getItem(resumeKey);
+
+  if (storedUploadId) {
+    try {
+      const status = await requestJson(`${endpoint}/${storedUploadId}`, { method: "GET", signal }) as {
+        received?: number[];
+      };
+      return { uploadId: storedUploadId, received: status.received ?? [] };
+    } catch (error) {
+      if (isAbortError(error)) throw error;
+      // Session expired on the server, start over
+      localStorage.removeItem(resumeKey);
+    }
+  }
+
+  const created = await requestJson(endpoint, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      fileName: file.name,
+      size: file.size,
+      type: file.type,
+      chunkSize,
+      totalChunks,
+    }),
+    signal,
+  }) as { uploadId: string };
+
+  localStorage.setItem(resumeKey, created.uploadId);
+  return { uploadId: created.uploadId, received: [] };
+}
+
+// Helper: Upload a single chunk
+async function putChunk(
+  endpoint: string,
+  uploadId: string,
+  index: number,
+  bytes: ArrayBuffer,
+  start: number,
+  total: number,
+  digest: string,
+  signal?: AbortSignal
+): Promise<void> {
+  const end = start + bytes.byteLength - 1;
+
+  await requestJson(`${endpoint}/${uploadId}/${index}`, {
+    method: "PUT",
+    headers: {
+      "Content-Type": "application/octet-stream",
+      "Content-Range": `bytes ${start}-${end}/${total}`,
+      "X-Chunk-Checksum": `sha-256=${digest}`,
+    },
+    body: bytes,
+    signal,
+  });
+}
+
+// Helper: fetch wrapper that throws on non-2xx and parses JSON bodies
+async function requestJson(url: string, init: RequestInit): Promise<unknown> {
+  const response = await fetch(url, {
+    ...init,
+    headers: { Accept: "application/json", ...init.headers },
+  });
+
+  if (!response.ok) {
+    throw new UploadHttpError(response.status, response.statusText);
+  }
+
+  return parseJson(await response.text());
+}
+
+// Helper: Retry with exponential backoff (network errors, 408, 429, 5xx)
+async function withRetry<T>(task: () => Promise<T>, maxRetries: number, signal?: AbortSignal): Promise<T> {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await task();
+    } catch (error) {
+      if (isAbortError(error) || !isRetryableError(error) || attempt >= maxRetries) {
+        throw error;
+      }
+      await delay(RETRY_BASE_DELAY_MS * 2 ** attempt, signal);
+    }
+  }
+}
+
+function isRetryableError(error: unknown): boolean {
+  if (!(error instanceof UploadHttpError)) return true; // network failure
+  return error.status === 408 || error.status === 429 || error.status >= 500;
+}
+
+function isAbortError(error: unknown): boolean {
+  return error instanceof DOMException && error.name === "AbortError";
+}
+
+function throwIfAborted(signal?: AbortSignal): void {
+  if (signal?.aborted) {
+    throw new DOMException("Upload aborted", "AbortError");
+  }
+}
+
+function delay(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const handleAbort = () => {
+      clearTimeout(timer);
+      reject(new DOMException("Upload aborted", "AbortError"));
+    };
+    const timer = setTimeout(() => {
+      signal?.removeEventListener("abort", handleAbort);
+      resolve();
+    }, ms);
+
+    signal?.addEventListener("abort", handleAbort, { once: true });
+  });
+}
+
+// Helper: Hex-encoded SHA-256 digest
+async function sha256Hex(data: BufferSource): Promise<string> {
+  const digest = await crypto.subtle.digest("SHA-256", data);
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+}
+
+// Helper: Storage key identifying the same file across page reloads
+function getResumeKey(file: File, chunkSize: number): string {
+  return `${RESUME_KEY_PREFIX}${file.name}_${file.size}_${file.lastModified}_${chunkSize}`;
+}
+
+function toProgress(loaded: number, total: number): UploadProgress {
+  return {
+    loaded,
+    total,
+    percent: total > 0 ? Math.round((loaded / total) * 100) : 100,
+  };
+}
+
+function parseJson(text: string): unknown {
+  if (!text) return undefined;
+  try {
+    return JSON.parse(text);
+  } catch {
+    return text;
+  }
+}
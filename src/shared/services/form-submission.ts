@@ -1,6 +1,14 @@
 // Types
 import type { ContactFormData, JobApplicationData, FormSubmissionResult } from "@/shared/lib/form-validation";
 
+// Services
+import {
+  uploadFileChunked,
+  uploadFileMultipart,
+  type UploadProgress,
+  type UploadResult,
+} from "@/shared/services/file-upload";
+
 // Types
 interface ContactSubmissionPayload extends Omit<ContactFormData, 'consent'> {
   submittedAt: string;
@@ -9,18 +17,37 @@ interface ContactSubmissionPayload extends Omit<ContactFormData, 'consent'> {
 }
 
 interface JobSubmissionPayload extends Omit<JobApplicationData, 'cvFile' | 'gdprConsent'> {
-  cvBase64?: string;
   cvFileName?: string;
+  cvUploadId?: string;
+  cvChecksum?: string;
   submittedAt: string;
   formType: 'job-application';
 }
 
+export interface JobApplicationSubmitOptions {
+  signal?: AbortSignal;
+  onProgress?: (progress: UploadProgress) => void;
+}
+
 // Constants
 const FORMSUBMIT_ENDPOINTS = {
   contact: "https://formsubmit.co/ajax/sales@pacon-re.de",
   career: "https://formsubmit.co/ajax/career@pacon-re.de",
 } as const;
 
+// Carries whether a failed submission may succeed on a later attempt
+class SubmissionError extends Error {
+  retryable: boolean;
+
+  constructor(message: string, retryable: boolean) {
+    super(message);
+    this.retryable = retryable;
+  }
+}
+
+// Optional resumable upload endpoint (see contract 3.5); falls back to multipart when unset
+const CV_UPLOAD_ENDPOINT = import.meta.env.VITE_CV_UPLOAD_ENDPOINT;
+
 // Service: Submit Contact Form
 export async function submitContactForm(data: ContactFormData): Promise<FormSubmissionResult> {
   try {
@@ -46,13 +73,13 @@ export async function submitContactForm(data: ContactFormData): Promise<FormSubm
     });
 
     if (!response.ok) {
-      throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+      throw new SubmissionError(`HTTP ${response.status}: ${response.statusText}`, isRetryableStatus(response.status));
     }
 
     const result = await response.json();
 
     if (result.success === false) {
-      throw new Error(result.message || "Submission failed");
+      throw new SubmissionError(result.message || "Submission failed", false);
     }
 
     return {
@@ -64,51 +91,70 @@ export async function submitContactForm(data: ContactFormData): Promise<FormSubm
     return {
       state: "error",
       message: "Übertragung fehlgeschlagen. Bitte versuchen Sie es erneut.",
+      retryable: isRetryableError(error),
     };
   }
 }
 
 // Service: Submit Job Application
-export async function submitJobApplication(data: JobApplicationData): Promise<FormSubmissionResult> {
-  try {
-    // Convert CV file to base64 if provided
-    let cvBase64: string | undefined;
-    let cvFileName: string | undefined;
-
-    if (data.cvFile) {
-      cvBase64 = await fileToBase64(data.cvFile);
-      cvFileName = data.cvFile.name;
-    }
+// The CV is sent as binary (multipart, or resumable chunks when
+// VITE_CV_UPLOAD_ENDPOINT is configured) instead of a base64 JSON field.
+export async function submitJobApplication(
+  data: JobApplicationData,
+  options: JobApplicationSubmitOptions = {}
+): Promise<FormSubmissionResult> {
+  const { signal, onProgress } = options;
 
+  try {
     const payload: JobSubmissionPayload = {
       name: data.name,
       email: data.email,
       location: data.location || '',
       jobTitle: data.jobTitle,
       message: data.message || '',
-      cvBase64,
-      cvFileName,
+      cvFileName: data.cvFile?.name,
       submittedAt: new Date().toISOString(),
       formType: 'job-application',
     };
 
-    const response = await fetch(FORMSUBMIT_ENDPOINTS.career, {
-      method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-      },
-      body: JSON.stringify(payload),
-    });
+    let result: UploadResult;
+
+    if (CV_UPLOAD_ENDPOINT && data.cvFile) {
+      const upload = await uploadFileChunked(data.cvFile, {
+        endpoint: CV_UPLOAD_ENDPOINT,
+        signal,
+        onProgress,
+      });
+
+      if (!upload.success) {
+        throw new SubmissionError(upload.error || "CV upload failed", isRetryableStatus(upload.status));
+      }
+
+      result = await postJson(FORMSUBMIT_ENDPOINTS.career, {
+        ...payload,
+        cvUploadId: upload.uploadId,
+        cvChecksum: upload.checksum,
+      }, signal);
+    } else if (data.cvFile) {
+      result = await uploadFileMultipart(data.cvFile, {
+        endpoint: FORMSUBMIT_ENDPOINTS.career,
+        fields: toFormFields(payload),
+        signal,
+        onProgress,
+      });
+    } else {
+      result = await postJson(FORMSUBMIT_ENDPOINTS.career, payload, signal);
+    }
 
-    if (!response.ok) {
-      throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+    if (!result.success) {
+      // No status: the request never got a response (network failure)
+      throw new SubmissionError(result.error || "Submission failed", isRetryableStatus(result.status));
     }
 
-    const result = await response.json();
+    const body = result.body as { success?: boolean | string; message?: string } | undefined;
 
-    if (result.success === false) {
-      throw new Error(result.message || "Submission failed");
+    if (body?.success === false || body?.success === "false") {
+      throw new SubmissionError(body.message || "Submission failed", false);
     }
 
     return {
@@ -116,23 +162,67 @@ export async function submitJobApplication(data: JobApplicationData): Promise<Fo
       message: "Danke für Ihre Bewerbung. Wir melden uns innerhalb von 5 Werktagen.",
     };
   } catch (error) {
+    if (signal?.aborted) {
+      return {
+        state: "error",
+        message: "Übertragung abgebrochen.",
+      };
+    }
+
     console.error("Job application submission error:", error);
     return {
       state: "error",
       message: "Übertragung fehlgeschlagen. Bitte versuchen Sie es erneut.",
+      retryable: isRetryableError(error),
     };
   }
 }
 
-// Helper: Convert File to base64
-function fileToBase64(file: File): Promise<string> {
-  return new Promise((resolve, reject) => {
-    const reader = new FileReader();
-    reader.onload = () => {
-      const result = reader.result as string;
-      resolve(result);
+// Helper: POST JSON payload and normalize the response into an UploadResult
+async function postJson(endpoint: string, payload: object, signal?: AbortSignal): Promise<UploadResult> {
+  const response = await fetch(endpoint, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+      "Accept": "application/json",
+    },
+    body: JSON.stringify(payload),
+    signal,
+  });
+
+  if (!response.ok) {
+    return {
+      success: false,
+      status: response.status,
+      error: `HTTP ${response.status}: ${response.statusText}`,
     };
-    reader.onerror = reject;
-    reader.readAsDataURL(file);
+  }
+
+  return {
+    success: true,
+    status: response.status,
+    body: await response.json(),
+  };
+}
+
+// Helper: Missing status = no response (offline, DNS, CORS); timeouts, rate limits and server errors are transient
+function isRetryableStatus(status?: number): boolean {
+  return status === undefined || status === 408 || status === 429 || status >= 500;
+}
+
+// Helper: fetch rejects with a TypeError when the network is unavailable
+function isRetryableError(error: unknown): boolean {
+  if (error instanceof SubmissionError) return error.retryable;
+  return error instanceof TypeError;
+}
+
+// Helper: Flatten payload into multipart text fields
+function toFormFields(payload: object): Record<string, string> {
+  const fields: Record<string, string> = {};
+  Object.entries(payload).forEach(([key, value]) => {
+    if (value !== undefined) {
+      fields[key] = String(value);
+    }
   });
-}
\ No newline at end of file
+  return fields;
+}
@@ -0,0 +1,466 @@
+// Types
+import type { ContactFormData, JobApplicationData, FormSubmissionResult } from "@/shared/lib/form-validation";
+
+// Services
+import {
+  submitContactForm,
+  submitJobApplication,
+  type JobApplicationSubmitOptions,
+} from "@/shared/services/form-submission";
+
+// Types
+export type OutboxFormType = "sales" | "career";
+
+// inflight: claimed by a sender until nextAttemptAt (lease), then due again
+// failed: retries exhausted or rejected by the server - handed back to the form
+type OutboxStatus = "pending" | "inflight" | "sent" | "failed";
+
+interface OutboxPayloadMap {
+  sales: ContactFormData;
+  career: JobApplicationData;
+}
+
+interface OutboxEntry {
+  id: string;
+  formType: OutboxFormType;
+  emailHash: string;
+  createdAt: number;
+  status: OutboxStatus;
+  attempts: number;
+  nextAttemptAt: number;
+  payload?: ContactFormData | JobApplicationData; // dropped once sent
+}
+
+// Constants
+const DB_NAME = "pacon-forms";
+const DB_VERSION = 1;
+const STORE_NAME = "submissions";
+const INDEX_FORM_EMAIL_TIME = "by_form_email_time";
+const INDEX_CREATED_AT = "by_created_at";
+const INDEX_STATUS_NEXT = "by_status_next_attempt";
+
+const SENT_TTL_MS = 24 * 60 * 60 * 1000; // Matches duplicate window (FR-049)
+const PENDING_TTL_MS = 7 * 24 * 60 * 60 * 1000;
+const RETRY_BASE_DELAY_MS = 2_000;
+const RETRY_MAX_DELAY_MS = 5 * 60 * 1000;
+const MAX_ATTEMPTS = 8;
+const CLAIM_LEASE_MS = 5 * 60 * 1000; // Covers a full CV upload; an expired lease means the sending tab is gone
+const LOCK_BUSY_DELAY_MS = 30_000; // Another tab holds the drain lock and reschedules itself
+const DRAIN_LOCK_NAME = "pacon-outbox-drain";
+
+// Abort reason for an explicit cancel by the user - drops the submission.
+// Any other abort (unmount, leaving the page) hands it to the background drain.
+export const SUBMISSION_CANCELLED = "submission-cancelled";
+
+const QUEUED_MESSAGES: Record<OutboxFormType, string> = {
+  sales: "Keine Verbindung. Ihre Anfrage wird automatisch gesendet, sobald Sie wieder online sind.",
+  career: "Keine Verbindung. Ihre Bewerbung wird automatisch gesendet, sobald Sie wieder online sind.",
+};
+
+type OutboxSender<K extends OutboxFormType> = (
+  payload: OutboxPayloadMap[K],
+  options?: JobApplicationSubmitOptions
+) => Promise<FormSubmissionResult>;
+
+const SENDERS: { [K in OutboxFormType]: OutboxSender<K> } = {
+  sales: (payload) => submitContactForm(payload),
+  career: (payload, options) => submitJobApplication(payload, options),
+};
+
+// Module state
+let databasePromise: Promise<IDBDatabase | null> | null = null;
+let drainTimer: ReturnType<typeof setTimeout> | null = null;
+let isDraining = false;
+let isStarted = false;
+const inFlightSubmissions = new Map<string, Promise<FormSubmissionResult>>();
+
+// Service: Submit through the outbox
+// Persists the submission first, tries to send immediately and leaves it
+// queued for background retry if the network is unavailable.
+// Options (progress, abort) only apply to the immediate attempt; see
+// SUBMISSION_CANCELLED for how an abort is treated.
+export async function submitViaOutbox<K extends OutboxFormType>(
+  formType: K,
+  payload: OutboxPayloadMap[K],
+  options: JobApplicationSubmitOptions = {}
+): Promise<FormSubmissionResult> {
+  const emailHash = await hashEmail(payload.email);
+  const coalesceKey = `${formType}:${emailHash}`;
+
+  // Coalesce rapid double-submits into the same in-flight promise
+  const inFlight = inFlightSubmissions.get(coalesceKey);
+  if (inFlight) {
+    return inFlight;
+  }
+
+  const submission = sendThroughOutbox(formType, emailHash, payload, options)
+    .finally(() => inFlightSubmissions.delete(coalesceKey));
+
+  inFlightSubmissions.set(coalesceKey, submission);
+  return submission;
+}
+
+// Service: Find the most recent submission for a form/email inside a time window
+// Single bounded lookup on the (formType, emailHash, createdAt) index.
+export async function hasRecentSubmission(
+  formType: OutboxFormType,
+  email: string,
+  windowMs: number
+): Promise<boolean> {
+  const db = await getDatabase();
+  if (!db) return false;
+
+  const emailHash = await hashEmail(email);
+  const range = IDBKeyRange.bound([formType, emailHash, Date.now() - windowMs], [formType, emailHash, Infinity]);
+  const tx = db.transaction(STORE_NAME, "readonly");
+  const entries = await requestToPromise(
+    tx.objectStore(STORE_NAME).index(INDEX_FORM_EMAIL_TIME).getAll(range)
+  ) as OutboxEntry[];
+
+  // Failed submissions were never delivered - they must not block a new attempt
+  return entries.some((entry) => entry.status !== "failed");
+}
+
+// Service: Take back the most recent failed submission of a form
+// Removes it from the outbox; the form prefills the returned data and tells
+// the user that it could not be delivered.
+export async function takeFailedSubmission<K extends OutboxFormType>(formType: K): Promise<OutboxPayloadMap[K] | null> {
+  const db = await getDatabase();
+  if (!db) return null;
+
+  const tx = db.transaction(STORE_NAME, "readwrite");
+  const store = tx.objectStore(STORE_NAME);
+  const failed = (await requestToPromise(
+    store.index(INDEX_STATUS_NEXT).getAll(IDBKeyRange.bound(["failed", 0], ["failed", Infinity]))
+  ) as OutboxEntry[]).filter((entry) => entry.formType === formType && entry.payload);
+
+  failed.forEach((entry) => store.delete(entry.id));
+  await transactionDone(tx);
+
+  const latest = failed.sort((a, b) => b.createdAt - a.createdAt)[0];
+  return latest ? (latest.payload as OutboxPayloadMap[K]) : null;
+}
+
+// Service: Evict expired entries
+// Walks only the expired createdAt range instead of scanning all storage.
+// Failed entries the form never took back expire like pending ones, so their
+// payload (CV, contact data) does not stay in storage forever.
+export async function evictExpiredSubmissions(): Promise<void> {
+  const db = await getDatabase();
+  if (!db) return;
+
+  const now = Date.now();
+  const tx = db.transaction(STORE_NAME, "readwrite");
+  const index = tx.objectStore(STORE_NAME).index(INDEX_CREATED_AT);
+  const request = index.openCursor(IDBKeyRange.upperBound(now - SENT_TTL_MS));
+
+  request.onsuccess = () => {
+    const cursor = request.result;
+    if (!cursor) return;
+
+    const entry = cursor.value as OutboxEntry;
+    if (entry.status === "sent" || entry.createdAt < now - PENDING_TTL_MS) {
+      cursor.delete();
+    }
+    cursor.continue();
+  };
+
+  await transactionDone(tx);
+}
+
+// Service: Start background draining (call once at app start)
+export function startSubmissionOutbox(): void {
+  if (isStarted || typeof window === "undefined") return;
+  isStarted = true;
+
+  window.addEventListener("online", () => void drainOutbox());
+
+  runWhenIdle(() => {
+    void evictExpiredSubmissions().then(drainOutbox);
+  });
+}
+
+// Service: Send all due pending entries
+export async function drainOutbox(): Promise<void> {
+  if (isDraining || !navigator.onLine) return;
+
+  isDraining = true;
+  let drained = false;
+  try {
+    // Only one tab drains at a time when Web Locks are available
+    if (navigator.locks) {
+      await navigator.locks.request(DRAIN_LOCK_NAME, { ifAvailable: true }, async (lock) => {
+        if (!lock) return;
+        drained = true;
+        await drainDueEntries();
+      });
+    } else {
+      drained = true;
+      await drainDueEntries();
+    }
+  } catch (error) {
+    console.error("Submission outbox drain error:", error);
+  } finally {
+    isDraining = false;
+  }
+
+  // Lock busy: the due entries are still due here, so rescheduling by them would spin
+  if (drained) {
+    await scheduleNextDrain();
+  } else {
+    scheduleDrainIn(LOCK_BUSY_DELAY_MS);
+  }
+}
+
+// Helper: Persist, attempt once, and queue on failure
+async function sendThroughOutbox<K extends OutboxFormType>(
+  formType: K,
+  emailHash: string,
+  payload: OutboxPayloadMap[K],
+  options: JobApplicationSubmitOptions
+): Promise<FormSubmissionResult> {
+  const db = await getDatabase();
+  const now = Date.now();
+  const isOffline = !navigator.onLine;
+  const entry: OutboxEntry = {
+    id: createId(),
+    formType,
+    emailHash,
+    createdAt: now,
+    // Claimed by the immediate attempt - drains skip it until the lease expires
+    status: isOffline ? "pending" : "inflight",
+    attempts: 0,
+    nextAttemptAt: isOffline ? now : now + CLAIM_LEASE_MS,
+    payload,
+  };
+
+  // IndexedDB unavailable (e.g. private mode) - plain single attempt
+  if (!db) {
+    return SENDERS[formType](payload, options);
+  }
+
+  await putEntry(db, entry);
+
+  if (isOffline) {
+    await scheduleNextDrain();
+    return { state: "queued", message: QUEUED_MESSAGES[formType] };
+  }
+
+  const result = await SENDERS[formType](payload, options);
+
+  if (options.signal?.aborted) {
+    // Cancelled by the user - drop instead of retrying in the background
+    if (options.signal.reason === SUBMISSION_CANCELLED) {
+      await deleteEntry(db, entry.id);
+      return result;
+    }
+
+    // Interrupted (form unmounted) - release the claim so the next drain sends it
+    await putEntry(db, { ...entry, status: "pending", nextAttemptAt: Date.now() });
+    await scheduleNextDrain();
+    return { state: "queued", message: QUEUED_MESSAGES[formType] };
+  }
+
+  if (result.state !== "success" && !result.retryable) {
+    // Rejected (4xx, validation) - the user sees the error and can correct and resend
+    await deleteEntry(db, entry.id);
+    return result;
+  }
+
+  await recordAttempt(db, entry, result);
+
+  if (result.state === "success") {
+    return result;
+  }
+
+  await scheduleNextDrain();
+  return { state: "queued", message: QUEUED_MESSAGES[formType] };
+}
+
+async function drainDueEntries(): Promise<void> {
+  const db = await getDatabase();
+  if (!db) return;
+
+  const due = await claimDueEntries(db);
+
+  // Network calls happen outside the transaction, one entry at a time
+  for (const entry of due) {
+    if (!navigator.onLine) {
+      // Release the remaining claims so the next online drain picks them up
+      await putEntry(db, { ...entry, status: "pending", nextAttemptAt: Date.now() });
+      continue;
+    }
+
+    const result = await sendEntry(entry);
+    await recordAttempt(db, entry, result);
+  }
+}
+
+// Helper: Claim due pending entries and expired inflight leases
+// Readwrite transactions on a store run one at a time (across tabs too), so
+// an entry is claimed by exactly one drain.
+async function claimDueEntries(db: IDBDatabase): Promise<OutboxEntry[]> {
+  const now = Date.now();
+  const tx = db.transaction(STORE_NAME, "readwrite");
+  const store = tx.objectStore(STORE_NAME);
+  const index = store.index(INDEX_STATUS_NEXT);
+
+  const [pending, expired] = await Promise.all([
+    requestToPromise(index.getAll(IDBKeyRange.bound(["pending", 0], ["pending", now]))),
+    requestToPromise(index.getAll(IDBKeyRange.bound(["inflight", 0], ["inflight", now]))),
+  ]) as [OutboxEntry[], OutboxEntry[]];
+
+  const claimed: OutboxEntry[] = [];
+  [...pending, ...expired].forEach((entry) => {
+    // Nothing to send - would otherwise stay due forever
+    if (!entry.payload) {
+      store.delete(entry.id);
+      return;
+    }
+    const claim: OutboxEntry = { ...entry, status: "inflight", nextAttemptAt: now + CLAIM_LEASE_MS };
+    store.put(claim);
+    claimed.push(claim);
+  });
+  await transactionDone(tx);
+
+  return claimed;
+}
+
+function sendEntry(entry: OutboxEntry): Promise<FormSubmissionResult> {
+  return entry.formType === "sales"
+    ? SENDERS.sales(entry.payload as ContactFormData)
+    : SENDERS.career(entry.payload as JobApplicationData);
+}
+
+async function recordAttempt(db: IDBDatabase, entry: OutboxEntry, result: FormSubmissionResult): Promise<void> {
+  const attempts = entry.attempts + 1;
+
+  if (result.state === "success") {
+    await putEntry(db, { ...entry, attempts, status: "sent", payload: undefined });
+    return;
+  }
+
+  // Rejected, or retries exhausted - keep it so the form can hand the data back to the user
+  if (!result.retryable || attempts >= MAX_ATTEMPTS) {
+    await putEntry(db, { ...entry, attempts, status: "failed", nextAttemptAt: Date.now() });
+    return;
+  }
+
+  await putEntry(db, { ...entry, attempts, status: "pending", nextAttemptAt: Date.now() + getBackoffDelay(attempts) });
+}
+
+async function scheduleNextDrain(): Promise<void> {
+  const db = await getDatabase();
+  if (!db) return;
+
+  // Earliest pending retry or inflight lease expiry (each index range is sorted by nextAttemptAt)
+  const tx = db.transaction(STORE_NAME, "readonly");
+  const index = tx.objectStore(STORE_NAME).index(INDEX_STATUS_NEXT);
+  const candidates = await Promise.all([
+    requestToPromise(index.get(IDBKeyRange.bound(["pending", 0], ["pending", Infinity]))),
+    requestToPromise(index.get(IDBKeyRange.bound(["inflight", 0], ["inflight", Infinity]))),
+  ]) as (OutboxEntry | undefined)[];
+
+  const nextAttemptAt = Math.min(...candidates.map((entry) => entry?.nextAttemptAt ?? Infinity));
+
+  if (nextAttemptAt === Infinity) {
+    if (drainTimer) {
+      clearTimeout(drainTimer);
+      drainTimer = null;
+    }
+    return;
+  }
+
+  scheduleDrainIn(nextAttemptAt - Date.now());
+}
+
+function scheduleDrainIn(delayMs: number): void {
+  if (drainTimer) {
+    clearTimeout(drainTimer);
+  }
+  drainTimer = setTimeout(() => void drainOutbox(), Math.max(0, delayMs));
+}
+
+// Helper: Exponential backoff with +/-20% jitter
+function getBackoffDelay(attempts: number): number {
+  const base = Math.min(RETRY_BASE_DELAY_MS * 2 ** (attempts - 1), RETRY_MAX_DELAY_MS);
+  return Math.round(base * (0.8 + Math.random() * 0.4));
+}
+
+// Helper: Open (and upgrade) the database once
+function getDatabase(): Promise<IDBDatabase | null> {
+  if (databasePromise) return databasePromise;
+
+  databasePromise = new Promise((resolve) => {
+    if (typeof indexedDB === "undefined") {
+      resolve(null);
+      return;
+    }
+
+    const request = indexedDB.open(DB_NAME, DB_VERSION);
+
+    request.onupgradeneeded = () => {
+      const store = request.result.createObjectStore(STORE_NAME, { keyPath: "id" });
+      store.createIndex(INDEX_FORM_EMAIL_TIME, ["formType", "emailHash", "createdAt"]);
+      store.createIndex(INDEX_CREATED_AT, "createdAt");
+      store.createIndex(INDEX_STATUS_NEXT, ["status", "nextAttemptAt"]);
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => {
+      console.error("Submission outbox unavailable:", request.error);
+      resolve(null);
+    };
+  });
+
+  return databasePromise;
+}
+
+async function putEntry(db: IDBDatabase, entry: OutboxEntry): Promise<void> {
+  const tx = db.transaction(STORE_NAME, "readwrite");
+  tx.objectStore(STORE_NAME).put(entry);
+  await transactionDone(tx);
+}
+
+async function deleteEntry(db: IDBDatabase, id: string): Promise<void> {
+  const tx = db.transaction(STORE_NAME, "readwrite");
+  tx.objectStore(STORE_NAME).delete(id);
+  await transactionDone(tx);
+}
+
+function requestToPromise<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function transactionDone(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+// Helper: Hash email for privacy (SHA-256, hex)
+async function hashEmail(email: string): Promise<string> {
+  const data = new TextEncoder().encode(email.toLowerCase().trim());
+  const digest = await crypto.subtle.digest("SHA-256", data);
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+}
+
+function createId(): string {
+  return typeof crypto.randomUUID === "function"
+    ? crypto.randomUUID()
+    : `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+}
+
+function runWhenIdle(callback: () => void): void {
+  if ("requestIdleCallback" in window) {
+    window.requestIdleCallback(callback, { timeout: 5_000 });
+  } else {
+    setTimeout(callback, 1_000);
+  }
+}
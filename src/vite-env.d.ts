@@ -0,0 +1,40 @@
+/// <reference types="vite/client" />
+
+interface ImportMetaEnv {
+  readonly VITE_CV_UPLOAD_ENDPOINT?: string;
+  readonly VITE_SUPABASE_URL?: string;
+  readonly VITE_SUPABASE_ANON_KEY?: string;
+}
+
+interface ImportMeta {
+  readonly env: ImportMetaEnv;
+}
+
+declare module "virtual:i18n-namespaces" {
+  type TranslationBundle = Record<string, unknown>;
+
+  /** Bundles registered before first render, per language. */
+  export const eagerResources: Record<string, TranslationBundle[]>;
+  /** Lazy namespace loaders with a content hash of all their locale files. */
+  export const namespaceLoaders: Record<
+    string,
+    { version: string; locales: Record<string, () => Promise<{ default: TranslationBundle }>> }
+  >;
+  /** Route path -> namespaces loaded alongside the route chunk. */
+  export const routeNamespaces: Record<string, string[]>;
+}
+
+declare module "virtual:responsive-images" {
+  export interface ResponsiveImageEntry {
+    /** Intrinsic size of the original. */
+    width: number;
+    height: number;
+    /** Tiny blurred data URI shown until the image has loaded. */
+    placeholder?: string;
+    /** One srcset per format, best compression first. Empty for SVGs. */
+    sources: { type: string; srcSet: string }[];
+  }
+
+  /** Original image URL -> generated variants. */
+  export const imageManifest: Record<string, ResponsiveImageEntry>;
+}
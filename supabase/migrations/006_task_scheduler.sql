@@ -0,0 +1,576 @@
+-- Migration 006: Task Graph Scheduler & Progress Rollups
+-- Created: 2026-10-17
+-- Dependencies: 004_project_phases_tasks.sql
+-- Purpose: Resolve task dependencies server-side (ready set, agent claims) and
+--          keep phase/function progress counters correct via triggers
+
+-- =====================================================
+-- PROGRESS COLUMNS
+-- =====================================================
+
+ALTER TABLE devkit.project_functions
+  ADD COLUMN total_tasks INTEGER NOT NULL DEFAULT 0,
+  ADD COLUMN completed_tasks INTEGER NOT NULL DEFAULT 0;
+
+-- =====================================================
+-- TASK DEPENDENCY EDGES TABLE
+-- =====================================================
+
+-- Normalized form of depends_on/blocks. The arrays stay the write API
+-- (seeds, planner agent); triggers below keep this table in sync.
+-- One row per "task_id cannot start before depends_on_task_id is done".
+--
+-- Missing prerequisites block: an edge mirrors the arrays even when
+-- depends_on_task_id names no task (typo, not created yet, deleted), and
+-- such a task is never ready. Hence no foreign key on depends_on_task_id -
+-- deleting a prerequisite keeps its edges, like the arrays keep its id.
+-- Edges exist only for dependents that exist (deleted with them).
+CREATE TABLE devkit.project_function_task_edges (
+  function_id UUID NOT NULL,
+  task_id TEXT NOT NULL,                      -- Dependent task ("T002")
+  depends_on_task_id TEXT NOT NULL,           -- Prerequisite task ("T001"), may not exist
+
+  PRIMARY KEY (function_id, task_id, depends_on_task_id),
+
+  FOREIGN KEY (function_id, task_id)
+    REFERENCES devkit.project_function_phase_tasks(function_id, task_id)
+    ON DELETE CASCADE ON UPDATE CASCADE
+);
+
+-- =====================================================
+-- INDEXES
+-- =====================================================
+
+-- Reverse lookup: which tasks wait for this one
+CREATE INDEX idx_task_edges_depends_on ON devkit.project_function_task_edges(function_id, depends_on_task_id);
+
+-- "Which tasks list X in blocks" (edge sync)
+CREATE INDEX idx_project_tasks_blocks ON devkit.project_function_phase_tasks USING gin(blocks);
+
+-- Ready set / claim order
+CREATE INDEX idx_project_tasks_pending_order ON devkit.project_function_phase_tasks(function_id, phase_number, task_id)
+  WHERE status = 'pending';
+
+-- =====================================================
+-- ROW LEVEL SECURITY
+-- =====================================================
+
+ALTER TABLE devkit.project_function_task_edges ENABLE ROW LEVEL SECURITY;
+
+-- Task Edges: Public read, authenticated write (written by task triggers)
+CREATE POLICY "project_task_edges_select_all" ON devkit.project_function_task_edges
+  FOR SELECT
+  TO public
+  USING (true);
+
+CREATE POLICY "project_task_edges_insert_authenticated" ON devkit.project_function_task_edges
+  FOR INSERT
+  TO authenticated
+  WITH CHECK (true);
+
+CREATE POLICY "project_task_edges_delete_authenticated" ON devkit.project_function_task_edges
+  FOR DELETE
+  TO authenticated
+  USING (true);
+
+-- =====================================================
+-- GRAPH LOCK
+-- =====================================================
+
+-- Serializes writers of one function's graph until commit. Without it two
+-- transactions could each add one half of a cycle and both pass the cycle
+-- check, neither seeing the other's uncommitted edges. Under READ COMMITTED
+-- (the default) statements after the lock see the edges committed meanwhile.
+CREATE OR REPLACE FUNCTION devkit.lock_task_graph(p_function_id UUID)
+RETURNS VOID AS $$
+  SELECT pg_advisory_xact_lock(hashtext('devkit.task_graph:' || p_function_id::text));
+$$ LANGUAGE sql;
+
+-- =====================================================
+-- EDGE SYNC (depends_on / blocks -> edges)
+-- =====================================================
+
+-- Rebuild the incoming edges of the given tasks from both array directions:
+-- own depends_on + every task of the function that lists them in blocks.
+-- A blocks entry naming a missing task gets its edge once that task is inserted.
+CREATE OR REPLACE FUNCTION devkit.sync_task_edges(p_function_id UUID, p_task_ids TEXT[])
+RETURNS VOID AS $$
+  WITH desired AS (
+    SELECT t.task_id, dependency AS depends_on_task_id
+    FROM devkit.project_function_phase_tasks t
+    CROSS JOIN LATERAL unnest(t.depends_on) AS dependency
+    WHERE t.function_id = p_function_id
+      AND t.task_id = ANY(p_task_ids)
+    UNION
+    SELECT blocked, t.task_id
+    FROM devkit.project_function_phase_tasks t
+    CROSS JOIN LATERAL unnest(t.blocks) AS blocked
+    WHERE t.function_id = p_function_id
+      AND t.blocks && p_task_ids
+      AND blocked = ANY(p_task_ids)
+      AND EXISTS (
+        SELECT 1 FROM devkit.project_function_phase_tasks b
+        WHERE b.function_id = p_function_id AND b.task_id = blocked
+      )
+  ), removed AS (
+    DELETE FROM devkit.project_function_task_edges e
+    WHERE e.function_id = p_function_id
+      AND e.task_id = ANY(p_task_ids)
+      AND NOT EXISTS (
+        SELECT 1 FROM desired d
+        WHERE d.task_id = e.task_id AND d.depends_on_task_id = e.depends_on_task_id
+      )
+  )
+  INSERT INTO devkit.project_function_task_edges (function_id, task_id, depends_on_task_id)
+  SELECT p_function_id, d.task_id, d.depends_on_task_id
+  FROM desired d
+  ON CONFLICT DO NOTHING;
+$$ LANGUAGE sql;
+
+-- Statement-level: one sync per function per statement, also for bulk inserts
+CREATE OR REPLACE FUNCTION devkit.sync_task_edges_trigger()
+RETURNS TRIGGER AS $$
+DECLARE
+  v_affected RECORD;
+BEGIN
+  IF TG_OP = 'INSERT' THEN
+    FOR v_affected IN
+      SELECT function_id, array_agg(DISTINCT task_id) AS task_ids
+      FROM (
+        SELECT function_id, task_id FROM new_tasks
+        UNION ALL
+        SELECT function_id, unnest(blocks) FROM new_tasks
+      ) affected
+      GROUP BY function_id
+      ORDER BY function_id -- fixed lock order across concurrent statements
+    LOOP
+      PERFORM devkit.lock_task_graph(v_affected.function_id);
+      PERFORM devkit.sync_task_edges(v_affected.function_id, v_affected.task_ids);
+    END LOOP;
+  ELSE
+    -- UPDATE: only rows whose arrays (or identity) actually changed
+    FOR v_affected IN
+      SELECT function_id, array_agg(DISTINCT task_id) AS task_ids
+      FROM (
+        SELECT n.function_id, n.task_id
+        FROM new_tasks n JOIN old_tasks o ON o.id = n.id
+        WHERE n.depends_on IS DISTINCT FROM o.depends_on
+           OR n.task_id IS DISTINCT FROM o.task_id
+           OR n.function_id IS DISTINCT FROM o.function_id
+        UNION ALL
+        SELECT n.function_id, unnest(coalesce(n.blocks, '{}') || coalesce(o.blocks, '{}'))
+        FROM new_tasks n JOIN old_tasks o ON o.id = n.id
+        WHERE n.blocks IS DISTINCT FROM o.blocks
+      ) affected
+      GROUP BY function_id
+      ORDER BY function_id -- fixed lock order across concurrent statements
+    LOOP
+      PERFORM devkit.lock_task_graph(v_affected.function_id);
+      PERFORM devkit.sync_task_edges(v_affected.function_id, v_affected.task_ids);
+    END LOOP;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables require one trigger per event
+CREATE TRIGGER sync_task_edges_on_insert
+  AFTER INSERT ON devkit.project_function_phase_tasks
+  REFERENCING NEW TABLE AS new_tasks
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION devkit.sync_task_edges_trigger();
+
+CREATE TRIGGER sync_task_edges_on_update
+  AFTER UPDATE ON devkit.project_function_phase_tasks
+  REFERENCING OLD TABLE AS old_tasks NEW TABLE AS new_tasks
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION devkit.sync_task_edges_trigger();
+
+-- =====================================================
+-- CYCLE DETECTION
+-- =====================================================
+
+-- Kahn's algorithm over the whole function graph, O(edges).
+-- Returns a task on or behind a cycle, NULL if the graph is a DAG.
+CREATE OR REPLACE FUNCTION devkit.find_task_cycle(p_function_id UUID)
+RETURNS TEXT AS $$
+DECLARE
+  v_frontier TEXT[];
+  v_cycle_task TEXT;
+BEGIN
+  DROP TABLE IF EXISTS pg_temp._kahn_edges;
+  DROP TABLE IF EXISTS pg_temp._kahn_unmet;
+
+  CREATE TEMP TABLE _kahn_edges ON COMMIT DROP AS
+    SELECT task_id, depends_on_task_id
+    FROM devkit.project_function_task_edges
+    WHERE function_id = p_function_id;
+  CREATE INDEX ON _kahn_edges(depends_on_task_id);
+
+  CREATE TEMP TABLE _kahn_unmet ON COMMIT DROP AS
+    SELECT task_id, count(*) AS unmet
+    FROM _kahn_edges
+    GROUP BY task_id;
+  ALTER TABLE _kahn_unmet ADD PRIMARY KEY (task_id);
+  ANALYZE _kahn_edges;
+  ANALYZE _kahn_unmet;
+
+  -- Start with prerequisites that have no prerequisites themselves
+  SELECT coalesce(array_agg(DISTINCT e.depends_on_task_id), '{}')
+  INTO v_frontier
+  FROM _kahn_edges e
+  WHERE NOT EXISTS (SELECT 1 FROM _kahn_unmet u WHERE u.task_id = e.depends_on_task_id);
+
+  WHILE cardinality(v_frontier) > 0 LOOP
+    WITH resolved AS (
+      SELECT task_id, count(*) AS n
+      FROM _kahn_edges
+      WHERE depends_on_task_id = ANY(v_frontier)
+      GROUP BY task_id
+    ), updated AS (
+      UPDATE _kahn_unmet u
+      SET unmet = u.unmet - resolved.n
+      FROM resolved
+      WHERE u.task_id = resolved.task_id
+      RETURNING u.task_id, u.unmet
+    )
+    SELECT coalesce(array_agg(task_id) FILTER (WHERE unmet = 0), '{}')
+    INTO v_frontier
+    FROM updated;
+  END LOOP;
+
+  SELECT task_id INTO v_cycle_task FROM _kahn_unmet WHERE unmet > 0 ORDER BY task_id LIMIT 1;
+  RETURN v_cycle_task;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION devkit.check_task_edges_acyclic()
+RETURNS TRIGGER AS $$
+DECLARE
+  v_new_edges INTEGER;
+  v_function_id UUID;
+  v_cycle_task TEXT;
+BEGIN
+  -- Also covers edges written directly; the checks below then see every
+  -- committed edge of these graphs
+  PERFORM devkit.lock_task_graph(locked.function_id)
+  FROM (SELECT DISTINCT function_id FROM new_edges ORDER BY function_id) locked;
+
+  SELECT count(*) INTO v_new_edges FROM new_edges;
+
+  IF v_new_edges <= 1000 THEN
+    -- Few new edges: walk prerequisites from each new edge; a cycle exists
+    -- if the walk gets back to the dependent task (only the reachable part is visited)
+    WITH RECURSIVE reach(function_id, origin, current_task) AS (
+      SELECT function_id, task_id, depends_on_task_id FROM new_edges
+      UNION
+      SELECT r.function_id, r.origin, e.depends_on_task_id
+      FROM reach r
+      JOIN devkit.project_function_task_edges e
+        ON e.function_id = r.function_id AND e.task_id = r.current_task
+    )
+    SELECT function_id, origin INTO v_function_id, v_cycle_task
+    FROM reach
+    WHERE current_task = origin
+    LIMIT 1;
+  ELSE
+    -- Bulk load: one linear pass per function instead of one walk per edge
+    FOR v_function_id IN SELECT DISTINCT function_id FROM new_edges LOOP
+      v_cycle_task := devkit.find_task_cycle(v_function_id);
+      EXIT WHEN v_cycle_task IS NOT NULL;
+    END LOOP;
+  END IF;
+
+  IF v_cycle_task IS NOT NULL THEN
+    RAISE EXCEPTION 'Task dependency cycle in function % (at task %)', v_function_id, v_cycle_task
+      USING ERRCODE = 'check_violation';
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER check_task_edges_acyclic_trigger
+  AFTER INSERT ON devkit.project_function_task_edges
+  REFERENCING NEW TABLE AS new_edges
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION devkit.check_task_edges_acyclic();
+
+-- =====================================================
+-- PROGRESS ROLLUPS
+-- =====================================================
+
+-- Incremental: apply per-statement deltas instead of recounting.
+-- Done = completed or skipped (both unblock dependents).
+CREATE OR REPLACE FUNCTION devkit.rollup_task_progress()
+RETURNS TRIGGER AS $$
+DECLARE
+  v_function_ids UUID[];
+  v_phase_ids UUID[];
+  v_total_deltas INTEGER[];
+  v_done_deltas INTEGER[];
+BEGIN
+  -- Aggregate per phase first; transition tables only exist for their event
+  IF TG_OP = 'INSERT' THEN
+    SELECT array_agg(function_id), array_agg(phase_id), array_agg(total_delta), array_agg(done_delta)
+    INTO v_function_ids, v_phase_ids, v_total_deltas, v_done_deltas
+    FROM (
+      SELECT function_id, phase_id, count(*)::int AS total_delta,
+             count(*) FILTER (WHERE status IN ('completed', 'skipped'))::int AS done_delta
+      FROM new_tasks
+      GROUP BY function_id, phase_id
+    ) deltas;
+  ELSIF TG_OP = 'DELETE' THEN
+    SELECT array_agg(function_id), array_agg(phase_id), array_agg(total_delta), array_agg(done_delta)
+    INTO v_function_ids, v_phase_ids, v_total_deltas, v_done_deltas
+    FROM (
+      SELECT function_id, phase_id, -count(*)::int AS total_delta,
+             -count(*) FILTER (WHERE status IN ('completed', 'skipped'))::int AS done_delta
+      FROM old_tasks
+      GROUP BY function_id, phase_id
+    ) deltas;
+  ELSE
+    SELECT array_agg(function_id), array_agg(phase_id), array_agg(total_delta), array_agg(done_delta)
+    INTO v_function_ids, v_phase_ids, v_total_deltas, v_done_deltas
+    FROM (
+      SELECT function_id, phase_id, sum(total)::int AS total_delta, sum(done)::int AS done_delta
+      FROM (
+        SELECT function_id, phase_id, 1 AS total, (status IN ('completed', 'skipped'))::int AS done FROM new_tasks
+        UNION ALL
+        SELECT function_id, phase_id, -1, -(status IN ('completed', 'skipped'))::int FROM old_tasks
+      ) changes
+      GROUP BY function_id, phase_id
+      HAVING sum(total) <> 0 OR sum(done) <> 0
+    ) deltas;
+  END IF;
+
+  -- Status-only updates (claims, review loop) end here
+  IF v_phase_ids IS NULL THEN
+    RETURN NULL;
+  END IF;
+
+  WITH deltas AS (
+    SELECT *
+    FROM unnest(v_function_ids, v_phase_ids, v_total_deltas, v_done_deltas)
+      AS d(function_id, phase_id, total_delta, done_delta)
+  ), phase_update AS (
+    UPDATE devkit.project_function_phases p
+    SET
+      total_tasks = p.total_tasks + d.total_delta,
+      completed_tasks = p.completed_tasks + d.done_delta,
+      status = CASE
+        WHEN p.total_tasks + d.total_delta > 0
+         AND p.completed_tasks + d.done_delta = p.total_tasks + d.total_delta THEN 'completed'::devkit.phase_status
+        WHEN p.status = 'completed' THEN 'in_progress'::devkit.phase_status -- reopened
+        ELSE p.status
+      END,
+      completed_at = CASE
+        WHEN p.total_tasks + d.total_delta > 0
+         AND p.completed_tasks + d.done_delta = p.total_tasks + d.total_delta THEN coalesce(p.completed_at, now())
+        ELSE NULL
+      END
+    FROM deltas d
+    WHERE p.id = d.phase_id
+  )
+  UPDATE devkit.project_functions f
+  SET
+    total_tasks = f.total_tasks + d.total_delta,
+    completed_tasks = f.completed_tasks + d.done_delta
+  FROM (
+    SELECT function_id, sum(total_delta) AS total_delta, sum(done_delta) AS done_delta
+    FROM deltas
+    GROUP BY function_id
+  ) d
+  WHERE f.id = d.function_id;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER rollup_task_progress_on_insert
+  AFTER INSERT ON devkit.project_function_phase_tasks
+  REFERENCING NEW TABLE AS new_tasks
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION devkit.rollup_task_progress();
+
+CREATE TRIGGER rollup_task_progress_on_update
+  AFTER UPDATE ON devkit.project_function_phase_tasks
+  REFERENCING OLD TABLE AS old_tasks NEW TABLE AS new_tasks
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION devkit.rollup_task_progress();
+
+CREATE TRIGGER rollup_task_progress_on_delete
+  AFTER DELETE ON devkit.project_function_phase_tasks
+  REFERENCING OLD TABLE AS old_tasks
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION devkit.rollup_task_progress();
+
+-- Full recount (repair tool, also used for the backfill below)
+CREATE OR REPLACE FUNCTION devkit.recalculate_task_progress(p_function_id UUID)
+RETURNS VOID AS $$
+BEGIN
+  UPDATE devkit.project_function_phases p
+  SET
+    total_tasks = (SELECT count(*) FROM devkit.project_function_phase_tasks t WHERE t.phase_id = p.id),
+    completed_tasks = (
+      SELECT count(*) FROM devkit.project_function_phase_tasks t
+      WHERE t.phase_id = p.id AND t.status IN ('completed', 'skipped')
+    )
+  WHERE p.function_id = p_function_id;
+
+  UPDATE devkit.project_functions f
+  SET
+    total_tasks = (SELECT count(*) FROM devkit.project_function_phase_tasks t WHERE t.function_id = f.id),
+    completed_tasks = (
+      SELECT count(*) FROM devkit.project_function_phase_tasks t
+      WHERE t.function_id = f.id AND t.status IN ('completed', 'skipped')
+    )
+  WHERE f.id = p_function_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- SCHEDULER API
+-- =====================================================
+
+-- Pending tasks whose prerequisites are all done, in execution order.
+-- A task referencing a missing prerequisite is never ready (see edges table).
+CREATE OR REPLACE FUNCTION devkit.ready_tasks(p_function_id UUID)
+RETURNS SETOF devkit.project_function_phase_tasks AS $$
+  SELECT t.*
+  FROM devkit.project_function_phase_tasks t
+  WHERE t.function_id = p_function_id
+    AND t.status = 'pending'
+    AND NOT EXISTS (
+      SELECT 1
+      FROM devkit.project_function_task_edges e
+      LEFT JOIN devkit.project_function_phase_tasks d
+        ON d.function_id = e.function_id AND d.task_id = e.depends_on_task_id
+      WHERE e.function_id = t.function_id
+        AND e.task_id = t.task_id
+        AND (d.status IS NULL OR d.status NOT IN ('completed', 'skipped'))
+    )
+  ORDER BY t.phase_number, t.task_id;
+$$ LANGUAGE sql STABLE;
+
+-- Claim ready tasks for an agent in one statement. Concurrent callers never
+-- get the same task (SKIP LOCKED) and never wait on each other; at most
+-- p_limit rows are locked. [P] tasks are claimed in batches of up to p_limit;
+-- a task without [P] is always claimed on its own.
+CREATE OR REPLACE FUNCTION devkit.claim_ready_tasks(
+  p_function_id UUID,
+  p_agent devkit.agent_status,
+  p_limit INTEGER DEFAULT 1
+)
+RETURNS SETOF devkit.project_function_phase_tasks AS $$
+  WITH candidates AS (
+    SELECT t.id, t.phase_number, t.task_id, t.is_parallelizable
+    FROM devkit.project_function_phase_tasks t
+    WHERE t.function_id = p_function_id
+      AND t.status = 'pending'
+      AND NOT EXISTS (
+        SELECT 1
+        FROM devkit.project_function_task_edges e
+        LEFT JOIN devkit.project_function_phase_tasks d
+          ON d.function_id = e.function_id AND d.task_id = e.depends_on_task_id
+        WHERE e.function_id = t.function_id
+          AND e.task_id = t.task_id
+          AND (d.status IS NULL OR d.status NOT IN ('completed', 'skipped'))
+      )
+    ORDER BY t.phase_number, t.task_id -- follows idx_project_tasks_pending_order, stops early
+    LIMIT p_limit
+    FOR UPDATE OF t SKIP LOCKED
+  ), batch AS (
+    -- The first candidate, then the following ones while all so far are [P]
+    SELECT id
+    FROM (
+      SELECT id,
+             row_number() OVER claim_order AS position,
+             bool_and(is_parallelizable) OVER claim_order AS all_parallel
+      FROM candidates
+      WINDOW claim_order AS (ORDER BY phase_number, task_id)
+    ) ordered
+    WHERE position = 1 OR all_parallel
+  ), claimed AS (
+    UPDATE devkit.project_function_phase_tasks t
+    SET status = 'coding',
+        assigned_agent = p_agent,
+        started_at = coalesce(t.started_at, now())
+    WHERE t.id IN (SELECT id FROM batch)
+    RETURNING t.*
+  ), started_phases AS (
+    -- First claim starts the phase
+    UPDATE devkit.project_function_phases p
+    SET status = 'in_progress',
+        started_at = coalesce(p.started_at, now())
+    WHERE p.id IN (SELECT phase_id FROM claimed)
+      AND p.status = 'pending'
+  )
+  SELECT * FROM claimed ORDER BY phase_number, task_id;
+$$ LANGUAGE sql;
+
+-- Mark a task done; dependents become ready, rollups update via triggers
+CREATE OR REPLACE FUNCTION devkit.complete_task(
+  p_function_id UUID,
+  p_task_id TEXT,
+  p_status devkit.task_status DEFAULT 'completed'
+)
+RETURNS devkit.project_function_phase_tasks AS $$
+DECLARE
+  v_task devkit.project_function_phase_tasks;
+BEGIN
+  IF p_status NOT IN ('completed', 'skipped') THEN
+    RAISE EXCEPTION 'complete_task expects completed or skipped, got %', p_status;
+  END IF;
+
+  UPDATE devkit.project_function_phase_tasks
+  SET status = p_status,
+      completed_at = now()
+  WHERE function_id = p_function_id
+    AND task_id = p_task_id
+  RETURNING * INTO v_task;
+
+  IF v_task.id IS NULL THEN
+    RAISE EXCEPTION 'Task % not found in function %', p_task_id, p_function_id;
+  END IF;
+
+  RETURN v_task;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- BACKFILL
+-- =====================================================
+
+DO $$
+DECLARE
+  v_function RECORD;
+BEGIN
+  FOR v_function IN
+    SELECT function_id, array_agg(task_id) AS task_ids
+    FROM devkit.project_function_phase_tasks
+    GROUP BY function_id
+  LOOP
+    PERFORM devkit.sync_task_edges(v_function.function_id, v_function.task_ids);
+  END LOOP;
+
+  FOR v_function IN SELECT id FROM devkit.project_functions LOOP
+    PERFORM devkit.recalculate_task_progress(v_function.id);
+  END LOOP;
+END;
+$$;
+
+-- =====================================================
+-- COMMENTS
+-- =====================================================
+
+COMMENT ON TABLE devkit.project_function_task_edges IS 'Normalized task dependencies, derived from depends_on/blocks by trigger. Cycles are rejected; a missing prerequisite blocks its dependent.';
+COMMENT ON COLUMN devkit.project_function_phases.completed_tasks IS 'Trigger-maintained: tasks with status completed or skipped';
+COMMENT ON COLUMN devkit.project_functions.total_tasks IS 'Trigger-maintained: number of tasks across all phases';
+COMMENT ON COLUMN devkit.project_functions.completed_tasks IS 'Trigger-maintained: tasks with status completed or skipped';
+COMMENT ON FUNCTION devkit.ready_tasks(UUID) IS 'Pending tasks with all prerequisites done, ordered by phase and task_id';
+COMMENT ON FUNCTION devkit.claim_ready_tasks(UUID, devkit.agent_status, INTEGER) IS 'Atomically assign ready tasks to an agent (FOR UPDATE SKIP LOCKED); non-[P] tasks are claimed alone';
+COMMENT ON FUNCTION devkit.complete_task(UUID, TEXT, devkit.task_status) IS 'Mark a task completed/skipped; unblocks dependents and updates rollups';
+COMMENT ON FUNCTION devkit.recalculate_task_progress(UUID) IS 'Full recount of phase/function task counters (repair)';
+COMMENT ON FUNCTION devkit.lock_task_graph(UUID) IS 'Transaction-scoped advisory lock serializing edge writes (and cycle checks) per function';
@@ -0,0 +1,190 @@
+-- Migration 007: Website Content Tables
+-- Created: 2026-10-17
+-- Dependencies: 001_schema.sql (update_updated_at_column)
+-- Purpose: Serve jobs, team, testimonials, project references and services from
+--          Supabase instead of the bundled src/shared/data/mock-*.ts files
+--          (read via src/shared/services/content.ts)
+
+-- Content lives in the public schema: it is what PostgREST exposes to the
+-- anon key by default, and none of it is devKit workflow data.
+
+-- =====================================================
+-- JOB LISTINGS TABLE
+-- =====================================================
+
+CREATE TABLE public.job_listings (
+  id TEXT PRIMARY KEY,                        -- "job-001"
+  title TEXT NOT NULL,
+  location TEXT NOT NULL CHECK (location IN ('Heidelberg', 'Berlin', 'Hamburg')),
+  entry_level TEXT NOT NULL,
+  employment_type TEXT NOT NULL,
+  tasks TEXT[] NOT NULL DEFAULT '{}',
+  profile_requirements TEXT[] NOT NULL DEFAULT '{}',
+  active BOOLEAN NOT NULL DEFAULT true,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TRIGGER update_job_listings_updated_at
+  BEFORE UPDATE ON public.job_listings
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+-- Pagination: the career page pages through active jobs (all, or one location) ordered by id
+CREATE INDEX idx_job_listings_active_id ON public.job_listings(id) WHERE active;
+CREATE INDEX idx_job_listings_active_location_id ON public.job_listings(location, id) WHERE active;
+
+-- Open positions per location for the job filter (one small request instead of counting client-side)
+CREATE VIEW public.job_location_counts
+WITH (security_invoker = true) AS
+SELECT location, COUNT(*)::INTEGER AS open_positions
+FROM public.job_listings
+WHERE active
+GROUP BY location;
+
+-- =====================================================
+-- TEAM MEMBERS TABLE
+-- =====================================================
+
+CREATE TABLE public.team_members (
+  id TEXT PRIMARY KEY,                        -- "team-001"
+  name TEXT NOT NULL,
+  role TEXT NOT NULL,
+  focus TEXT NOT NULL,
+  photo_url TEXT,
+  display_order INTEGER NOT NULL DEFAULT 0,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TRIGGER update_team_members_updated_at
+  BEFORE UPDATE ON public.team_members
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_team_members_display_order ON public.team_members(display_order);
+
+-- =====================================================
+-- TESTIMONIALS TABLE
+-- =====================================================
+
+CREATE TABLE public.testimonials (
+  id TEXT PRIMARY KEY,                        -- "testimonial-001"
+  text TEXT NOT NULL,
+  author TEXT,
+  author_function TEXT,
+  type TEXT NOT NULL CHECK (type IN ('customer', 'employee')),
+  display_order INTEGER NOT NULL DEFAULT 0,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TRIGGER update_testimonials_updated_at
+  BEFORE UPDATE ON public.testimonials
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_testimonials_display_order ON public.testimonials(display_order);
+
+-- =====================================================
+-- PROJECT REFERENCES TABLE
+-- =====================================================
+
+CREATE TABLE public.project_references (
+  id TEXT PRIMARY KEY,                        -- "project-001"
+  title TEXT NOT NULL,
+  description TEXT NOT NULL,
+  image_url TEXT NOT NULL,
+  display_order INTEGER NOT NULL DEFAULT 0,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TRIGGER update_project_references_updated_at
+  BEFORE UPDATE ON public.project_references
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_project_references_display_order ON public.project_references(display_order);
+
+-- =====================================================
+-- SERVICES TABLE
+-- =====================================================
+
+CREATE TABLE public.services (
+  id TEXT PRIMARY KEY,                        -- "service-001"
+  title TEXT NOT NULL,
+  description TEXT NOT NULL,
+  icon_name TEXT,
+  display_order INTEGER NOT NULL DEFAULT 0,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TRIGGER update_services_updated_at
+  BEFORE UPDATE ON public.services
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+CREATE INDEX idx_services_display_order ON public.services(display_order);
+
+-- =====================================================
+-- ROW LEVEL SECURITY
+-- =====================================================
+
+ALTER TABLE public.job_listings ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.team_members ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.testimonials ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.project_references ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.services ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Enable read access for all users"
+ON public.job_listings FOR SELECT TO public USING (true);
+
+CREATE POLICY "Enable insert for authenticated users"
+ON public.job_listings FOR INSERT TO authenticated WITH CHECK (true);
+
+CREATE POLICY "Enable update for authenticated users"
+ON public.job_listings FOR UPDATE TO authenticated USING (true);
+
+CREATE POLICY "Enable read access for all users"
+ON public.team_members FOR SELECT TO public USING (true);
+
+CREATE POLICY "Enable insert for authenticated users"
+ON public.team_members FOR INSERT TO authenticated WITH CHECK (true);
+
+CREATE POLICY "Enable update for authenticated users"
+ON public.team_members FOR UPDATE TO authenticated USING (true);
+
+CREATE POLICY "Enable read access for all users"
+ON public.testimonials FOR SELECT TO public USING (true);
+
+CREATE POLICY "Enable insert for authenticated users"
+ON public.testimonials FOR INSERT TO authenticated WITH CHECK (true);
+
+CREATE POLICY "Enable update for authenticated users"
+ON public.testimonials FOR UPDATE TO authenticated USING (true);
+
+CREATE POLICY "Enable read access for all users"
+ON public.project_references FOR SELECT TO public USING (true);
+
+CREATE POLICY "Enable insert for authenticated users"
+ON public.project_references FOR INSERT TO authenticated WITH CHECK (true);
+
+CREATE POLICY "Enable update for authenticated users"
+ON public.project_references FOR UPDATE TO authenticated USING (true);
+
+CREATE POLICY "Enable read access for all users"
+ON public.services FOR SELECT TO public USING (true);
+
+CREATE POLICY "Enable insert for authenticated users"
+ON public.services FOR INSERT TO authenticated WITH CHECK (true);
+
+CREATE POLICY "Enable update for authenticated users"
+ON public.services FOR UPDATE TO authenticated USING (true);
+
+-- =====================================================
+-- COMMENTS
+-- =====================================================
+
+COMMENT ON TABLE public.job_listings IS 'Open positions on the career page; inactive rows are hidden';
+COMMENT ON VIEW public.job_location_counts IS 'Active job count per location (job filter labels)';
+COMMENT ON TABLE public.team_members IS 'Team profiles on the career page';
+COMMENT ON TABLE public.testimonials IS 'Customer (about page) and employee (career page) quotes';
+COMMENT ON TABLE public.project_references IS 'Project gallery on main, about and sales pages';
+COMMENT ON TABLE public.services IS 'Core services on main and sales pages';
@@ -0,0 +1,210 @@
+// Node Core
+import { createHash } from "crypto";
+import { readFileSync, readdirSync } from "fs";
+import path from "path";
+import { gzipSync } from "zlib";
+
+// External Libraries
+import { normalizePath, type Plugin, type ResolvedConfig } from "vite";
+
+// Types
+export interface I18nNamespacesOptions {
+  /** Namespaces bundled into the entry chunk (needed by the app shell). */
+  eager: string[];
+  /** Route path -> namespaces fetched together with the route chunk. */
+  routes: Record<string, string[]>;
+}
+
+interface LocaleFile {
+  namespace: string;
+  language: string;
+  importPath: string; // root-relative, e.g. /src/pages/about/i18n/locales/de.json
+  version: string;
+}
+
+// Constants
+const VIRTUAL_ID = "virtual:i18n-namespaces";
+const RESOLVED_VIRTUAL_ID = `\0${VIRTUAL_ID}`;
+const LOCALE_FILE_PATTERN = /\/([^/]+)\/i18n\/locales\/([^/]+)\.json$/;
+const REPORT_FILE_NAME = "i18n-report.json";
+
+// Plugin: Route-scoped lazy i18n namespaces
+// Every `<name>/i18n/locales/<lng>.json` under src/ becomes namespace `<name>`
+// (src/shared -> "common"). Non-eager namespaces are emitted as separate
+// chunks and loaded via `virtual:i18n-namespaces`; the build prints the
+// namespace payload per route and writes dist/i18n-report.json.
+export function i18nNamespaces(options: I18nNamespacesOptions): Plugin {
+  let config: ResolvedConfig;
+  let localeFiles: LocaleFile[] = [];
+
+  return {
+    name: "i18n-namespaces",
+
+    configResolved(resolvedConfig) {
+      config = resolvedConfig;
+    },
+
+    buildStart() {
+      localeFiles = scanLocaleFiles(config.root);
+      localeFiles.forEach((file) => this.addWatchFile(path.join(config.root, file.importPath)));
+    },
+
+    resolveId(id) {
+      return id === VIRTUAL_ID ? RESOLVED_VIRTUAL_ID : null;
+    },
+
+    load(id) {
+      if (id !== RESOLVED_VIRTUAL_ID) return null;
+      return generateModule(localeFiles, options);
+    },
+
+    configureServer(server) {
+      // New or removed locale files change the generated loader table
+      const refresh = (file: string) => {
+        if (!LOCALE_FILE_PATTERN.test(normalizePath(file))) return;
+        localeFiles = scanLocaleFiles(config.root);
+        const module = server.moduleGraph.getModuleById(RESOLVED_VIRTUAL_ID);
+        if (module) server.moduleGraph.invalidateModule(module);
+        server.ws.send({ type: "full-reload" });
+      };
+      server.watcher.on("add", refresh);
+      server.watcher.on("unlink", refresh);
+    },
+
+    generateBundle(_outputOptions, bundle) {
+      const sizes = new Map<string, { raw: number; gzip: number }>();
+
+      Object.values(bundle).forEach((output) => {
+        if (output.type !== "chunk") return;
+
+        Object.entries(output.modules).forEach(([moduleId, rendered]) => {
+          const match = normalizePath(moduleId).match(LOCALE_FILE_PATTERN);
+          if (!match || !rendered.code) return;
+
+          const key = `${toNamespace(match[1])}/${match[2]}`;
+          sizes.set(key, {
+            raw: rendered.renderedLength,
+            gzip: gzipSync(rendered.code).length,
+          });
+        });
+      });
+
+      const report = buildReport(localeFiles, options, sizes);
+      this.emitFile({ type: "asset", fileName: REPORT_FILE_NAME, source: JSON.stringify(report, null, 2) });
+      printReport(config, report);
+    },
+  };
+}
+
+// Helper: Find all locale files below src/
+function scanLocaleFiles(root: string): LocaleFile[] {
+  const srcDir = path.join(root, "src");
+
+  return readdirSync(srcDir, { recursive: true, encoding: "utf8" })
+    .map((relativePath) => normalizePath(path.join("src", relativePath)))
+    .filter((relativePath) => LOCALE_FILE_PATTERN.test(`/${relativePath}`))
+    .sort()
+    .map((relativePath) => {
+      const [, directory, language] = `/${relativePath}`.match(LOCALE_FILE_PATTERN)!;
+      const content = readFileSync(path.join(root, relativePath));
+
+      return {
+        namespace: toNamespace(directory),
+        language,
+        importPath: `/${relativePath}`,
+        version: createHash("sha256").update(content).digest("hex").slice(0, 8),
+      };
+    });
+}
+
+function toNamespace(directory: string): string {
+  return directory === "shared" ? "common" : directory;
+}
+
+// Helper: Emit the virtual module source
+function generateModule(localeFiles: LocaleFile[], options: I18nNamespacesOptions): string {
+  const eager = new Set(options.eager);
+  const imports: string[] = [];
+  const eagerResources: Record<string, string[]> = {};
+  const loaders: Record<string, { version: string; locales: Record<string, string> }> = {};
+
+  localeFiles.forEach((file, index) => {
+    const importPath = JSON.stringify(file.importPath);
+
+    if (eager.has(file.namespace)) {
+      imports.push(`import eager${index} from ${importPath};`);
+      (eagerResources[file.language] ??= []).push(`eager${index}`);
+      return;
+    }
+
+    loaders[file.namespace] ??= { version: "", locales: {} };
+    loaders[file.namespace].locales[file.language] = `() => import(${importPath})`;
+  });
+
+  // Version = hash over all locale files of the namespace
+  Object.keys(loaders).forEach((namespace) => {
+    const versions = localeFiles.filter((file) => file.namespace === namespace).map((file) => file.version);
+    loaders[namespace].version = createHash("sha256").update(versions.join(":")).digest("hex").slice(0, 8);
+  });
+
+  const eagerSource = Object.entries(eagerResources)
+    .map(([language, names]) => `  ${JSON.stringify(language)}: [${names.join(", ")}],`)
+    .join("\n");
+
+  const loaderSource = Object.entries(loaders)
+    .map(([namespace, { version, locales }]) => {
+      const localeSource = Object.entries(locales)
+        .map(([language, loader]) => `${JSON.stringify(language)}: ${loader}`)
+        .join(", ");
+      return `  ${JSON.stringify(namespace)}: { version: ${JSON.stringify(version)}, locales: { ${localeSource} } },`;
+    })
+    .join("\n");
+
+  return [
+    ...imports,
+    "",
+    `export const eagerResources = {\n${eagerSource}\n};`,
+    `export const namespaceLoaders = {\n${loaderSource}\n};`,
+    `export const routeNamespaces = ${JSON.stringify(options.routes)};`,
+    "",
+  ].join("\n");
+}
+
+// Helper: Namespace payload per route (eager namespaces are shared by all routes)
+function buildReport(
+  localeFiles: LocaleFile[],
+  options: I18nNamespacesOptions,
+  sizes: Map<string, { raw: number; gzip: number }>
+) {
+  const languages = [...new Set(localeFiles.map((file) => file.language))];
+  const sumSizes = (namespaces: string[], language: string) =>
+    namespaces.reduce(
+      (total, namespace) => {
+        const size = sizes.get(`${namespace}/${language}`);
+        return { raw: total.raw + (size?.raw ?? 0), gzip: total.gzip + (size?.gzip ?? 0) };
+      },
+      { raw: 0, gzip: 0 }
+    );
+
+  return languages.map((language) => ({
+    language,
+    eager: { namespaces: options.eager, ...sumSizes(options.eager, language) },
+    routes: Object.entries(options.routes).map(([route, namespaces]) => ({
+      route,
+      namespaces,
+      ...sumSizes(namespaces, language),
+    })),
+  }));
+}
+
+function printReport(config: ResolvedConfig, report: ReturnType<typeof buildReport>): void {
+  const formatKb = (bytes: number) => `${(bytes / 1024).toFixed(2)} kB`;
+
+  report.forEach(({ language, eager, routes }) => {
+    config.logger.info(`\ni18n namespaces (${language}):`);
+    config.logger.info(`  [eager]  ${formatKb(eager.raw)} │ gzip: ${formatKb(eager.gzip)}  ${eager.namespaces.join(", ")}`);
+    routes.forEach(({ route, namespaces, raw, gzip }) => {
+      config.logger.info(`  ${route.padEnd(8)} ${formatKb(raw)} │ gzip: ${formatKb(gzip)}  ${namespaces.join(", ")}`);
+    });
+  });
+}
@@ -0,0 +1,175 @@
+// Node Core
+import type { ServerResponse } from "http";
+
+// External Libraries
+import type { Plugin } from "vite";
+
+// Seed Data
+import { mockJobListings } from "../src/shared/data/mock-jobs";
+import { mockProjectReferences } from "../src/shared/data/mock-projects";
+import { mockServices } from "../src/shared/data/mock-services";
+import { mockTeamProfiles } from "../src/shared/data/mock-team";
+import { mockTestimonials } from "../src/shared/data/mock-testimonials";
+
+// Types
+type Row = Record<string, unknown>;
+
+// Constants
+const MOUNT_PATH = "/__mock/supabase/rest/v1";
+const RESERVED_PARAMS = new Set(["select", "order", "limit", "offset"]);
+
+// Plugin: PostgREST stand-in for the content tables of 007_content.sql (dev server only)
+// Usage: VITE_SUPABASE_URL=/__mock/supabase VITE_SUPABASE_ANON_KEY=mock npm run dev
+// MOCK_CONTENT_LATENCY=400 delays every response (ms), MOCK_CONTENT_FAIL_RATE=0.2 fails
+// requests randomly, MOCK_CONTENT_JOBS=5000 pads the job catalog to exercise pagination.
+// Every request is logged, which makes deduplication and cache hits easy to verify.
+export function mockContentApi(): Plugin {
+  const latency = Number(process.env.MOCK_CONTENT_LATENCY ?? 0);
+  const failRate = Number(process.env.MOCK_CONTENT_FAIL_RATE ?? 0);
+  const tables = buildTables(Number(process.env.MOCK_CONTENT_JOBS ?? 0));
+  let requestCount = 0;
+
+  return {
+    name: "mock-content-api",
+    apply: "serve",
+    configureServer(server) {
+      server.middlewares.use(MOUNT_PATH, async (req, res) => {
+        const url = new URL(req.url ?? "/", "http://mock");
+        const table = url.pathname.split("/").filter(Boolean)[0] ?? "";
+
+        server.config.logger.info(`[mock-content] #${++requestCount} ${req.method} ${table}${decodeURIComponent(url.search)}`);
+        if (latency > 0) await new Promise((resolve) => setTimeout(resolve, latency));
+
+        if (req.method !== "GET") {
+          return sendJson(res, 405, { message: "The mock content API is read-only" });
+        }
+
+        const rows = tables[table];
+        if (!rows) {
+          return sendJson(res, 404, { code: "42P01", message: `relation "public.${table}" does not exist` });
+        }
+
+        if (Math.random() < failRate) {
+          return sendJson(res, 503, { message: "Injected failure" });
+        }
+
+        try {
+          const matches = sortRows(
+            rows.filter((row) => matchesFilters(row, url.searchParams)),
+            url.searchParams.get("order")
+          );
+          const offset = Number(url.searchParams.get("offset") ?? 0);
+          const limit = Number(url.searchParams.get("limit") ?? matches.length);
+          const page = matches.slice(offset, offset + limit).map((row) => selectColumns(row, url.searchParams.get("select")));
+
+          // supabase-js reads the total from Content-Range when count: "exact" is requested
+          const range = page.length > 0 ? `${offset}-${offset + page.length - 1}` : "*";
+          const wantsCount = String(req.headers.prefer ?? "").includes("count=exact");
+          res.setHeader("Content-Range", `${range}/${wantsCount ? matches.length : "*"}`);
+
+          sendJson(res, 200, page);
+        } catch (error) {
+          sendJson(res, 400, { message: String(error) });
+        }
+      });
+    },
+  };
+}
+
+// Helper: Seed data as snake_case rows, plus the job_location_counts view
+function buildTables(jobCount: number): Record<string, Row[]> {
+  const jobs = mockJobListings.map(toRow);
+
+  // Synthetic catalog: cycle the seed jobs with fresh ids and rotating locations
+  const locations = ["Heidelberg", "Berlin", "Hamburg"];
+  for (let n = jobs.length; n < jobCount; n++) {
+    const seed = jobs[n % mockJobListings.length];
+    jobs.push({
+      ...seed,
+      id: `job-${String(n + 1).padStart(5, "0")}`,
+      title: `${seed.title} #${n + 1}`,
+      location: locations[n % locations.length],
+      active: n % 7 !== 0,
+    });
+  }
+
+  const locationCounts = new Map<string, number>();
+  jobs.forEach((job) => {
+    if (job.active) locationCounts.set(job.location as string, (locationCounts.get(job.location as string) ?? 0) + 1);
+  });
+
+  return {
+    job_listings: jobs,
+    job_location_counts: [...locationCounts].map(([location, count]) => ({ location, open_positions: count })),
+    team_members: mockTeamProfiles.map(toRow),
+    testimonials: mockTestimonials.map(toRow),
+    project_references: mockProjectReferences.map(toRow),
+    services: mockServices.map(toRow),
+  };
+}
+
+// Helper: PostgREST horizontal filters (eq, neq, is, in) - every non-reserved param is a column filter
+function matchesFilters(row: Row, params: URLSearchParams): boolean {
+  for (const [column, expression] of params) {
+    if (RESERVED_PARAMS.has(column)) continue;
+
+    const [operator, ...rest] = expression.split(".");
+    const operand = rest.join(".");
+    const value = row[column];
+
+    switch (operator) {
+      case "eq":
+        if (String(value) !== operand) return false;
+        break;
+      case "neq":
+        if (String(value) === operand) return false;
+        break;
+      case "is":
+        if (String(value ?? "null") !== operand) return false;
+        break;
+      case "in":
+        if (!operand.replace(/^\(|\)$/g, "").split(",").includes(String(value))) return false;
+        break;
+      default:
+        throw new Error(`Unsupported filter operator "${operator}"`);
+    }
+  }
+  return true;
+}
+
+// Helper: order=col.asc,col2.desc (sorts a copy)
+function sortRows(rows: Row[], order: string | null): Row[] {
+  if (!order) return rows;
+
+  const keys = order.split(",").map((part) => {
+    const [column, direction] = part.split(".");
+    return { column, sign: direction === "desc" ? -1 : 1 };
+  });
+
+  return [...rows].sort((a, b) => {
+    for (const { column, sign } of keys) {
+      const left = a[column] as string | number;
+      const right = b[column] as string | number;
+      if (left < right) return -sign;
+      if (left > right) return sign;
+    }
+    return 0;
+  });
+}
+
+function selectColumns(row: Row, select: string | null): Row {
+  if (!select || select === "*") return row;
+  return Object.fromEntries(select.split(",").map((column) => [column, row[column] ?? null]));
+}
+
+function toRow(item: object): Row {
+  return Object.fromEntries(
+    Object.entries(item).map(([key, value]) => [key.replace(/[A-Z]/g, (char) => `_${char.toLowerCase()}`), value])
+  );
+}
+
+function sendJson(res: ServerResponse, status: number, body: unknown): void {
+  res.statusCode = status;
+  res.setHeader("Content-Type", "application/json");
+  res.end(JSON.stringify(body));
+}
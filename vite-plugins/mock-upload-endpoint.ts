@@ -0,0 +1,118 @@
+// Node Core
+import { createHash, randomUUID } from "crypto";
+import type { IncomingMessage, ServerResponse } from "http";
+
+// External Libraries
+import type { Plugin } from "vite";
+
+// Types
+interface UploadSession {
+  fileName: string;
+  size: number;
+  chunkSize: number;
+  totalChunks: number;
+  chunks: Map<number, Buffer>;
+  digests: Map<number, string>;
+}
+
+// Constants
+const MOUNT_PATH = "/__mock/upload";
+
+// Plugin: Local stand-in for the resumable CV upload endpoint (dev server only)
+// Usage: VITE_CV_UPLOAD_ENDPOINT=/__mock/upload npm run dev
+// Set MOCK_UPLOAD_FAIL_RATE=0.3 to randomly fail chunk PUTs and exercise retries.
+export function mockUploadEndpoint(): Plugin {
+  const sessions = new Map<string, UploadSession>();
+  const failRate = Number(process.env.MOCK_UPLOAD_FAIL_RATE ?? 0);
+
+  return {
+    name: "mock-upload-endpoint",
+    apply: "serve",
+    configureServer(server) {
+      server.middlewares.use(MOUNT_PATH, async (req, res) => {
+        const [uploadId, action] = (req.url ?? "/").split("?")[0].split("/").filter(Boolean);
+
+        try {
+          // POST /                      -> create session
+          if (req.method === "POST" && !uploadId) {
+            const meta = JSON.parse((await readBody(req)).toString("utf8"));
+            const id = randomUUID();
+            sessions.set(id, { ...meta, chunks: new Map(), digests: new Map() });
+            return sendJson(res, 201, { uploadId: id });
+          }
+
+          const session = uploadId ? sessions.get(uploadId) : undefined;
+          if (!session) {
+            return sendJson(res, 404, { success: false, message: "Unknown upload" });
+          }
+
+          // GET /{id}                   -> resume status
+          if (req.method === "GET" && !action) {
+            return sendJson(res, 200, { received: [...session.chunks.keys()].sort((a, b) => a - b) });
+          }
+
+          // PUT /{id}/{index}           -> store chunk
+          if (req.method === "PUT" && action !== undefined) {
+            if (Math.random() < failRate) {
+              return sendJson(res, 503, { success: false, message: "Injected failure" });
+            }
+
+            const index = Number(action);
+            const bytes = await readBody(req);
+            const digest = createHash("sha256").update(bytes).digest("hex");
+            const expected = String(req.headers["x-chunk-checksum"] ?? "").replace("sha-256=", "");
+
+            if (expected !== digest) {
+              return sendJson(res, 422, { success: false, message: "Checksum mismatch" });
+            }
+
+            session.chunks.set(index, bytes);
+            session.digests.set(index, digest);
+            return sendJson(res, 200, { received: index });
+          }
+
+          // POST /{id}/complete         -> verify and assemble
+          if (req.method === "POST" && action === "complete") {
+            const { checksum } = JSON.parse((await readBody(req)).toString("utf8"));
+
+            if (session.chunks.size !== session.totalChunks) {
+              return sendJson(res, 409, { success: false, message: "Missing chunks" });
+            }
+
+            const ordered = Array.from({ length: session.totalChunks }, (_, index) => session.digests.get(index));
+            const expected = createHash("sha256").update(ordered.join("")).digest("hex");
+
+            if (expected !== checksum) {
+              return sendJson(res, 422, { success: false, message: "File checksum mismatch" });
+            }
+
+            const size = [...session.chunks.values()].reduce((sum, chunk) => sum + chunk.length, 0);
+            sessions.delete(uploadId);
+            server.config.logger.info(`[mock-upload] ${session.fileName} received (${size} bytes)`);
+            return sendJson(res, 200, { success: true, size, checksum });
+          }
+
+          sendJson(res, 405, { success: false, message: "Method not allowed" });
+        } catch (error) {
+          sendJson(res, 400, { success: false, message: String(error) });
+        }
+      });
+    },
+  };
+}
+
+// Helper: Collect request body
+function readBody(req: IncomingMessage): Promise<Buffer> {
+  return new Promise((resolve, reject) => {
+    const chunks: Buffer[] = [];
+    req.on("data", (chunk: Buffer) => chunks.push(chunk));
+    req.on("end", () => resolve(Buffer.concat(chunks)));
+    req.on("error", reject);
+  });
+}
+
+function sendJson(res: ServerResponse, status: number, body: unknown): void {
+  res.statusCode = status;
+  res.setHeader("Content-Type", "application/json");
+  res.end(JSON.stringify(body));
+}
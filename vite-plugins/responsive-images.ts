@@ -0,0 +1,310 @@
+// Node Core
+import { createHash } from "crypto";
+import { existsSync, mkdirSync, readFileSync, readdirSync, writeFileSync } from "fs";
+import path from "path";
+
+// External Libraries
+import { normalizePath, type Plugin, type ResolvedConfig } from "vite";
+
+// Types
+export type ImageFormat = "avif" | "webp";
+
+export interface ResponsiveImagesOptions {
+  /** Folders inside public/ that are scanned for images. */
+  include?: string[];
+  /** Remote images fetched once at build time and served from our own origin. */
+  remote?: string[];
+  widths?: number[];
+  formats?: ImageFormat[];
+  quality?: Partial<Record<ImageFormat, number>>;
+  /** Width of the blurred inline placeholder. */
+  placeholderWidth?: number;
+  cacheDir?: string;
+  /**
+   * Where downloaded `remote` originals are kept, relative to the project root.
+   * Commit this folder: builds then never hit the network for known URLs.
+   */
+  remoteCacheDir?: string;
+}
+
+interface ImageVariant {
+  format: ImageFormat;
+  width: number;
+  fileName: string;
+}
+
+// Stored as meta.json next to the variants of one source image
+interface ProcessedImage {
+  width: number;
+  height: number;
+  placeholder?: string;
+  variants: ImageVariant[];
+}
+
+interface ManifestEntry {
+  width: number;
+  height: number;
+  placeholder?: string;
+  sources: { type: string; srcSet: string }[];
+}
+
+type SharpFactory = typeof import("sharp").default;
+
+// Constants
+const VIRTUAL_ID = "virtual:responsive-images";
+const RESOLVED_VIRTUAL_ID = `\0${VIRTUAL_ID}`;
+const OUTPUT_DIR = "_img";
+const RASTER_EXTENSIONS = new Set([".jpg", ".jpeg", ".png", ".webp", ".avif"]);
+const DEFAULT_WIDTHS = [320, 640, 960, 1280, 1920];
+const DEFAULT_QUALITY: Record<ImageFormat, number> = { avif: 50, webp: 72 };
+const MIME_TYPES: Record<ImageFormat, string> = { avif: "image/avif", webp: "image/webp" };
+const DEFAULT_REMOTE_CACHE_DIR = "image-sources/remote";
+const REMOTE_FETCH_TIMEOUT_MS = 15_000; // An unreachable host must not block dev start or the build
+
+// Plugin: Build-time responsive images
+// Every raster image under public/<include> (and every `remote` URL) is
+// resized into AVIF/WebP variants plus a tiny blurred placeholder.
+// `virtual:responsive-images` maps the original URL to srcsets and the
+// intrinsic size, consumed by <OptimizedImage>. Outputs are cached by content
+// hash in node_modules/.cache, so unchanged images are never re-encoded.
+// Remote originals are downloaded once into `remoteCacheDir` (committed);
+// RESPONSIVE_IMAGES_OFFLINE=1 skips downloads of URLs that are not there yet.
+export function responsiveImages(options: ResponsiveImagesOptions = {}): Plugin {
+  const {
+    include = ["assets"],
+    remote = [],
+    widths = DEFAULT_WIDTHS,
+    formats = ["avif", "webp"],
+    placeholderWidth = 16,
+  } = options;
+  const quality = { ...DEFAULT_QUALITY, ...options.quality };
+
+  let config: ResolvedConfig;
+  let cacheDir: string;
+  let remoteCacheDir: string;
+  let manifest: Record<string, ManifestEntry> = {};
+  const variantFiles = new Map<string, string>(); // output file name -> cached file
+
+  // Settings are part of the cache key - changing widths/quality re-encodes
+  const settingsKey = JSON.stringify({ widths, formats, quality, placeholderWidth });
+
+  const loadSharp = async (): Promise<SharpFactory | null> => {
+    try {
+      return (await import("sharp")).default;
+    } catch {
+      config.logger.warn("[responsive-images] sharp is not installed - images are served unoptimized.");
+      return null;
+    }
+  };
+
+  const processImage = async (sharp: SharpFactory, source: Buffer, name: string) => {
+    const hash = createHash("sha256").update(source).update(settingsKey).digest("hex").slice(0, 16);
+    const imageDir = path.join(cacheDir, hash);
+    const metaFile = path.join(imageDir, "meta.json");
+
+    if (existsSync(metaFile)) {
+      return { image: JSON.parse(readFileSync(metaFile, "utf-8")) as ProcessedImage, imageDir, cached: true };
+    }
+
+    const metadata = await sharp(source).metadata();
+    const width = metadata.width ?? 0;
+    const height = metadata.height ?? 0;
+    const targetWidths = [...new Set([...widths.filter((w) => w < width), Math.min(width, Math.max(...widths))])];
+
+    mkdirSync(imageDir, { recursive: true });
+    const slug = toSlug(name);
+    const variants: ImageVariant[] = [];
+
+    for (const targetWidth of targetWidths) {
+      await Promise.all(
+        formats.map(async (format) => {
+          const fileName = `${slug}-${hash.slice(0, 8)}-${targetWidth}.${format}`;
+          const output = await sharp(source)
+            .rotate() // respect EXIF orientation
+            .resize({ width: targetWidth })
+            .toFormat(format, { quality: quality[format] })
+            .toBuffer();
+          writeFileSync(path.join(imageDir, fileName), output);
+          variants.push({ format, width: targetWidth, fileName });
+        })
+      );
+    }
+
+    const placeholderBuffer = await sharp(source)
+      .rotate()
+      .resize({ width: placeholderWidth })
+      .blur()
+      .webp({ quality: 40 })
+      .toBuffer();
+
+    const image: ProcessedImage = {
+      width,
+      height,
+      placeholder: `data:image/webp;base64,${placeholderBuffer.toString("base64")}`,
+      variants,
+    };
+    writeFileSync(metaFile, JSON.stringify(image));
+
+    return { image, imageDir, cached: false };
+  };
+
+  const buildManifest = async () => {
+    const started = Date.now();
+    const sharp = await loadSharp();
+    const nextManifest: Record<string, ManifestEntry> = {};
+    let processedCount = 0;
+    let cachedCount = 0;
+
+    const addRaster = async (url: string, source: Buffer) => {
+      if (!sharp) return;
+      const { image, imageDir, cached } = await processImage(sharp, source, path.basename(new URL(url, "http://local").pathname));
+      image.variants.forEach((variant) => variantFiles.set(variant.fileName, path.join(imageDir, variant.fileName)));
+      nextManifest[url] = toManifestEntry(image, config.base, formats);
+      if (cached) cachedCount++;
+      else processedCount++;
+    };
+
+    for (const folder of include) {
+      const folderPath = path.join(config.publicDir, folder);
+      if (!existsSync(folderPath)) {
+        config.logger.warn(`[responsive-images] ${normalizePath(path.relative(config.root, folderPath))} does not exist - nothing to scan.`);
+        continue;
+      }
+
+      for (const file of scanFiles(folderPath)) {
+        const url = `/${normalizePath(path.relative(config.publicDir, file))}`;
+        const extension = path.extname(file).toLowerCase();
+
+        try {
+          if (extension === ".svg") {
+            // Vector: no variants, but the intrinsic size still prevents layout shift
+            const size = readSvgSize(readFileSync(file, "utf-8"));
+            if (size) nextManifest[url] = { ...size, sources: [] };
+          } else if (RASTER_EXTENSIONS.has(extension)) {
+            await addRaster(url, readFileSync(file));
+          }
+        } catch (error) {
+          config.logger.warn(`[responsive-images] ${url}: ${(error as Error).message}`);
+        }
+      }
+    }
+
+    for (const url of remote) {
+      try {
+        const source = await fetchRemote(url, remoteCacheDir, process.env.RESPONSIVE_IMAGES_OFFLINE === "1");
+        if (source) await addRaster(url, source);
+        else config.logger.warn(`[responsive-images] ${url}: not in ${options.remoteCacheDir ?? DEFAULT_REMOTE_CACHE_DIR}, skipped (offline).`);
+      } catch (error) {
+        config.logger.warn(`[responsive-images] ${url}: ${(error as Error).message}`);
+      }
+    }
+
+    manifest = nextManifest;
+    config.logger.info(
+      `[responsive-images] ${Object.keys(manifest).length} images (${processedCount} encoded, ${cachedCount} from cache) in ${Date.now() - started} ms`
+    );
+  };
+
+  return {
+    name: "responsive-images",
+
+    configResolved(resolvedConfig) {
+      config = resolvedConfig;
+      cacheDir = path.resolve(config.root, options.cacheDir ?? "node_modules/.cache/responsive-images");
+      remoteCacheDir = path.resolve(config.root, options.remoteCacheDir ?? DEFAULT_REMOTE_CACHE_DIR);
+    },
+
+    async buildStart() {
+      await buildManifest();
+    },
+
+    resolveId(id) {
+      return id === VIRTUAL_ID ? RESOLVED_VIRTUAL_ID : null;
+    },
+
+    load(id) {
+      if (id !== RESOLVED_VIRTUAL_ID) return null;
+      return `export const imageManifest = ${JSON.stringify(manifest)};`;
+    },
+
+    configureServer(server) {
+      // Dev: serve variants straight from the cache
+      server.middlewares.use(`${config.base}${OUTPUT_DIR}/`, (req, res, next) => {
+        const cachedFile = variantFiles.get(decodeURIComponent((req.url ?? "").replace(/^\//, "").split("?")[0]));
+        if (!cachedFile) return next();
+
+        res.setHeader("Content-Type", MIME_TYPES[path.extname(cachedFile).slice(1) as ImageFormat]);
+        res.setHeader("Cache-Control", "public, max-age=31536000, immutable");
+        res.end(readFileSync(cachedFile));
+      });
+    },
+
+    generateBundle() {
+      variantFiles.forEach((cachedFile, fileName) => {
+        this.emitFile({ type: "asset", fileName: `${OUTPUT_DIR}/${fileName}`, source: readFileSync(cachedFile) });
+      });
+    },
+  };
+}
+
+// Helper: Manifest entry with one srcset per format (best format first)
+function toManifestEntry(image: ProcessedImage, base: string, formats: ImageFormat[]): ManifestEntry {
+  return {
+    width: image.width,
+    height: image.height,
+    placeholder: image.placeholder,
+    sources: formats.map((format) => ({
+      type: MIME_TYPES[format],
+      srcSet: image.variants
+        .filter((variant) => variant.format === format)
+        .sort((a, b) => a.width - b.width)
+        .map((variant) => `${base}${OUTPUT_DIR}/${variant.fileName} ${variant.width}w`)
+        .join(", "),
+    })),
+  };
+}
+
+// Helper: Download once, then reuse the stored original (null when offline and not stored)
+async function fetchRemote(url: string, remoteDir: string, offline: boolean): Promise<Buffer | null> {
+  const extension = path.extname(new URL(url).pathname).toLowerCase();
+  const cachedFile = path.join(remoteDir, `${createHash("sha256").update(url).digest("hex").slice(0, 16)}${extension}`);
+  if (existsSync(cachedFile)) return readFileSync(cachedFile);
+  if (offline) return null;
+
+  const response = await fetch(url, { signal: AbortSignal.timeout(REMOTE_FETCH_TIMEOUT_MS) });
+  if (!response.ok) throw new Error(`HTTP ${response.status}`);
+
+  const source = Buffer.from(await response.arrayBuffer());
+  mkdirSync(remoteDir, { recursive: true });
+  writeFileSync(cachedFile, source);
+  return source;
+}
+
+function readSvgSize(svg: string): { width: number; height: number } | null {
+  const root = svg.match(/<svg[^>]*>/)?.[0] ?? "";
+  const width = parseFloat(root.match(/\swidth="([\d.]+)/)?.[1] ?? "");
+  const height = parseFloat(root.match(/\sheight="([\d.]+)/)?.[1] ?? "");
+  if (width > 0 && height > 0) return { width, height };
+
+  const viewBox = root.match(/viewBox="[\d.-]+[\s,]+[\d.-]+[\s,]+([\d.]+)[\s,]+([\d.]+)"/);
+  return viewBox ? { width: parseFloat(viewBox[1]), height: parseFloat(viewBox[2]) } : null;
+}
+
+function scanFiles(directory: string): string[] {
+  if (!existsSync(directory)) return [];
+
+  return readdirSync(directory, { withFileTypes: true }).flatMap((entry) => {
+    const fullPath = path.join(directory, entry.name);
+    return entry.isDirectory() ? scanFiles(fullPath) : [fullPath];
+  });
+}
+
+function toSlug(fileName: string): string {
+  return (
+    fileName
+      .replace(/\.[^.]+$/, "")
+      .toLowerCase()
+      .replace(/[^a-z0-9]+/g, "-")
+      .replace(/^-|-$/g, "") || "image"
+  );
+}
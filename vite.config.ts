@@ -1,10 +1,37 @@
 import { defineConfig } from "vite";
 import react from "@vitejs/plugin-react";
 import path from "path";
+import { mockUploadEndpoint } from "./vite-plugins/mock-upload-endpoint";
+import { mockContentApi } from "./vite-plugins/mock-content-api";
+import { i18nNamespaces } from "./vite-plugins/i18n-namespaces";
+import { responsiveImages } from "./vite-plugins/responsive-images";
 
 // https://vitejs.dev/config/
 export default defineConfig({
-  plugins: [react()],
+  plugins: [
+    react(),
+    mockUploadEndpoint(),
+    mockContentApi(),
+    i18nNamespaces({
+      eager: ["common", "theme-toggle"],
+      routes: {
+        "/": ["main"],
+        "/about": ["about"],
+        "/career": ["career", "application-form", "job-filter"],
+        "/sales": ["sales", "contact-form"],
+      },
+    }),
+    responsiveImages({
+      include: ["assets"],
+      // Hero images on the home page - originals are stored in image-sources/remote (commit new ones)
+      remote: [
+        "https://images.pexels.com/photos/3184465/pexels-photo-3184465.jpeg",
+        "https://images.pexels.com/photos/3184292/pexels-photo-3184292.jpeg",
+        "https://images.pexels.com/photos/3184639/pexels-photo-3184639.jpeg",
+        "https://images.pexels.com/photos/3184291/pexels-photo-3184291.jpeg?auto=compress&cs=tinysrgb&w=1200",
+      ],
+    }),
+  ],
   resolve: {
     alias: {
       "@": path.resolve(__dirname, "./src"),